@@ -0,0 +1,52 @@
+"""add profile_skills inverted index and profile search indexes
+
+Revision ID: 20261019_0005
+Revises: b971e82c44ec
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0005"
+down_revision = "b971e82c44ec"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "profile_skills",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("skill", sa.String(length=100), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "skill"),
+        sa.ForeignKeyConstraint(["user_id"], ["profiles.user_id"], name="fk_profile_skills_profile"),
+    )
+    op.create_index("ix_profile_skills_skill_user", "profile_skills", ["skill", "user_id"])
+
+    op.create_index("ix_profiles_college", "profiles", ["college"])
+    op.create_index("ix_profiles_course", "profiles", ["course"])
+    op.create_index("ix_profiles_year", "profiles", ["year"])
+
+    # Backfill from the JSON {"skills": [...]} stored on each profile
+    op.execute(
+        """
+        INSERT INTO profile_skills (user_id, skill)
+        SELECT DISTINCT p.user_id, LEFT(LOWER(TRIM(s.skill)), 100)
+        FROM profiles p
+        CROSS JOIN LATERAL jsonb_array_elements_text(p.skills -> 'skills') AS s(skill)
+        WHERE jsonb_typeof(p.skills -> 'skills') = 'array'
+          AND TRIM(s.skill) <> ''
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_profiles_year", table_name="profiles")
+    op.drop_index("ix_profiles_course", table_name="profiles")
+    op.drop_index("ix_profiles_college", table_name="profiles")
+    op.drop_index("ix_profile_skills_skill_user", table_name="profile_skills")
+    op.drop_table("profile_skills")
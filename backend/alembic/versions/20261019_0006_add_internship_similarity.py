@@ -0,0 +1,58 @@
+"""add MinHash signature, LSH bucket and neighbour tables for similar internships
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19 00:10:00.000000
+
+Existing postings are indexed with ``python jobs.py rebuild-similarity``.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0006"
+down_revision = "20261019_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "internship_signatures",
+        sa.Column("internship_id", postgresql.UUID(as_uuid=True), nullable=False, primary_key=True),
+        sa.Column("signature", postgresql.JSONB(), nullable=False),
+        sa.ForeignKeyConstraint(["internship_id"], ["internships.id"], name="fk_internship_signatures_internship"),
+    )
+
+    op.create_table(
+        "internship_lsh_buckets",
+        sa.Column("band", sa.Integer(), nullable=False),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.Column("internship_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.PrimaryKeyConstraint("band", "bucket", "internship_id"),
+        sa.ForeignKeyConstraint(["internship_id"], ["internships.id"], name="fk_internship_lsh_buckets_internship"),
+    )
+    op.create_index("ix_internship_lsh_buckets_internship_id", "internship_lsh_buckets", ["internship_id"])
+
+    op.create_table(
+        "internship_neighbours",
+        sa.Column("internship_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("neighbour_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("similarity", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("internship_id", "neighbour_id"),
+        sa.ForeignKeyConstraint(["internship_id"], ["internships.id"], name="fk_internship_neighbours_internship"),
+        sa.ForeignKeyConstraint(["neighbour_id"], ["internships.id"], name="fk_internship_neighbours_neighbour"),
+    )
+    op.create_index("ix_internship_neighbours_rank", "internship_neighbours", ["internship_id", "similarity"])
+    op.create_index("ix_internship_neighbours_neighbour_id", "internship_neighbours", ["neighbour_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_internship_neighbours_neighbour_id", table_name="internship_neighbours")
+    op.drop_index("ix_internship_neighbours_rank", table_name="internship_neighbours")
+    op.drop_table("internship_neighbours")
+    op.drop_index("ix_internship_lsh_buckets_internship_id", table_name="internship_lsh_buckets")
+    op.drop_table("internship_lsh_buckets")
+    op.drop_table("internship_signatures")
@@ -0,0 +1,47 @@
+"""add application_progress counters
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19 00:20:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0007"
+down_revision = "20261019_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "application_progress",
+        sa.Column("application_id", postgresql.UUID(as_uuid=True), nullable=False, primary_key=True),
+        sa.Column("total_hours", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("approved_hours", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("entry_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("pending_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.ForeignKeyConstraint(["application_id"], ["applications.id"], name="fk_application_progress_application"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO application_progress (application_id, total_hours, approved_hours, entry_count, pending_count)
+        SELECT a.id,
+               COALESCE(SUM(l.hours), 0),
+               COALESCE(SUM(CASE WHEN l.approved THEN l.hours ELSE 0 END), 0),
+               COUNT(l.id),
+               COALESCE(SUM(CASE WHEN l.id IS NOT NULL AND NOT l.approved THEN 1 ELSE 0 END), 0)
+        FROM applications a
+        LEFT JOIN logbook_entries l ON l.application_id = a.id
+        GROUP BY a.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("application_progress")
@@ -0,0 +1,60 @@
+"""add analytics funnel snapshots and change tracking columns
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 00:30:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0008"
+down_revision = "20261019_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "applications",
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+    )
+    op.create_index("ix_applications_updated_at", "applications", ["updated_at"])
+    op.create_index("ix_application_progress_updated_at", "application_progress", ["updated_at"])
+
+    op.create_table(
+        "analytics_funnel_snapshots",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("applied_on", sa.Date(), nullable=False),
+        sa.Column("college_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("department", sa.String(length=255), nullable=False, server_default=""),
+        sa.Column("internship_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("applied", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("industry_approved", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("faculty_approved", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("enrolled", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["college_id"], ["colleges.id"], name="fk_funnel_snapshots_college"),
+        sa.ForeignKeyConstraint(["internship_id"], ["internships.id"], name="fk_funnel_snapshots_internship"),
+    )
+    op.create_index("ix_funnel_snapshots_college_day", "analytics_funnel_snapshots", ["college_id", "applied_on"])
+    op.create_index("ix_funnel_snapshots_internship", "analytics_funnel_snapshots", ["internship_id"])
+
+    op.create_table(
+        "job_state",
+        sa.Column("name", sa.String(length=100), primary_key=True),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("job_state")
+    op.drop_index("ix_funnel_snapshots_internship", table_name="analytics_funnel_snapshots")
+    op.drop_index("ix_funnel_snapshots_college_day", table_name="analytics_funnel_snapshots")
+    op.drop_table("analytics_funnel_snapshots")
+    op.drop_index("ix_application_progress_updated_at", table_name="application_progress")
+    op.drop_index("ix_applications_updated_at", table_name="applications")
+    op.drop_column("applications", "updated_at")
@@ -0,0 +1,24 @@
+"""index internships.posted_by and applications.internship_id
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19 00:40:00.000000
+"""
+
+from alembic import op
+
+
+revision = "20261019_0009"
+down_revision = "20261019_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_internships_posted_by", "internships", ["posted_by"])
+    op.create_index("ix_applications_internship_id", "applications", ["internship_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_applications_internship_id", table_name="applications")
+    op.drop_index("ix_internships_posted_by", table_name="internships")
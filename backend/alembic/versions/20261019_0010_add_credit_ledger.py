@@ -0,0 +1,123 @@
+"""add credit ledger and per-term credit totals
+
+Revision ID: 20261019_0010
+Revises: 20261019_0009
+Create Date: 2026-10-19 00:50:00.000000
+
+Existing credits are backfilled: each gets its term, every (student, term)
+its total and every student an opening ledger row per term.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0010"
+down_revision = "20261019_0009"
+branch_labels = None
+depends_on = None
+
+
+def _academic_term(day: date) -> str:
+    # Same rule as app.services.terms.academic_term, frozen here for the migration
+    if day.month >= 7:
+        return f"{day.year}-{(day.year + 1) % 100:02d}-S1"
+    return f"{day.year - 1}-{day.year % 100:02d}-S2"
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    credits = sa.table(
+        "credits",
+        sa.column("id"),
+        sa.column("student_id"),
+        sa.column("credits_awarded"),
+        sa.column("faculty_signed_at"),
+        sa.column("term"),
+    )
+    totals = defaultdict(int)
+    now = datetime.utcnow()
+    rows = bind.execute(
+        sa.select(credits.c.id, credits.c.student_id, credits.c.credits_awarded, credits.c.faculty_signed_at)
+    ).all()
+    for credit_id, student_id, amount, signed_at in rows:
+        term = _academic_term((signed_at or now).date())
+        bind.execute(credits.update().where(credits.c.id == credit_id).values(term=term))
+        totals[(student_id, term)] += amount
+
+    term_rows, ledger_rows, balances = [], [], defaultdict(int)
+    for (student_id, term), amount in sorted(totals.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+        balances[student_id] += amount
+        term_rows.append({"student_id": student_id, "term": term, "credits": amount, "updated_at": now})
+        ledger_rows.append(
+            {"student_id": student_id, "term": term, "delta": amount, "balance": balances[student_id], "created_at": now}
+        )
+    if term_rows:
+        op.bulk_insert(
+            sa.table(
+                "student_credit_terms",
+                sa.column("student_id"),
+                sa.column("term"),
+                sa.column("credits"),
+                sa.column("updated_at"),
+            ),
+            term_rows,
+        )
+        op.bulk_insert(
+            sa.table(
+                "credit_ledger",
+                sa.column("student_id"),
+                sa.column("term"),
+                sa.column("delta"),
+                sa.column("balance"),
+                sa.column("created_at"),
+            ),
+            ledger_rows,
+        )
+
+
+def upgrade() -> None:
+    op.add_column("credits", sa.Column("term", sa.String(length=20), nullable=True))
+    op.create_index("ix_credits_term", "credits", ["term"])
+    op.create_index("ix_users_college_id", "users", ["college_id"])
+
+    op.create_table(
+        "credit_ledger",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("student_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("credit_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("term", sa.String(length=20), nullable=False),
+        sa.Column("delta", sa.Integer(), nullable=False),
+        sa.Column("balance", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.ForeignKeyConstraint(["student_id"], ["users.id"], name="fk_credit_ledger_student"),
+        sa.ForeignKeyConstraint(["credit_id"], ["credits.id"], name="fk_credit_ledger_credit"),
+    )
+    op.create_index("ix_credit_ledger_student", "credit_ledger", ["student_id", "id"])
+
+    op.create_table(
+        "student_credit_terms",
+        sa.Column("student_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("term", sa.String(length=20), nullable=False),
+        sa.Column("credits", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.PrimaryKeyConstraint("student_id", "term"),
+        sa.ForeignKeyConstraint(["student_id"], ["users.id"], name="fk_student_credit_terms_student"),
+    )
+    op.create_index("ix_student_credit_terms_term", "student_credit_terms", ["term"])
+
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_index("ix_student_credit_terms_term", table_name="student_credit_terms")
+    op.drop_table("student_credit_terms")
+    op.drop_index("ix_credit_ledger_student", table_name="credit_ledger")
+    op.drop_table("credit_ledger")
+    op.drop_index("ix_users_college_id", table_name="users")
+    op.drop_index("ix_credits_term", table_name="credits")
+    op.drop_column("credits", "term")
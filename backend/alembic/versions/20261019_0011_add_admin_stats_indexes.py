@@ -0,0 +1,24 @@
+"""index users by role/active and internships by status for admin stats
+
+Revision ID: 20261019_0011
+Revises: 20261019_0010
+Create Date: 2026-10-19 01:00:00.000000
+"""
+
+from alembic import op
+
+
+revision = "20261019_0011"
+down_revision = "20261019_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_role_active", "users", ["role", "is_active"])
+    op.create_index("ix_internships_status", "internships", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_internships_status", table_name="internships")
+    op.drop_index("ix_users_role_active", table_name="users")
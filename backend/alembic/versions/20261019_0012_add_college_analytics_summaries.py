@@ -0,0 +1,41 @@
+"""add analytics_college_summaries written by the batch analytics job
+
+Revision ID: 20261019_0012
+Revises: 20261019_0011
+Create Date: 2026-10-19 01:10:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0012"
+down_revision = "20261019_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analytics_college_summaries",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("college_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("enrolled_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("enrolled", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("in_progress", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completion_rate", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("mean_hours", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("p50_hours", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("p90_hours", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("hour_histogram", postgresql.JSONB(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["college_id"], ["colleges.id"], name="fk_college_summaries_college"),
+    )
+    op.create_index("ix_analytics_college_summaries_college_id", "analytics_college_summaries", ["college_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_analytics_college_summaries_college_id", table_name="analytics_college_summaries")
+    op.drop_table("analytics_college_summaries")
@@ -0,0 +1,61 @@
+"""add student_activity timeline table
+
+Revision ID: 20261019_0013
+Revises: 20261019_0012
+Create Date: 2026-10-19 01:20:00.000000
+
+Backfills applications, signed credits and generated reports. Past approvals and
+logbook reviews have no timestamp of their own, so they only appear from now on.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0013"
+down_revision = "20261019_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "student_activity",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("student_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.Column("application_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("subject_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("detail", sa.String(length=255), nullable=True),
+        sa.ForeignKeyConstraint(["student_id"], ["users.id"], name="fk_student_activity_student"),
+        sa.ForeignKeyConstraint(["application_id"], ["applications.id"], name="fk_student_activity_application"),
+    )
+    op.create_index("ix_student_activity_feed", "student_activity", ["student_id", "occurred_at", "id"])
+
+    op.execute(
+        """
+        INSERT INTO student_activity (student_id, kind, occurred_at, application_id)
+        SELECT student_id, 'APPLIED', applied_at, id FROM applications
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO student_activity (student_id, kind, occurred_at, subject_id, detail)
+        SELECT student_id, 'CREDIT_AWARDED', faculty_signed_at, id, CAST(credits_awarded AS VARCHAR)
+        FROM credits WHERE faculty_signed_at IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO student_activity (student_id, kind, occurred_at, application_id, subject_id)
+        SELECT a.student_id, 'REPORT_GENERATED', r.generated_at, a.id, r.id
+        FROM reports r JOIN applications a ON a.id = r.application_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_student_activity_feed", table_name="student_activity")
+    op.drop_table("student_activity")
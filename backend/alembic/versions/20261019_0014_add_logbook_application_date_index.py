@@ -0,0 +1,24 @@
+"""index logbook_entries by (application_id, entry_date) for hour roll-ups
+
+Revision ID: 20261019_0014
+Revises: 20261019_0013
+Create Date: 2026-10-19 01:30:00.000000
+"""
+
+from alembic import op
+
+
+revision = "20261019_0014"
+down_revision = "20261019_0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_logbook_entries_application_date", "logbook_entries", ["application_id", "entry_date"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_logbook_entries_application_date", table_name="logbook_entries")
@@ -0,0 +1,28 @@
+"""partial index on unapproved logbook entries for the faculty review queue
+
+Revision ID: 20261019_0015
+Revises: 20261019_0014
+Create Date: 2026-10-19 01:40:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261019_0015"
+down_revision = "20261019_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_logbook_entries_pending",
+        "logbook_entries",
+        ["created_at", "id"],
+        postgresql_where=sa.text("NOT approved"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_logbook_entries_pending", table_name="logbook_entries")
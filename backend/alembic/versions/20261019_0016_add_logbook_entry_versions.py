@@ -0,0 +1,32 @@
+"""version and updated_at on logbook entries for offline sync
+
+Revision ID: 20261019_0016
+Revises: 20261019_0015
+Create Date: 2026-10-19 01:50:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261019_0016"
+down_revision = "20261019_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "logbook_entries",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.add_column(
+        "logbook_entries",
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+    )
+    op.execute("UPDATE logbook_entries SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    op.drop_column("logbook_entries", "updated_at")
+    op.drop_column("logbook_entries", "version")
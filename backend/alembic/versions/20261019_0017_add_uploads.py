@@ -0,0 +1,48 @@
+"""content-addressed blobs and resumable upload sessions
+
+Revision ID: 20261019_0017
+Revises: 20261019_0016
+Create Date: 2026-10-19 02:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0017"
+down_revision = "20261019_0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "blobs",
+        sa.Column("sha256", sa.String(length=64), primary_key=True),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("content_type", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_table(
+        "upload_sessions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("owner_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=False),
+        sa.Column("content_type", sa.String(length=255), nullable=True),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], name="fk_upload_sessions_owner"),
+        sa.ForeignKeyConstraint(["sha256"], ["blobs.sha256"], name="fk_upload_sessions_blob"),
+    )
+    op.create_index("ix_upload_sessions_owner_id", "upload_sessions", ["owner_id"])
+    op.create_index("ix_upload_sessions_created_at", "upload_sessions", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_upload_sessions_created_at", table_name="upload_sessions")
+    op.drop_index("ix_upload_sessions_owner_id", table_name="upload_sessions")
+    op.drop_table("upload_sessions")
+    op.drop_table("blobs")
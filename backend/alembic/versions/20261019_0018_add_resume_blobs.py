@@ -0,0 +1,29 @@
+"""reference resume blobs from profiles and applications
+
+Revision ID: 20261019_0018
+Revises: 20261019_0017
+Create Date: 2026-10-19 02:10:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261019_0018"
+down_revision = "20261019_0017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("profiles", sa.Column("resume_sha256", sa.String(length=64), nullable=True))
+    op.create_foreign_key("fk_profiles_resume_blob", "profiles", "blobs", ["resume_sha256"], ["sha256"])
+    op.add_column("applications", sa.Column("resume_sha256", sa.String(length=64), nullable=True))
+    op.create_foreign_key("fk_applications_resume_blob", "applications", "blobs", ["resume_sha256"], ["sha256"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("fk_applications_resume_blob", "applications", type_="foreignkey")
+    op.drop_column("applications", "resume_sha256")
+    op.drop_constraint("fk_profiles_resume_blob", "profiles", type_="foreignkey")
+    op.drop_column("profiles", "resume_sha256")
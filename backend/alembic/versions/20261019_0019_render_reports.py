@@ -0,0 +1,36 @@
+"""track server-side rendering of reports
+
+Revision ID: 20261019_0019
+Revises: 20261019_0018
+Create Date: 2026-10-19 02:30:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261019_0019"
+down_revision = "20261019_0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column("reports", "pdf_url", existing_type=sa.String(length=512), nullable=True)
+    op.add_column("reports", sa.Column("pdf_sha256", sa.String(length=64), nullable=True))
+    op.create_foreign_key("fk_reports_pdf_blob", "reports", "blobs", ["pdf_sha256"], ["sha256"])
+    op.add_column(
+        "reports", sa.Column("status", sa.String(length=20), nullable=False, server_default="READY")
+    )
+    op.add_column("reports", sa.Column("error", sa.Text(), nullable=True))
+    op.create_index("ix_reports_status", "reports", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reports_status", table_name="reports")
+    op.drop_column("reports", "error")
+    op.drop_column("reports", "status")
+    op.drop_constraint("fk_reports_pdf_blob", "reports", type_="foreignkey")
+    op.drop_column("reports", "pdf_sha256")
+    op.execute("DELETE FROM reports WHERE pdf_url IS NULL")
+    op.alter_column("reports", "pdf_url", existing_type=sa.String(length=512), nullable=False)
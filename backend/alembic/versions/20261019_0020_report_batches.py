@@ -0,0 +1,42 @@
+"""add report batches for cohort exports
+
+Revision ID: 20261019_0020
+Revises: 20261019_0019
+Create Date: 2026-10-19 02:50:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0020"
+down_revision = "20261019_0019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "report_batches",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("requested_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("college_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("colleges.id"), nullable=True),
+        sa.Column("internship_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("internships.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_table(
+        "report_batch_items",
+        sa.Column(
+            "batch_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("report_batches.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("report_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("reports.id"), primary_key=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("report_batch_items")
+    op.drop_table("report_batches")
@@ -0,0 +1,30 @@
+"""add the report revocation list
+
+Revision ID: 20261019_0021
+Revises: 20261019_0020
+Create Date: 2026-10-19 03:10:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0021"
+down_revision = "20261019_0020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_reports",
+        sa.Column("report_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("reports.id"), primary_key=True),
+        sa.Column("revoked_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("reason", sa.String(length=255), nullable=True),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("revoked_reports")
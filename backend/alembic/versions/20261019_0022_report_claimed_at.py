@@ -0,0 +1,23 @@
+"""record when a report was claimed for rendering
+
+Revision ID: 20261019_0022
+Revises: 20261019_0021
+Create Date: 2026-10-19 03:40:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261019_0022"
+down_revision = "20261019_0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("reports", sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("reports", "claimed_at")
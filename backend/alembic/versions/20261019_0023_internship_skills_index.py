@@ -0,0 +1,45 @@
+"""add the internship_skills index for catalogue filters and facets
+
+Revision ID: 20261019_0023
+Revises: 20261019_0022
+Create Date: 2026-10-19 03:50:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0023"
+down_revision = "20261019_0022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "internship_skills",
+        sa.Column("internship_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("skill", sa.String(length=100), nullable=False),
+        sa.PrimaryKeyConstraint("internship_id", "skill"),
+        sa.ForeignKeyConstraint(["internship_id"], ["internships.id"], name="fk_internship_skills_internship"),
+    )
+    op.create_index("ix_internship_skills_skill_internship", "internship_skills", ["skill", "internship_id"])
+
+    # Backfill from the JSON array stored on each posting
+    op.execute(
+        """
+        INSERT INTO internship_skills (internship_id, skill)
+        SELECT DISTINCT i.id, LEFT(LOWER(TRIM(s.skill)), 100)
+        FROM internships i
+        CROSS JOIN LATERAL jsonb_array_elements_text(i.skills) AS s(skill)
+        WHERE jsonb_typeof(i.skills) = 'array'
+          AND TRIM(s.skill) <> ''
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_internship_skills_skill_internship", table_name="internship_skills")
+    op.drop_table("internship_skills")
@@ -0,0 +1,25 @@
+"""add internships.funnel_changed_at for incremental funnel refreshes
+
+Revision ID: 20261019_0024
+Revises: 20261019_0023
+Create Date: 2026-10-19 04:10:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261019_0024"
+down_revision = "20261019_0023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("internships", sa.Column("funnel_changed_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index("ix_internships_funnel_changed_at", "internships", ["funnel_changed_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_internships_funnel_changed_at", table_name="internships")
+    op.drop_column("internships", "funnel_changed_at")
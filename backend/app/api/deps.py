@@ -2,12 +2,12 @@ from typing import AsyncGenerator
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import settings
 from app.core.security import decode_token
 from app.db import models
-from app.db.session import get_session
+from app.db.session import AsyncSessionLocal, get_session
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
@@ -18,6 +18,11 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_sessionmaker() -> async_sessionmaker:
+    """Session factory for work that outlives the request, such as background tasks."""
+    return AsyncSessionLocal
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_db)
 ) -> models.User:
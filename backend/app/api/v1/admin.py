@@ -1,14 +1,37 @@
+from datetime import date, datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import crud, models
 from app.api.deps import get_db, get_current_user
+from app.schemas.admin import AdminStats
 from app.schemas.user import UserRead, UserUpdate
+from app.services.stats import admin_stats_cache
 
 router = APIRouter(prefix="/admin")
 
 
+@router.get("/stats", response_model=AdminStats)
+async def get_platform_stats(
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> AdminStats:
+    """Counts by role and status for the admin panel (Admin only, cached for a few seconds)"""
+    if current_user.role != models.UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can view platform stats"
+        )
+
+    today = date.today()
+    stats = admin_stats_cache.get(today)
+    if stats is None:
+        stats = AdminStats(**await crud.get_admin_stats(session, today=today), generated_at=datetime.utcnow())
+        admin_stats_cache.set(today, stats)
+    return stats
+
+
 @router.get("/users", response_model=List[UserRead])
 async def list_all_users(
     role: Optional[str] = Query(default=None, description="Filter by user role"),
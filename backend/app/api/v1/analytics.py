@@ -0,0 +1,98 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db, role_required
+from app.db import crud, models
+from app.schemas.analytics import (
+    CollegeAnalyticsRead,
+    FunnelCounts,
+    FunnelPoint,
+    FunnelResponse,
+    MetricsResponse,
+    TrackingSummary,
+)
+from app.services.tracking import TrackingStatus, percentage
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+def _analytics_scope(current_user: models.User, college_id: Optional[str]) -> dict:
+    """Industry partners see their own postings; faculty their college; admins any college."""
+    if current_user.role == models.UserRole.INDUSTRY:
+        return {"posted_by": current_user.id}
+    if current_user.role == models.UserRole.FACULTY:
+        if not current_user.college_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Faculty account has no college")
+        return {"college_id": current_user.college_id}
+    return {"college_id": college_id}
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics(
+    college_id: Optional[str] = Query(default=None, description="Limit to students of this college (admin only)"),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(
+        role_required(models.UserRole.FACULTY, models.UserRole.ADMIN, models.UserRole.INDUSTRY)
+    ),
+) -> MetricsResponse:
+    scope = _analytics_scope(current_user, college_id)
+    metrics = await crud.get_platform_metrics(session, **scope)
+    counts = await crud.count_tracking_statuses(session, **scope)
+
+    total = sum(counts.values())
+    tracking = TrackingSummary(
+        total_enrolled=total,
+        enrolled=counts[TrackingStatus.ENROLLED],
+        in_progress=counts[TrackingStatus.IN_PROGRESS],
+        completed=counts[TrackingStatus.COMPLETED],
+        enrolled_percentage=percentage(counts[TrackingStatus.ENROLLED], total),
+        in_progress_percentage=percentage(counts[TrackingStatus.IN_PROGRESS], total),
+        completed_percentage=percentage(counts[TrackingStatus.COMPLETED], total),
+    )
+    return MetricsResponse(**metrics, tracking=tracking)
+
+
+@router.get("/funnel", response_model=FunnelResponse)
+async def get_funnel(
+    college_id: Optional[str] = Query(default=None, description="Limit to students of this college (admin only)"),
+    department: Optional[str] = Query(default=None, description="Exact student department"),
+    internship_id: Optional[str] = Query(default=None, description="Limit to one internship"),
+    start: Optional[date] = Query(default=None, description="First application day to include"),
+    end: Optional[date] = Query(default=None, description="Last application day to include"),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(
+        role_required(models.UserRole.FACULTY, models.UserRole.ADMIN, models.UserRole.INDUSTRY)
+    ),
+) -> FunnelResponse:
+    """Application funnel by day, read from the snapshots refreshed by ``jobs.py refresh-snapshots``."""
+    series = await crud.get_funnel_series(
+        session,
+        department=department,
+        internship_id=internship_id,
+        start=start,
+        end=end,
+        **_analytics_scope(current_user, college_id),
+    )
+    points = [FunnelPoint(**row) for row in series]
+    totals = FunnelCounts(
+        **{field: sum(getattr(point, field) for point in points) for field in FunnelCounts.model_fields}
+    )
+    return FunnelResponse(totals=totals, series=points)
+
+
+@router.get("/colleges", response_model=List[CollegeAnalyticsRead])
+async def list_college_analytics(
+    college_id: Optional[str] = Query(default=None, description="Only this college (admin only)"),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> List[CollegeAnalyticsRead]:
+    """Per-college tracking and hours summaries written by ``jobs.py batch-analytics``."""
+    if current_user.role == models.UserRole.FACULTY:
+        college_id = current_user.college_id
+        if not college_id:
+            return []
+    summaries = await crud.list_college_analytics(session, college_id=college_id)
+    return [CollegeAnalyticsRead.model_validate(summary) for summary in summaries]
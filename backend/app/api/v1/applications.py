@@ -1,11 +1,22 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, role_required
 from app.db import crud, models
-from app.schemas.application import ApplicationCreate, ApplicationRead, ApplicationUpdate
+from app.schemas.application import (
+    ApplicationCreate,
+    ApplicationProgressRead,
+    ApplicationRead,
+    ApplicationUpdate,
+    HoursRollup,
+    RollupPeriod,
+)
+from app.services.storage import download_response
+from app.services.tracking import classify, required_hours
+from app.services.uploads import blob_key, file_extension
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -72,6 +83,113 @@ async def get_application(
     return ApplicationRead.model_validate(application)
 
 
+@router.get("/{application_id}/progress", response_model=ApplicationProgressRead)
+async def get_application_progress(
+    application_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> ApplicationProgressRead:
+    application = await crud.get_application(session, application_id)
+    if application is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
+
+    if current_user.role == models.UserRole.STUDENT and application.student_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+
+    if current_user.role == models.UserRole.INDUSTRY and application.internship.posted_by != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+
+    progress = await crud.get_application_progress(session, application_id)
+    counters = {
+        "total_hours": progress.total_hours if progress else 0.0,
+        "approved_hours": progress.approved_hours if progress else 0.0,
+        "entry_count": progress.entry_count if progress else 0,
+        "pending_count": progress.pending_count if progress else 0,
+    }
+
+    tracking_status = None
+    if application.industry_status == "APPROVED" and application.faculty_status == "APPROVED":
+        tracking_status = classify(
+            entry_count=counters["entry_count"],
+            pending_count=counters["pending_count"],
+            total_hours=counters["total_hours"],
+            start_date=application.internship.start_date,
+            duration_weeks=application.internship.duration_weeks,
+        ).value
+
+    return ApplicationProgressRead(
+        application_id=application_id,
+        required_hours=required_hours(application.internship.duration_weeks),
+        tracking_status=tracking_status,
+        **counters,
+    )
+
+
+@router.get("/{application_id}/resume")
+async def download_application_resume(
+    application_id: str,
+    request: Request,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> Response:
+    """The resume as it was when the student applied; immutable, so clients may cache it."""
+    application = await crud.get_application(session, application_id)
+    if application is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
+
+    if current_user.role == models.UserRole.STUDENT and application.student_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+
+    if current_user.role == models.UserRole.INDUSTRY and application.internship.posted_by != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+
+    blob = await crud.get_blob(session, application.resume_sha256) if application.resume_sha256 else None
+    if blob is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No stored resume for this application")
+    return download_response(
+        request,
+        blob_key(blob.sha256),
+        etag=blob.sha256,
+        media_type=blob.content_type,
+        filename=f"resume-{application.student.name}".replace(" ", "-") + file_extension(blob.content_type),
+    )
+
+
+@router.get("/{application_id}/hours", response_model=HoursRollup)
+async def get_hours_rollup(
+    application_id: str,
+    period: RollupPeriod = Query(default=RollupPeriod.WEEK, description="Group by ISO week or by month"),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> HoursRollup:
+    application = await crud.get_application(session, application_id)
+    if application is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
+
+    if current_user.role == models.UserRole.STUDENT and application.student_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+
+    if current_user.role == models.UserRole.INDUSTRY and application.internship.posted_by != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+
+    rows = await crud.get_hours_rollup(session, application_id, monthly=period == RollupPeriod.MONTH)
+    starts = [start for start, _, _, _ in rows]
+    if period == RollupPeriod.MONTH:
+        labels = [start.strftime("%Y-%m") for start in starts]
+    else:
+        labels = ["%d-W%02d" % start.isocalendar()[:2] for start in starts]
+    return HoursRollup(
+        application_id=application_id,
+        period=period,
+        period_start=starts,
+        label=labels,
+        hours=[hours for _, hours, _, _ in rows],
+        approved_hours=[approved for _, _, approved, _ in rows],
+        pending_hours=[hours - approved for _, hours, approved, _ in rows],
+        entries=[count for _, _, _, count in rows],
+    )
+
+
 @router.patch("/{application_id}", response_model=ApplicationRead)
 async def update_application(
     application_id: str,
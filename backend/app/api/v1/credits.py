@@ -1,11 +1,24 @@
-from typing import List, Optional
+import csv
+import io
+from typing import AsyncIterator, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.api.deps import get_current_user, get_db, role_required
+from app.api.deps import get_current_user, get_db, get_sessionmaker, role_required
 from app.db import crud, models
-from app.schemas.credit import CreditCreate, CreditRead, CreditUpdate
+from app.schemas.credit import (
+    CollegeCreditSummary,
+    CollegeTermCredits,
+    CreditCreate,
+    CreditRead,
+    CreditTranscript,
+    CreditUpdate,
+    TermCredits,
+)
+
+EXPORT_BATCH_ROWS = 500
 
 router = APIRouter(prefix="/credits", tags=["credits"])
 
@@ -65,6 +78,87 @@ async def list_credits(
     return [CreditRead.model_validate(credit) for credit in credits]
 
 
+@router.get("/transcript", response_model=CreditTranscript)
+async def get_transcript(
+    student_id: Optional[str] = Query(default=None, description="Student to report on (faculty/admin only)"),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> CreditTranscript:
+    if current_user.role == models.UserRole.STUDENT:
+        student_id = current_user.id
+    elif current_user.role not in (models.UserRole.FACULTY, models.UserRole.ADMIN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+    elif student_id is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="student_id is required")
+
+    terms = await crud.get_credit_transcript(session, student_id)
+    return CreditTranscript(
+        student_id=str(student_id),
+        total_credits=sum(credits for _, credits in terms),
+        terms=[TermCredits(term=term, credits=credits) for term, credits in terms],
+    )
+
+
+def _transcript_college(current_user: models.User, college_id: Optional[str]) -> Optional[str]:
+    """Faculty are limited to their own college; admins may pick any (or none for the platform)."""
+    if current_user.role == models.UserRole.FACULTY:
+        if not current_user.college_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Faculty account has no college")
+        return current_user.college_id
+    return college_id
+
+
+@router.get("/transcripts/college", response_model=CollegeCreditSummary)
+async def get_college_credit_summary(
+    college_id: Optional[str] = Query(default=None, description="College to summarize (admin only)"),
+    term: Optional[str] = Query(default=None, description="Only this academic term, e.g. 2026-27-S1"),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> CollegeCreditSummary:
+    college_id = _transcript_college(current_user, college_id)
+    rows = await crud.summarize_college_credits(session, college_id=college_id, term=term)
+    return CollegeCreditSummary(
+        college_id=str(college_id) if college_id else None,
+        total_credits=sum(row["credits"] for row in rows),
+        terms=[CollegeTermCredits(**row) for row in rows],
+    )
+
+
+async def _transcript_csv(
+    sessionmaker: async_sessionmaker, college_id: Optional[str], term: Optional[str]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["student_id", "name", "email", "term", "credits"])
+    # The request's session is gone once the response starts, so the cursor gets its own
+    async with sessionmaker() as session:
+        async for rows in crud.stream_college_transcript_rows(
+            session, college_id=college_id, term=term, batch_size=EXPORT_BATCH_ROWS
+        ):
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    yield buffer.getvalue()
+
+
+@router.get("/transcripts/export")
+async def export_college_transcripts(
+    college_id: Optional[str] = Query(default=None, description="College to export (admin only)"),
+    term: Optional[str] = Query(default=None, description="Only this academic term"),
+    sessionmaker: async_sessionmaker = Depends(get_sessionmaker),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> StreamingResponse:
+    """CSV of per-student, per-term credit totals for a whole college."""
+    college_id = _transcript_college(current_user, college_id)
+    filename = f"transcripts-{college_id or 'all'}{'-' + term if term else ''}.csv"
+    return StreamingResponse(
+        _transcript_csv(sessionmaker, college_id, term),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/{credit_id}", response_model=CreditRead)
 async def get_credit(
     credit_id: str,
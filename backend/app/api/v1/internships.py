@@ -1,16 +1,28 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, role_required
 from app.db import crud, models
-from app.schemas.internship import InternshipCreate, InternshipRead, InternshipUpdate
+from app.schemas.application import ApplicantSort, ApplicationRead, RankedApplicantRead
+from app.schemas.internship import (
+    InternshipCreate,
+    InternshipFacets,
+    InternshipListWithFacets,
+    InternshipRead,
+    InternshipSummaryRead,
+    InternshipUpdate,
+    ReviewStatusCounts,
+    SimilarInternshipRead,
+)
+from app.schemas.search import FacetCount
+from app.services.catalog import internship_facet_cache
 
 router = APIRouter(prefix="/internships", tags=["internships"])
 
 
-@router.get("", response_model=List[InternshipRead])
+@router.get("", response_model=Union[List[InternshipRead], InternshipListWithFacets])
 async def list_internships(
     skills: Optional[List[str]] = Query(
         default=None,
@@ -30,23 +42,45 @@ async def list_internships(
         default="OPEN",
         description="Filter by status (OPEN, CLOSED). Defaults to OPEN to show only active internships to students.",
     ),
+    facets: bool = Query(
+        default=False,
+        description="Return {items, facets} with counts by remote, credit bucket, location and skill",
+    ),
     session: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
-) -> List[InternshipRead]:
+) -> Union[List[InternshipRead], InternshipListWithFacets]:
     # Default to OPEN for students, allow admins/industry to see all if they pass status=None
     filter_status = status
     if current_user.role == models.UserRole.STUDENT and status is None:
         filter_status = "OPEN"
     
-    internships = await crud.list_internships(
-        session,
-        skills=skills,
-        remote=remote,
-        min_credits=min_credits,
-        location=location,
-        status=filter_status,
+    filters = dict(skills=skills, remote=remote, min_credits=min_credits, location=location, status=filter_status)
+    internships = await crud.list_internships(session, **filters)
+    items = [InternshipRead.model_validate(internship) for internship in internships]
+    if not facets:
+        return items
+
+    cache_key = (
+        filter_status,
+        remote,
+        min_credits,
+        (location or "").strip().lower(),
+        tuple(sorted({skill.strip().lower() for skill in skills or [] if skill.strip()})),
+    )
+    facet_counts = internship_facet_cache.get(cache_key)
+    if facet_counts is None:
+        facet_counts = await crud.count_internship_facets(session, **filters)
+        internship_facet_cache.set(cache_key, facet_counts)
+
+    return InternshipListWithFacets(
+        items=items,
+        facets=InternshipFacets(
+            **{
+                name: [FacetCount(value=value, count=count) for value, count in counts]
+                for name, counts in facet_counts.items()
+            }
+        ),
     )
-    return [InternshipRead.model_validate(internship) for internship in internships]
 
 
 @router.post(
@@ -63,6 +97,36 @@ async def create_internship(
     return InternshipRead.model_validate(internship)
 
 
+@router.get("/mine/summary", response_model=List[InternshipSummaryRead])
+async def summarize_my_internships(
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.INDUSTRY, models.UserRole.ADMIN)),
+) -> List[InternshipSummaryRead]:
+    rows = await crud.summarize_internships_for_provider(session, current_user.id)
+    return [
+        InternshipSummaryRead(
+            internship_id=str(row["internship_id"]),
+            title=row["title"],
+            status=row["status"],
+            applications=row["applications"],
+            industry_status=ReviewStatusCounts(
+                pending=row["industry_pending"],
+                approved=row["industry_approved"],
+                rejected=row["industry_rejected"],
+            ),
+            faculty_status=ReviewStatusCounts(
+                pending=row["faculty_pending"],
+                approved=row["faculty_approved"],
+                rejected=row["faculty_rejected"],
+            ),
+            enrolled=row["enrolled"],
+            total_hours=row["total_hours"],
+            pending_reviews=row["pending_reviews"],
+        )
+        for row in rows
+    ]
+
+
 @router.get("/{internship_id}", response_model=InternshipRead)
 async def get_internship(
     internship_id: str,
@@ -74,6 +138,49 @@ async def get_internship(
     return InternshipRead.model_validate(internship)
 
 
+@router.get("/{internship_id}/similar", response_model=List[SimilarInternshipRead])
+async def list_similar_internships(
+    internship_id: str,
+    limit: int = Query(default=5, ge=1, le=20),
+    session: AsyncSession = Depends(get_db),
+) -> List[SimilarInternshipRead]:
+    internship = await crud.get_internship(session, internship_id)
+    if internship is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Internship not found")
+
+    similar = await crud.list_similar_internships(session, internship_id, limit=limit)
+    return [
+        SimilarInternshipRead(**InternshipRead.model_validate(item).model_dump(), similarity=similarity)
+        for item, similarity in similar
+    ]
+
+
+@router.get("/{internship_id}/applicants", response_model=List[RankedApplicantRead])
+async def list_internship_applicants(
+    internship_id: str,
+    sort: ApplicantSort = Query(default=ApplicantSort.FIT, description="Order by skill fit or application time"),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(
+        role_required(models.UserRole.INDUSTRY, models.UserRole.FACULTY, models.UserRole.ADMIN)
+    ),
+) -> List[RankedApplicantRead]:
+    internship = await crud.get_internship(session, internship_id)
+    if internship is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Internship not found")
+
+    if current_user.role == models.UserRole.INDUSTRY and internship.posted_by != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+
+    ranked = await crud.list_applicants_by_fit(session, internship)
+    if sort == ApplicantSort.APPLIED_AT:
+        ranked.sort(key=lambda pair: pair[0].applied_at, reverse=True)
+
+    return [
+        RankedApplicantRead(**ApplicationRead.model_validate(application).model_dump(), fit_score=score)
+        for application, score in ranked
+    ]
+
+
 @router.patch("/{internship_id}", response_model=InternshipRead)
 async def update_internship(
     internship_id: str,
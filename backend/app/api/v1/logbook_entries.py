@@ -1,11 +1,27 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, role_required
 from app.db import crud, models
-from app.schemas.logbook import LogbookEntryCreate, LogbookEntryRead, LogbookEntryUpdate
+from app.schemas.logbook import (
+    LogbookBatchCreate,
+    LogbookBatchItemResult,
+    LogbookBatchResult,
+    LogbookBulkApprove,
+    LogbookBulkApproveResult,
+    LogbookEntryCreate,
+    LogbookEntryRead,
+    LogbookEntryUpdate,
+    LogbookReviewCount,
+    LogbookReviewPage,
+    LogbookSyncItem,
+    LogbookSyncItemResult,
+    LogbookSyncRequest,
+    LogbookSyncResult,
+    SyncStatus,
+)
 
 router = APIRouter(prefix="/logbook-entries", tags=["logbook"])
 
@@ -13,9 +29,11 @@ router = APIRouter(prefix="/logbook-entries", tags=["logbook"])
 @router.post("", response_model=LogbookEntryRead, status_code=status.HTTP_201_CREATED)
 async def create_logbook_entry(
     logbook_in: LogbookEntryCreate,
+    response: Response,
     session: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(role_required(models.UserRole.STUDENT)),
 ) -> LogbookEntryRead:
+    """Create an entry; with a client-generated ``id`` a retried request returns the original (200)."""
     application = await crud.get_application(session, logbook_in.application_id)
     if application is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
@@ -24,10 +42,100 @@ async def create_logbook_entry(
     if application.industry_status == "REJECTED" or application.faculty_status == "REJECTED":
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Application is no longer active")
 
-    entry = await crud.create_logbook_entry(session, logbook_in, current_user.id)
+    if logbook_in.id is None:
+        entry = await crud.create_logbook_entry(session, logbook_in, current_user.id)
+        return LogbookEntryRead.model_validate(entry)
+
+    item = LogbookSyncItem(**logbook_in.model_dump())
+    ((sync_status, entry, error),) = await crud.sync_logbook_entries(session, [item], current_user.id)
+    if sync_status == SyncStatus.REJECTED:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=error)
+    if sync_status == SyncStatus.CONFLICT:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Entry id already used for different content")
+    if sync_status != SyncStatus.CREATED:
+        response.status_code = status.HTTP_200_OK
     return LogbookEntryRead.model_validate(entry)
 
 
+def _entry_problem(
+    states: Dict[str, Tuple[str, str, str]], application_id: str, student_id: str
+) -> Optional[str]:
+    """Why a student may not log against ``application_id``, or None if they may."""
+    state = states.get(application_id)
+    if state is None:
+        return "Application not found"
+    owner_id, industry_status, faculty_status = state
+    if owner_id != student_id:
+        return "Cannot add entries to this application"
+    if industry_status == "REJECTED" or faculty_status == "REJECTED":
+        return "Application is no longer active"
+    return None
+
+
+@router.post("/batch", response_model=LogbookBatchResult)
+async def create_logbook_entries(
+    batch_in: LogbookBatchCreate,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.STUDENT)),
+) -> LogbookBatchResult:
+    """Create up to 500 entries at once; entries for unusable applications are reported, not inserted."""
+    states = await crud.get_application_states(
+        session, list({entry.application_id for entry in batch_in.entries})
+    )
+
+    results = [
+        LogbookBatchItemResult(index=index, error=_entry_problem(states, entry.application_id, current_user.id))
+        for index, entry in enumerate(batch_in.entries)
+    ]
+    accepted = [result for result in results if result.error is None]
+    ids = await crud.create_logbook_entries(
+        session, [batch_in.entries[result.index] for result in accepted], current_user.id
+    )
+    for result, entry_id in zip(accepted, ids):
+        result.id = entry_id
+        if entry_id is None:
+            result.error = "Entry already submitted"
+    return LogbookBatchResult(created=sum(1 for entry_id in ids if entry_id), results=results)
+
+
+@router.post("/sync", response_model=LogbookSyncResult)
+async def sync_logbook_entries(
+    sync_in: LogbookSyncRequest,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.STUDENT)),
+) -> LogbookSyncResult:
+    """Flush offline drafts in one round trip.
+
+    Items without ``base_version`` are creates; replaying one is harmless. Items with
+    ``base_version`` are edits, applied only if the server is still at that version.
+    Every result carries the server copy so the client can resolve conflicts.
+    """
+    states = await crud.get_application_states(
+        session, list({entry.application_id for entry in sync_in.entries})
+    )
+
+    results: List[Optional[LogbookSyncItemResult]] = [None] * len(sync_in.entries)
+    accepted = []
+    for index, item in enumerate(sync_in.entries):
+        error = _entry_problem(states, item.application_id, current_user.id)
+        if error is None:
+            accepted.append(index)
+        else:
+            results[index] = LogbookSyncItemResult(id=str(item.id), status=SyncStatus.REJECTED, error=error)
+
+    outcomes = await crud.sync_logbook_entries(
+        session, [sync_in.entries[index] for index in accepted], current_user.id
+    )
+    for index, (sync_status, entry, error) in zip(accepted, outcomes):
+        results[index] = LogbookSyncItemResult(
+            id=str(sync_in.entries[index].id),
+            status=sync_status,
+            error=error,
+            entry=LogbookEntryRead.model_validate(entry) if entry is not None else None,
+        )
+    return LogbookSyncResult(results=[result for result in results if result is not None])
+
+
 @router.get("", response_model=List[LogbookEntryRead])
 async def list_logbook_entries(
     application_id: Optional[str] = Query(default=None, description="Filter by application ID"),
@@ -50,6 +158,67 @@ async def list_logbook_entries(
     return [LogbookEntryRead.model_validate(entry) for entry in entries]
 
 
+def _review_college(current_user: models.User, college_id: Optional[str]) -> Optional[str]:
+    """Faculty review their own college's students; admins any college (or all)."""
+    if current_user.role == models.UserRole.FACULTY:
+        if not current_user.college_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Faculty account has no college")
+        return current_user.college_id
+    return college_id
+
+
+@router.get("/review-queue", response_model=LogbookReviewPage)
+async def list_review_queue(
+    college_id: Optional[str] = Query(default=None, description="Limit to this college (admin only)"),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from a previous page"),
+    limit: int = Query(default=20, ge=1, le=100),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> LogbookReviewPage:
+    """Pending logbook entries, oldest submission first."""
+    try:
+        entries, next_cursor = await crud.list_review_queue(
+            session, college_id=_review_college(current_user, college_id), cursor=cursor, limit=limit
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return LogbookReviewPage(
+        items=[LogbookEntryRead.model_validate(entry) for entry in entries], next_cursor=next_cursor
+    )
+
+
+@router.get("/review-queue/count", response_model=LogbookReviewCount)
+async def count_review_queue(
+    college_id: Optional[str] = Query(default=None, description="Limit to this college (admin only)"),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> LogbookReviewCount:
+    pending = await crud.count_review_queue(session, college_id=_review_college(current_user, college_id))
+    return LogbookReviewCount(pending=pending)
+
+
+@router.post("/approve", response_model=LogbookBulkApproveResult)
+async def bulk_approve_logbook_entries(
+    approve_in: LogbookBulkApprove,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> LogbookBulkApproveResult:
+    """Approve many pending entries at once; entries outside the reviewer's college are skipped."""
+    approved = await crud.bulk_approve_logbook_entries(
+        session,
+        entry_ids=approve_in.ids,
+        application_id=approve_in.application_id,
+        start=approve_in.start,
+        end=approve_in.end,
+        college_id=_review_college(current_user, None),
+    )
+    return LogbookBulkApproveResult(
+        approved=len(approved),
+        approved_hours=sum(hours for _, _, _, hours in approved),
+        entry_ids=[entry_id for entry_id, _, _, _ in approved],
+    )
+
+
 @router.get("/{logbook_entry_id}", response_model=LogbookEntryRead)
 async def get_logbook_entry(
     logbook_entry_id: str,
@@ -100,6 +269,11 @@ async def update_logbook_entry(
     sanitized = {field: value for field, value in update_data.items() if field in allowed_fields}
     if not sanitized:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No permitted fields to update")
+    if logbook_in.version is not None and logbook_in.version != entry.version:
+        # A retried edit that already landed is not a conflict
+        if all(getattr(entry, field) == value for field, value in sanitized.items()):
+            return LogbookEntryRead.model_validate(entry)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Logbook entry was changed; reload and retry")
 
     updated = await crud.update_logbook_entry(session, entry, LogbookEntryUpdate(**sanitized))
     return LogbookEntryRead.model_validate(updated)
@@ -0,0 +1,61 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db, role_required
+from app.db import crud, models
+from app.schemas.dashboard import DashboardUser, StudentDashboard, TimelineEvent, TimelinePage
+from app.schemas.notification import NotificationRead
+
+router = APIRouter(prefix="/me", tags=["me"])
+
+
+@router.get("/dashboard", response_model=StudentDashboard)
+async def read_dashboard(
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.STUDENT)),
+) -> StudentDashboard:
+    """Everything the student home screen needs in one request."""
+    summary = await crud.get_student_dashboard(session, current_user.id)
+    return StudentDashboard(
+        user=DashboardUser(id=str(current_user.id), name=current_user.name, role=current_user.role),
+        active_applications=summary["active_applications"],
+        enrolled_applications=summary["enrolled_applications"],
+        week_start=summary["week_start"],
+        hours_this_week=summary["hours_this_week"],
+        total_credits=summary["total_credits"],
+        unread_notifications=summary["unread_notifications"],
+        latest_notifications=[
+            NotificationRead.model_validate(notification) for notification in summary["latest_notifications"]
+        ],
+    )
+
+
+@router.get("/timeline", response_model=TimelinePage)
+async def read_timeline(
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from a previous page"),
+    limit: int = Query(default=20, ge=1, le=100),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.STUDENT)),
+) -> TimelinePage:
+    """Newest-first feed of applications, approvals, logbook reviews, credits and reports."""
+    try:
+        rows, next_cursor = await crud.list_student_timeline(session, current_user.id, cursor=cursor, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return TimelinePage(
+        items=[
+            TimelineEvent(
+                id=activity.id,
+                kind=activity.kind,
+                occurred_at=activity.occurred_at,
+                application_id=activity.application_id,
+                internship_title=title,
+                subject_id=activity.subject_id,
+                detail=activity.detail,
+            )
+            for activity, title in rows
+        ],
+        next_cursor=next_cursor,
+    )
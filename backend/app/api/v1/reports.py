@@ -1,26 +1,58 @@
-import uuid
-from typing import List, Optional
+from typing import List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.api.deps import get_current_user, get_db, role_required
+from app.api.deps import get_current_user, get_db, get_sessionmaker, role_required
 from app.db import crud, models
-from app.schemas.report import ReportCreate, ReportRead, ReportUpdate
+from app.schemas.report import (
+    ReportBatchCreate,
+    ReportBatchRead,
+    ReportCreate,
+    ReportRead,
+    ReportRevoke,
+    ReportStatusRead,
+    ReportUpdate,
+    ReportVerification,
+)
+from app.services.report_tokens import (
+    REVOCATION_TTL_SECONDS,
+    ReportClaims,
+    cached_revocations,
+    forget_revocations,
+    qr_image,
+    remember_revocations,
+    verification_page_cache,
+    verify_report_token,
+)
+from app.services.reports import (
+    batch_download_url,
+    generate_report,
+    generate_reports,
+    render_verification_page,
+    report_verify_url,
+    stale_claim_cutoff,
+    stream_batch_zip,
+)
+from app.services.storage import download_response
+from app.services.uploads import blob_key
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
-def _generate_qr_token() -> str:
-    return uuid.uuid4().hex
-
-
 @router.post("", response_model=ReportRead, status_code=status.HTTP_201_CREATED)
 async def create_report(
     report_in: ReportCreate,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db),
+    sessionmaker: async_sessionmaker = Depends(get_sessionmaker),
     current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
 ) -> ReportRead:
+    """Register an external PDF, or (without ``pdf_url``) queue a server-rendered one.
+
+    Rendering happens after the response is sent; poll ``/reports/{id}/status``.
+    """
     application = await crud.get_application(session, report_in.application_id)
     if application is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
@@ -31,7 +63,9 @@ async def create_report(
             detail="Application must be fully approved before generating a report",
         )
 
-    report = await crud.create_report(session, report_in, qr_code_token=_generate_qr_token())
+    report = await crud.create_report(session, report_in)
+    if report.status == models.ReportStatus.PENDING.value:
+        background_tasks.add_task(generate_report, sessionmaker, report.id)
     return ReportRead.model_validate(report)
 
 
@@ -68,12 +102,107 @@ async def list_reports(
     return [ReportRead.model_validate(report) for report in reports]
 
 
-@router.get("/{report_id}", response_model=ReportRead)
-async def get_report(
-    report_id: str,
+def _batch_college(current_user: models.User, college_id: Optional[str]) -> Optional[str]:
+    """Faculty export their own college's cohort; admins any college (or the whole platform)."""
+    if current_user.role == models.UserRole.FACULTY:
+        if not current_user.college_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Faculty account has no college")
+        return current_user.college_id
+    return college_id
+
+
+async def _readable_batch(session: AsyncSession, batch_id: str, current_user: models.User) -> models.ReportBatch:
+    batch = await crud.get_report_batch(session, batch_id)
+    if batch is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report batch not found")
+    if current_user.role != models.UserRole.ADMIN and batch.requested_by != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+    return batch
+
+
+async def _batch_progress(session: AsyncSession, batch: models.ReportBatch) -> ReportBatchRead:
+    counts = await crud.count_report_batch_statuses(session, batch.id)
+    total = sum(counts.values())
+    ready = counts.get(models.ReportStatus.READY.value, 0)
+    failed = counts.get(models.ReportStatus.FAILED.value, 0)
+    finished = ready + failed == total
+    return ReportBatchRead(
+        id=str(batch.id),
+        college_id=str(batch.college_id) if batch.college_id else None,
+        internship_id=str(batch.internship_id) if batch.internship_id else None,
+        created_at=batch.created_at,
+        status=(models.ReportStatus.READY if finished else models.ReportStatus.RENDERING).value,
+        total=total,
+        ready=ready,
+        failed=failed,
+        progress=(ready + failed) / total if total else 1.0,
+        download_url=batch_download_url(batch.id) if finished else None,
+    )
+
+
+@router.post("/batches", response_model=ReportBatchRead, status_code=status.HTTP_202_ACCEPTED)
+async def create_report_batch(
+    batch_in: ReportBatchCreate,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-) -> ReportRead:
+    sessionmaker: async_sessionmaker = Depends(get_sessionmaker),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> ReportBatchRead:
+    """Collect the reports of every fully approved application in scope, rendering missing ones.
+
+    Poll ``/reports/batches/{id}`` for progress; once finished it links the ZIP download.
+    """
+    batch, pending = await crud.create_report_batch(
+        session,
+        requested_by=current_user.id,
+        stale_before=stale_claim_cutoff(),
+        college_id=_batch_college(current_user, batch_in.college_id),
+        internship_id=batch_in.internship_id,
+    )
+    if pending:
+        background_tasks.add_task(generate_reports, sessionmaker, pending)
+    return await _batch_progress(session, batch)
+
+
+@router.get("/batches/{batch_id}", response_model=ReportBatchRead)
+async def get_report_batch(
+    batch_id: str,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_db),
+    sessionmaker: async_sessionmaker = Depends(get_sessionmaker),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> ReportBatchRead:
+    """Batch progress; reports whose renderer died mid-render are queued again."""
+    batch = await _readable_batch(session, batch_id, current_user)
+    requeued = await crud.requeue_stale_reports(session, stale_claim_cutoff(), batch_id=batch.id)
+    if requeued:
+        background_tasks.add_task(generate_reports, sessionmaker, requeued)
+    return await _batch_progress(session, batch)
+
+
+@router.get("/batches/{batch_id}/download")
+async def download_report_batch(
+    batch_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> StreamingResponse:
+    """ZIP of the batch's PDFs and a manifest.csv, deflated while it streams."""
+    batch = await _readable_batch(session, batch_id, current_user)
+    progress = await _batch_progress(session, batch)
+    if progress.download_url is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Batch is still rendering ({progress.ready + progress.failed}/{progress.total})",
+        )
+    rows = await crud.list_report_batch_files(session, batch.id)
+    return StreamingResponse(
+        stream_batch_zip(rows),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="reports-{batch.id}.zip"'},
+    )
+
+
+async def _readable_report(session: AsyncSession, report_id: str, current_user: models.User) -> models.Report:
     report = await crud.get_report(session, report_id)
     if report is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
@@ -90,18 +219,128 @@ async def get_report(
         if internship is None or internship.posted_by != current_user.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
 
-    return ReportRead.model_validate(report)
+    return report
 
 
-@router.get("/qr/{qr_token}", response_model=ReportRead)
+@router.get("/{report_id}", response_model=ReportRead)
+async def get_report(
+    report_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> ReportRead:
+    return ReportRead.model_validate(await _readable_report(session, report_id, current_user))
+
+
+@router.get("/{report_id}/status", response_model=ReportStatusRead)
+async def get_report_status(
+    report_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> ReportStatusRead:
+    """PENDING -> RENDERING -> READY (or FAILED, with ``error``)."""
+    return ReportStatusRead.model_validate(await _readable_report(session, report_id, current_user))
+
+
+@router.get("/{report_id}/pdf")
+async def download_report_pdf(
+    report_id: str,
+    request: Request,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> Response:
+    report = await _readable_report(session, report_id, current_user)
+    if report.pdf_sha256:
+        return download_response(
+            request,
+            blob_key(report.pdf_sha256),
+            etag=report.pdf_sha256,
+            media_type="application/pdf",
+            filename=f"report-{report.id}.pdf",
+        )
+    if report.pdf_url and report.status == models.ReportStatus.READY.value:
+        return RedirectResponse(report.pdf_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Report is {report.status.lower()}")
+
+
+async def _verify_qr_token(session: AsyncSession, qr_token: str) -> Tuple[ReportClaims, bool]:
+    """Claims behind a QR token and whether the report was revoked; normally no database access."""
+    try:
+        claims = verify_report_token(qr_token)
+    except ValueError:
+        # Tokens issued before reports were signed are random strings
+        report = await crud.get_report_by_token(session, qr_token)
+        claims = await crud.get_report_claims(session, report) if report else None
+        if claims is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
+    revoked = cached_revocations()
+    if revoked is None:
+        revoked = frozenset(await crud.list_revoked_report_ids(session))
+        remember_revocations(revoked)
+    return claims, claims.report_id in revoked
+
+
+@router.get("/qr/{qr_token}", response_model=ReportVerification)
 async def get_report_by_qr_token(
     qr_token: str,
     session: AsyncSession = Depends(get_db),
-) -> ReportRead:
-    report = await crud.get_report_by_token(session, qr_token)
-    if report is None:
+) -> ReportVerification:
+    claims, revoked = await _verify_qr_token(session, qr_token)
+    return ReportVerification(
+        id=claims.report_id,
+        student_id=claims.student_id,
+        student_name=claims.student_name,
+        credits=claims.credits,
+        approved_hours=claims.approved_hours,
+        issued_on=claims.issued_on,
+        revoked=revoked,
+        verify_url=report_verify_url(qr_token),
+    )
+
+
+@router.get("/verify/{qr_token}", response_class=HTMLResponse, name="verify_report_page")
+async def verify_report_page(
+    qr_token: str,
+    session: AsyncSession = Depends(get_db),
+) -> HTMLResponse:
+    """Public page a scanned QR code opens."""
+    claims, revoked = await _verify_qr_token(session, qr_token)
+    page = verification_page_cache.get((qr_token, revoked))
+    if page is None:
+        page = render_verification_page(claims, revoked)
+        verification_page_cache.set((qr_token, revoked), page)
+    return HTMLResponse(page, headers={"cache-control": f"public, max-age={REVOCATION_TTL_SECONDS}"})
+
+
+@router.get("/verify/{qr_token}/qr.{kind}")
+async def report_qr_code(
+    qr_token: str,
+    kind: Literal["png", "svg"],
+    request: Request,
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """QR code linking to the verification page, for printing on the report."""
+    await _verify_qr_token(session, qr_token)
+    url = str(request.url_for("verify_report_page", qr_token=qr_token))
+    return Response(
+        qr_image(qr_token, url, kind),
+        media_type="image/png" if kind == "png" else "image/svg+xml",
+        headers={"cache-control": "public, max-age=86400"},
+    )
+
+
+@router.post("/{report_id}/revoke", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_report(
+    report_id: str,
+    revoke_in: ReportRevoke,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.FACULTY, models.UserRole.ADMIN)),
+) -> Response:
+    """Mark a report's QR token invalid; other workers notice within ``REVOCATION_TTL_SECONDS``."""
+    if await crud.get_report(session, report_id) is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
-    return ReportRead.model_validate(report)
+    await crud.revoke_report(session, report_id, revoked_by=current_user.id, reason=revoke_in.reason)
+    forget_revocations()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.patch("/{report_id}", response_model=ReportRead)
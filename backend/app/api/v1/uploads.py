@@ -0,0 +1,138 @@
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_db
+from app.core.config import settings
+from app.db import crud, models
+from app.schemas.upload import SHA256_PATTERN, UploadComplete, UploadCreate, UploadRead
+from app.services import uploads
+from app.services.storage import download_response
+
+router = APIRouter(prefix="/uploads", tags=["uploads"])
+
+
+def _blob_url(sha256: str) -> str:
+    return f"{settings.API_V1_PREFIX}/uploads/blobs/{sha256}"
+
+
+def _read(upload: models.UploadSession) -> UploadRead:
+    return UploadRead(
+        id=str(upload.id),
+        filename=upload.filename,
+        content_type=upload.content_type,
+        size=upload.size,
+        offset=upload.size if upload.completed_at else uploads.received(upload.id),
+        sha256=upload.sha256,
+        url=_blob_url(upload.sha256) if upload.sha256 else None,
+        created_at=upload.created_at,
+        completed_at=upload.completed_at,
+    )
+
+
+async def _own_upload(session: AsyncSession, upload_id: str, current_user: models.User) -> models.UploadSession:
+    upload = await crud.get_upload_session(session, upload_id)
+    if upload is None or upload.owner_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+    return upload
+
+
+@router.post("", response_model=UploadRead, status_code=status.HTTP_201_CREATED)
+async def create_upload(
+    upload_in: UploadCreate,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> UploadRead:
+    """Start a resumable upload; send the bytes with one or more PUT requests."""
+    if upload_in.size > settings.UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Uploads are limited to {settings.UPLOAD_MAX_BYTES} bytes",
+        )
+    upload = await crud.create_upload_session(session, upload_in, current_user.id)
+    return _read(upload)
+
+
+@router.get("/{upload_id}", response_model=UploadRead)
+async def read_upload(
+    upload_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> UploadRead:
+    """Current offset, for resuming after a dropped connection."""
+    return _read(await _own_upload(session, upload_id, current_user))
+
+
+@router.put("/{upload_id}", response_model=UploadRead)
+async def upload_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0, description="Offset of this chunk; must equal the upload's current offset"),
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> UploadRead:
+    """Append the raw request body, streamed straight to disk."""
+    upload = await _own_upload(session, upload_id, current_user)
+    if upload.completed_at:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Upload already completed")
+    async with uploads.upload_lock(upload.id):
+        # Another worker may have completed it while this request waited
+        await session.refresh(upload)
+        if upload.completed_at:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Upload already completed")
+        current = uploads.received(upload.id)
+        if offset != current:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Expected offset {current}")
+        try:
+            await uploads.append_chunk(upload.id, request.stream(), limit=upload.size)
+        except uploads.UploadTooLarge as exc:
+            raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(exc)) from exc
+    return _read(upload)
+
+
+@router.post("/{upload_id}/complete", response_model=UploadRead)
+async def complete_upload(
+    upload_id: str,
+    complete_in: UploadComplete,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> UploadRead:
+    """Hash the received bytes and store them under their SHA-256 (once per distinct content)."""
+    upload = await _own_upload(session, upload_id, current_user)
+    if upload.completed_at:
+        return _read(upload)
+    async with uploads.upload_lock(upload.id):
+        await session.refresh(upload)
+        if upload.completed_at:
+            return _read(upload)
+        current = uploads.received(upload.id)
+        if current != upload.size:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail=f"Received {current} of {upload.size} bytes"
+            )
+        try:
+            sha256, _ = await uploads.finalize(upload.id, complete_in.sha256, upload.content_type)
+        except uploads.ChecksumMismatch as exc:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
+        upload = await crud.complete_upload_session(session, upload, sha256)
+        await uploads.discard_lock(upload.id)
+    return _read(upload)
+
+
+@router.get("/blobs/{sha256}")
+async def download_blob(
+    sha256: str,
+    request: Request,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> Response:
+    """Stream the blob (Range and ETag aware), or redirect to a signed URL for S3 storage.
+
+    Only for users who may see a record referencing it (see ``crud.can_read_blob``).
+    """
+    blob = await crud.get_blob(session, sha256) if re.fullmatch(SHA256_PATTERN, sha256) else None
+    if blob is None or not await crud.can_read_blob(session, sha256, current_user):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    return download_response(request, uploads.blob_key(sha256), etag=sha256, media_type=blob.content_type)
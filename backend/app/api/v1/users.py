@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_current_user, get_db
-from app.db import models
+from app.api.deps import get_current_user, get_db, role_required
+from app.core.config import settings
+from app.db import crud, models
+from app.schemas.profile import ProfileRead
+from app.schemas.search import FacetCount, StudentFacets, StudentSearchHit, StudentSearchPage
 from app.schemas.user import UserRead, UserUpdate
+from app.services import uploads
+from app.services.skill_fit import fit_score_cache
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -22,13 +29,92 @@ async def read_current_user(
     return UserRead.model_validate(current_user)
 
 
+@router.get("/search", response_model=StudentSearchPage)
+async def search_students(
+    skills: Optional[List[str]] = Query(
+        default=None,
+        description="Only include students that list all provided skills (case-insensitive)",
+    ),
+    course: Optional[str] = Query(default=None, description="Exact course match"),
+    year: Optional[str] = Query(default=None, description="Exact year match"),
+    college: Optional[str] = Query(default=None, description="Exact college match"),
+    q: Optional[str] = Query(default=None, description="Case-insensitive student name prefix"),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from a previous page"),
+    limit: int = Query(default=20, ge=1, le=100),
+    facets: bool = Query(default=True, description="Include facet counts (first page only)"),
+    session: AsyncSession = Depends(get_db),
+    _: models.User = Depends(
+        role_required(models.UserRole.INDUSTRY, models.UserRole.FACULTY, models.UserRole.ADMIN)
+    ),
+) -> StudentSearchPage:
+    try:
+        students, next_cursor, facet_counts = await crud.search_students(
+            session,
+            skills=skills,
+            course=course,
+            year=year,
+            college=college,
+            q=q,
+            cursor=cursor,
+            limit=limit,
+            with_facets=facets and cursor is None,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return StudentSearchPage(
+        items=[StudentSearchHit.model_validate(student) for student in students],
+        next_cursor=next_cursor,
+        facets=StudentFacets(
+            **{
+                name: [FacetCount(value=value, count=count) for value, count in counts]
+                for name, counts in facet_counts.items()
+            }
+        )
+        if facet_counts is not None
+        else None,
+    )
+
+
+@router.put("/me/resume", response_model=ProfileRead)
+async def upload_resume(
+    request: Request,
+    session: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(role_required(models.UserRole.STUDENT)),
+) -> ProfileRead:
+    """Replace the resume with the raw request body (sent with its Content-Type).
+
+    The file is stored once per distinct content; applications made afterwards
+    reference it instead of copying it.
+    """
+    if request.headers.get("content-length") == "0":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Resume file is empty")
+    content_type = request.headers.get("content-type")
+    try:
+        sha256, size = await uploads.store_stream(request.stream(), settings.RESUME_MAX_BYTES, content_type)
+    except uploads.UploadTooLarge as exc:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Resumes are limited to {settings.RESUME_MAX_BYTES} bytes",
+        ) from exc
+    profile = await crud.set_profile_resume(
+        session,
+        current_user.id,
+        sha256=sha256,
+        size=size,
+        content_type=content_type,
+        resume_url=f"{settings.API_V1_PREFIX}/uploads/blobs/{sha256}",
+    )
+    return ProfileRead.model_validate(profile)
+
+
 @router.patch("/me", response_model=UserRead)
 async def update_current_user(
     payload: UserUpdate,
     session: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ) -> UserRead:
-    updated = False
+    updated = skills_changed = funnel_moved = False
     
     # Update user fields
     if payload.name is not None:
@@ -41,6 +127,7 @@ async def update_current_user(
         current_user.university = payload.university
         updated = True
     if payload.college_id is not None:
+        funnel_moved = funnel_moved or payload.college_id != current_user.college_id
         current_user.college_id = payload.college_id
         updated = True
 
@@ -67,16 +154,18 @@ async def update_current_user(
                 current_user.profile.designation = payload.profile.designation
                 updated = True
             if payload.profile.department is not None:
+                funnel_moved = funnel_moved or payload.profile.department != current_user.profile.department
                 current_user.profile.department = payload.profile.department
                 updated = True
             if payload.profile.faculty_id is not None:
                 current_user.profile.faculty_id = payload.profile.faculty_id
                 updated = True
             if payload.profile.skills is not None:
-                current_user.profile.skills = {"skills": payload.profile.skills}
-                updated = True
+                await crud.set_profile_skills(session, current_user.profile, payload.profile.skills)
+                updated = skills_changed = True
             if payload.profile.resume_url is not None:
                 current_user.profile.resume_url = payload.profile.resume_url
+                current_user.profile.resume_sha256 = None
                 updated = True
         else:
             # Create new profile if it doesn't exist
@@ -89,11 +178,12 @@ async def update_current_user(
                 designation=payload.profile.designation,
                 department=payload.profile.department,
                 faculty_id=payload.profile.faculty_id,
-                skills={"skills": payload.profile.skills} if payload.profile.skills else None,
                 resume_url=payload.profile.resume_url,
             )
             session.add(profile)
-            updated = True
+            await crud.set_profile_skills(session, profile, payload.profile.skills)
+            updated = skills_changed = True
+            funnel_moved = funnel_moved or bool(payload.profile.department)
     
     # Update industry profile
     if payload.industry_profile is not None and current_user.role == models.UserRole.INDUSTRY:
@@ -121,11 +211,17 @@ async def update_current_user(
                 current_user.industry_profile.company_address = payload.industry_profile.company_address
                 updated = True
 
+    if funnel_moved and current_user.role == models.UserRole.STUDENT:
+        # Funnel snapshots are grouped by the applicant's college and department
+        await crud.mark_student_funnels_stale(session, current_user.id)
+
     if updated:
         await session.commit()
         await session.refresh(
             current_user,
             attribute_names=["profile", "industry_profile"]
         )
+        if skills_changed:
+            fit_score_cache.invalidate_student(current_user.id)
 
     return UserRead.model_validate(current_user)
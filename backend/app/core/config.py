@@ -19,6 +19,17 @@ class Settings(BaseSettings):
     S3_BUCKET: Optional[str] = None
     S3_ACCESS_KEY: Optional[str] = None
     S3_SECRET_KEY: Optional[str] = None
+    S3_REGION: str = "us-east-1"
+    STORAGE_BACKEND: str = "local"  # "local" (UPLOAD_DIR) or "s3" (S3_* settings)
+    SIGNED_URL_TTL_SECONDS: int = 300
+    UPLOAD_DIR: str = "storage"
+    UPLOAD_MAX_BYTES: int = 50 * 1024 * 1024
+    RESUME_MAX_BYTES: int = 5 * 1024 * 1024
+    REPORT_RENDERER: str = "auto"  # "chromium" (pyppeteer), "basic" (pure Python) or "auto"
+    REPORT_RENDERER_POOL_SIZE: int = 2
+    REPORT_RENDER_TIMEOUT_SECONDS: int = 600  # RENDERING claims older than this are retried
+    REPORT_TEMPLATE_CACHE_DIR: Optional[str] = None  # jinja2 bytecode cache; None uses a per-user temp dir
+    REPORT_TOKEN_SECRET: Optional[str] = None  # signs report QR tokens; defaults to SECRET_KEY
     SENTRY_DSN: Optional[str] = None
     FCM_SERVER_KEY: Optional[str] = None
     CORS_ORIGINS: List[str] = ["*"]
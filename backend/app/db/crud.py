@@ -1,20 +1,35 @@
-from typing import List, Optional
-
-from sqlalchemy import select
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+import sqlalchemy as sa
+from sqlalchemy import and_, case, delete, func, or_, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import decode_cursor, encode_cursor
 from app.core.security import get_password_hash
 from app.db import models
+from app.db.functions import days_between, month_start, week_start
 from app.schemas.user import UserCreate
 from app.schemas.college import CollegeCreate
 from app.schemas.internship import InternshipCreate, InternshipUpdate
 from app.schemas.application import ApplicationCreate, ApplicationUpdate
-from app.schemas.logbook import LogbookEntryCreate, LogbookEntryUpdate
+from app.schemas.logbook import LogbookEntryCreate, LogbookEntryUpdate, LogbookSyncItem, SyncStatus
 from app.schemas.credit import CreditCreate, CreditUpdate
 from app.schemas.report import ReportCreate, ReportUpdate
 from app.schemas.notification import NotificationCreate, NotificationUpdate, NotificationBulkCreate
+from app.schemas.upload import UploadCreate
+from app.services import batch_analytics, minhash
+from app.services.catalog import CREDIT_BUCKETS, NO_CREDITS, internship_facet_cache
+from app.services.report_tokens import ReportClaims, sign_report_token
+from app.services.skill_fit import fit_score_cache, score_skill_overlap
+from app.services.stats import admin_stats_cache
+from app.services.terms import academic_term
+from app.services.tracking import DEFAULT_DURATION_WEEKS, HOURS_PER_WEEK, TrackingStatus
 
 
 async def get_user_by_email(session: AsyncSession, email: str) -> Optional[models.User]:
@@ -67,9 +82,9 @@ async def create_user(session: AsyncSession, user_in: UserCreate) -> models.User
             enrollment_no=user_in.student_profile.enrollment_no,
             course=user_in.student_profile.course,
             year=user_in.student_profile.year,
-            skills={"skills": user_in.student_profile.skills} if user_in.student_profile.skills else None,
         )
         session.add(profile)
+        await set_profile_skills(session, profile, user_in.student_profile.skills)
     
     elif user_in.role == models.UserRole.FACULTY and user_in.faculty_profile:
         profile = models.Profile(
@@ -107,6 +122,162 @@ async def create_user(session: AsyncSession, user_in: UserCreate) -> models.User
     return user
 
 
+def normalize_skills(skills: Optional[List[str]]) -> List[str]:
+    seen: Dict[str, None] = {}
+    for skill in skills or []:
+        term = str(skill).strip().lower()[:100]
+        if term:
+            seen.setdefault(term, None)
+    return list(seen)
+
+
+async def set_profile_skills(
+    session: AsyncSession, profile: models.Profile, skills: Optional[List[str]]
+) -> None:
+    """Store skills on the profile and rebuild its rows in the profile_skills index (no commit).
+
+    Once committed, callers drop the student's cached fit scores with
+    ``fit_score_cache.invalidate_student``.
+    """
+    profile.skills = {"skills": skills} if skills else None
+    await session.execute(
+        delete(models.ProfileSkill).where(models.ProfileSkill.user_id == profile.user_id)
+    )
+    for skill in normalize_skills(skills):
+        session.add(models.ProfileSkill(user_id=profile.user_id, skill=skill))
+
+
+async def get_normalized_skills(session: AsyncSession, user_ids: List[str]) -> Dict[str, List[str]]:
+    if not user_ids:
+        return {}
+    result = await session.execute(
+        select(models.ProfileSkill.user_id, models.ProfileSkill.skill).where(
+            models.ProfileSkill.user_id.in_(user_ids)
+        )
+    )
+    skills: Dict[str, List[str]] = {user_id: [] for user_id in user_ids}
+    for user_id, skill in result.all():
+        skills[user_id].append(skill)
+    return skills
+
+
+def _student_search_ids(
+    *,
+    skills: Optional[List[str]] = None,
+    course: Optional[str] = None,
+    year: Optional[str] = None,
+    college: Optional[str] = None,
+    q: Optional[str] = None,
+):
+    query = (
+        select(models.User.id, models.User.name)
+        .join(models.Profile, models.Profile.user_id == models.User.id)
+        .where(models.User.role == models.UserRole.STUDENT)
+        .where(models.User.is_active.is_(True))
+    )
+    if course:
+        query = query.where(models.Profile.course == course)
+    if year:
+        query = query.where(models.Profile.year == year)
+    if college:
+        query = query.where(models.Profile.college == college)
+    if q and q.strip():
+        query = query.where(models.User.name.ilike(f"{q.strip()}%"))
+
+    wanted = normalize_skills(skills)
+    if wanted:
+        matching = (
+            select(models.ProfileSkill.user_id)
+            .where(models.ProfileSkill.skill.in_(wanted))
+            .group_by(models.ProfileSkill.user_id)
+            .having(func.count() == len(wanted))
+        )
+        query = query.where(models.User.id.in_(matching))
+    return query
+
+
+async def _facet_counts(
+    session: AsyncSession, column, owner_column, user_ids, limit: int
+) -> List[Tuple[str, int]]:
+    result = await session.execute(
+        select(column, func.count())
+        .where(owner_column.in_(user_ids))
+        .where(column.is_not(None))
+        .group_by(column)
+        .order_by(func.count().desc(), column)
+        .limit(limit)
+    )
+    return [(value, count) for value, count in result.all()]
+
+
+async def search_students(
+    session: AsyncSession,
+    *,
+    skills: Optional[List[str]] = None,
+    course: Optional[str] = None,
+    year: Optional[str] = None,
+    college: Optional[str] = None,
+    q: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    with_facets: bool = False,
+    facet_limit: int = 10,
+) -> Tuple[List[models.User], Optional[str], Optional[Dict[str, List[Tuple[str, int]]]]]:
+    """Keyset-paginated student search ordered by (name, id).
+
+    Only ids are selected for the filtered set; full user/profile rows are loaded
+    for the requested page alone. Raises ValueError for a malformed cursor.
+    """
+    base = _student_search_ids(skills=skills, course=course, year=year, college=college, q=q)
+
+    page_query = base
+    if cursor:
+        after_name, after_id = decode_cursor(cursor, 2)
+        page_query = page_query.where(
+            or_(
+                models.User.name > after_name,
+                and_(models.User.name == after_name, models.User.id > after_id),
+            )
+        )
+    page_query = page_query.order_by(models.User.name, models.User.id).limit(limit + 1)
+    rows = (await session.execute(page_query)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].name, rows[-1].id)
+
+    users: List[models.User] = []
+    if rows:
+        result = await session.execute(
+            select(models.User)
+            .options(selectinload(models.User.profile))
+            .where(models.User.id.in_([row.id for row in rows]))
+        )
+        by_id = {user.id: user for user in result.scalars().all()}
+        users = [by_id[row.id] for row in rows if row.id in by_id]
+
+    facets = None
+    if with_facets:
+        matched_ids = base.with_only_columns(models.User.id)
+        facets = {
+            "course": await _facet_counts(
+                session, models.Profile.course, models.Profile.user_id, matched_ids, facet_limit
+            ),
+            "year": await _facet_counts(
+                session, models.Profile.year, models.Profile.user_id, matched_ids, facet_limit
+            ),
+            "college": await _facet_counts(
+                session, models.Profile.college, models.Profile.user_id, matched_ids, facet_limit
+            ),
+            "skills": await _facet_counts(
+                session, models.ProfileSkill.skill, models.ProfileSkill.user_id, matched_ids, facet_limit
+            ),
+        }
+
+    return users, next_cursor, facets
+
+
 async def list_colleges(session: AsyncSession) -> List[models.College]:
     result = await session.execute(select(models.College).order_by(models.College.name))
     return list(result.scalars().all())
@@ -145,11 +316,152 @@ async def create_internship(
         posted_by=posted_by,
     )
     session.add(internship)
+    await session.flush()
+    await set_internship_skills(session, internship)
+    await index_internship_similarity(session, internship)
     await session.commit()
     await session.refresh(internship)
+    internship_facet_cache.clear()
     return internship
 
 
+SIMILARITY_THRESHOLD = 0.25
+MAX_NEIGHBOURS = 20
+
+
+async def _clear_internship_similarity(session: AsyncSession, internship_id: str) -> None:
+    await session.execute(
+        delete(models.InternshipNeighbour).where(
+            or_(
+                models.InternshipNeighbour.internship_id == internship_id,
+                models.InternshipNeighbour.neighbour_id == internship_id,
+            )
+        )
+    )
+    await session.execute(
+        delete(models.InternshipLshBucket).where(models.InternshipLshBucket.internship_id == internship_id)
+    )
+    await session.execute(
+        delete(models.InternshipSignature).where(models.InternshipSignature.internship_id == internship_id)
+    )
+
+
+async def index_internship_similarity(session: AsyncSession, internship: models.Internship) -> None:
+    """Recompute one posting's MinHash signature, LSH buckets and neighbour rows (no commit).
+
+    Candidates are the postings sharing at least one LSH bucket; only those are
+    compared, and edges are written in both directions so lookups stay a single
+    indexed read of internship_neighbours.
+    """
+    await _clear_internship_similarity(session, internship.id)
+
+    sig = minhash.signature(minhash.internship_tokens(internship.title, internship.skills))
+    if not sig:
+        return
+
+    keys = minhash.band_keys(sig)
+    result = await session.execute(
+        select(models.InternshipSignature.internship_id, models.InternshipSignature.signature).where(
+            models.InternshipSignature.internship_id.in_(
+                select(models.InternshipLshBucket.internship_id)
+                .where(tuple_(models.InternshipLshBucket.band, models.InternshipLshBucket.bucket).in_(keys))
+                .distinct()
+            )
+        )
+    )
+    scored = [
+        (candidate_id, minhash.estimate_similarity(sig, candidate_sig))
+        for candidate_id, candidate_sig in result.all()
+    ]
+    scored = sorted(
+        (pair for pair in scored if pair[1] >= SIMILARITY_THRESHOLD), key=lambda pair: pair[1], reverse=True
+    )[:MAX_NEIGHBOURS]
+
+    session.add(models.InternshipSignature(internship_id=internship.id, signature=sig))
+    for band, bucket in keys:
+        session.add(models.InternshipLshBucket(band=band, bucket=bucket, internship_id=internship.id))
+    for neighbour_id, similarity in scored:
+        session.add(
+            models.InternshipNeighbour(
+                internship_id=internship.id, neighbour_id=neighbour_id, similarity=similarity
+            )
+        )
+        session.add(
+            models.InternshipNeighbour(
+                internship_id=neighbour_id, neighbour_id=internship.id, similarity=similarity
+            )
+        )
+
+
+async def rebuild_internship_similarity(session: AsyncSession) -> int:
+    """Re-index every posting from scratch; used to backfill the similarity tables."""
+    await session.execute(delete(models.InternshipNeighbour))
+    await session.execute(delete(models.InternshipLshBucket))
+    await session.execute(delete(models.InternshipSignature))
+    result = await session.execute(select(models.Internship).order_by(models.Internship.created_at))
+    internships = list(result.scalars().all())
+    for internship in internships:
+        await index_internship_similarity(session, internship)
+        await session.flush()
+    await session.commit()
+    return len(internships)
+
+
+async def list_similar_internships(
+    session: AsyncSession, internship_id: str, *, limit: int = 10
+) -> List[Tuple[models.Internship, float]]:
+    result = await session.execute(
+        select(models.Internship, models.InternshipNeighbour.similarity)
+        .join(models.InternshipNeighbour, models.InternshipNeighbour.neighbour_id == models.Internship.id)
+        .where(models.InternshipNeighbour.internship_id == internship_id)
+        .where(models.Internship.status == "OPEN")
+        .order_by(models.InternshipNeighbour.similarity.desc(), models.Internship.created_at.desc())
+        .limit(limit)
+    )
+    return [(internship, similarity) for internship, similarity in result.all()]
+
+
+async def set_internship_skills(session: AsyncSession, internship: models.Internship) -> None:
+    """Rebuild the posting's rows in the internship_skills index (no commit)."""
+    await session.execute(
+        delete(models.InternshipSkill).where(models.InternshipSkill.internship_id == internship.id)
+    )
+    for skill in normalize_skills(internship.skills):
+        session.add(models.InternshipSkill(internship_id=internship.id, skill=skill))
+
+
+def _internship_filters(
+    *,
+    remote: Optional[bool] = None,
+    min_credits: Optional[int] = None,
+    location: Optional[str] = None,
+    skills: Optional[List[str]] = None,
+    status: Optional[str] = None,
+) -> List[Any]:
+    internships = models.Internship
+    clauses = []
+    if remote is not None:
+        clauses.append(internships.remote == remote)
+    if min_credits is not None:
+        clauses.append(internships.credits >= min_credits)
+    if status is not None:
+        clauses.append(internships.status == status)
+    location_term = (location or "").strip().lower()
+    if location_term:
+        clauses.append(func.lower(internships.location).contains(location_term, autoescape=True))
+    wanted = normalize_skills(skills)
+    if wanted:
+        clauses.append(
+            internships.id.in_(
+                select(models.InternshipSkill.internship_id)
+                .where(models.InternshipSkill.skill.in_(wanted))
+                .group_by(models.InternshipSkill.internship_id)
+                .having(func.count() == len(wanted))
+            )
+        )
+    return clauses
+
+
 async def list_internships(
     session: AsyncSession,
     *,
@@ -159,37 +471,86 @@ async def list_internships(
     skills: Optional[List[str]] = None,
     status: Optional[str] = None,
 ) -> List[models.Internship]:
-    query = select(models.Internship).order_by(models.Internship.created_at.desc())
+    filters = _internship_filters(
+        remote=remote, min_credits=min_credits, location=location, skills=skills, status=status
+    )
+    result = await session.execute(
+        select(models.Internship).where(*filters).order_by(models.Internship.created_at.desc())
+    )
+    return list(result.scalars().all())
 
-    if remote is not None:
-        query = query.where(models.Internship.remote == remote)
-    if min_credits is not None:
-        query = query.where(models.Internship.credits >= min_credits)
-    if status is not None:
-        query = query.where(models.Internship.status == status)
 
-    result = await session.execute(query)
-    internships: List[models.Internship] = list(result.scalars().all())
+async def count_internship_facets(
+    session: AsyncSession,
+    *,
+    top: int = 10,
+    remote: Optional[bool] = None,
+    min_credits: Optional[int] = None,
+    location: Optional[str] = None,
+    skills: Optional[List[str]] = None,
+    status: Optional[str] = None,
+) -> Dict[str, List[Tuple[str, int]]]:
+    """Counts for remote/on-site, credit buckets, top locations and top skills; one GROUP BY each."""
+    internships = models.Internship
+    matched = select(internships.id).where(
+        *_internship_filters(remote=remote, min_credits=min_credits, location=location, skills=skills, status=status)
+    )
+    in_scope = internships.id.in_(matched)
+
+    remote_counts = dict(
+        (
+            await session.execute(
+                select(internships.remote, func.count()).where(in_scope).group_by(internships.remote)
+            )
+        ).all()
+    )
+
+    bucket = case(
+        *[
+            (
+                and_(internships.credits >= low, internships.credits <= high)
+                if high is not None
+                else internships.credits >= low,
+                label,
+            )
+            for low, high, label in CREDIT_BUCKETS
+        ],
+        else_=NO_CREDITS,
+    ).label("bucket")
+    credit_counts = dict(
+        (await session.execute(select(bucket, func.count()).where(in_scope).group_by(bucket))).all()
+    )
 
-    if skills:
-        lowered = {skill.strip().lower() for skill in skills if skill.strip()}
-        if lowered:
-            internships = [
-                internship
-                for internship in internships
-                if lowered.issubset({str(skill).lower() for skill in (internship.skills or [])})
-            ]
+    location_key = func.lower(func.trim(internships.location))
+    locations = await session.execute(
+        select(func.min(func.trim(internships.location)), func.count())
+        .where(in_scope)
+        .where(func.trim(internships.location) != "")
+        .group_by(location_key)
+        .order_by(func.count().desc(), location_key)
+        .limit(top)
+    )
 
-    if location:
-        location_term = location.strip().lower()
-        if location_term:
-            internships = [
-                internship
-                for internship in internships
-                if internship.location and location_term in internship.location.lower()
-            ]
+    skill = models.InternshipSkill.skill
+    skill_counts = await session.execute(
+        select(skill, func.count())
+        .where(models.InternshipSkill.internship_id.in_(matched))
+        .group_by(skill)
+        .order_by(func.count().desc(), skill)
+        .limit(top)
+    )
 
-    return internships
+    bucket_order = [label for _, _, label in CREDIT_BUCKETS] + [NO_CREDITS]
+    return {
+        "remote": [
+            (label, remote_counts[value])
+            for value, label in ((True, "remote"), (False, "on_site"))
+            if remote_counts.get(value)
+        ],
+        "credits": [(label, credit_counts[label]) for label in bucket_order if credit_counts.get(label)],
+        "locations": [(label, count) for label, count in locations.all()],
+        "skills": [(value, count) for value, count in skill_counts.all()],
+    }
 
 
 async def get_internship(session: AsyncSession, internship_id: str) -> Optional[models.Internship]:
@@ -203,14 +564,68 @@ async def update_internship(
     for field, value in update_data.items():
         setattr(internship, field, value)
 
+    if "skills" in update_data:
+        await set_internship_skills(session, internship)
+    if "title" in update_data or "skills" in update_data:
+        await index_internship_similarity(session, internship)
+
     await session.commit()
     await session.refresh(internship)
+    internship_facet_cache.clear()
     return internship
 
 
 async def delete_internship(session: AsyncSession, internship: models.Internship) -> None:
+    await _clear_internship_similarity(session, internship.id)
+    await session.execute(
+        delete(models.InternshipSkill).where(models.InternshipSkill.internship_id == internship.id)
+    )
+    await session.execute(
+        delete(models.FunnelSnapshot).where(models.FunnelSnapshot.internship_id == internship.id)
+    )
     await session.delete(internship)
     await session.commit()
+    internship_facet_cache.clear()
+
+
+async def summarize_internships_for_provider(session: AsyncSession, posted_by: str) -> List[Dict[str, Any]]:
+    """Per-posting application and logbook counts for one provider in a single GROUP BY query."""
+    application = models.Application
+    progress = models.ApplicationProgress
+
+    def status_count(column, value):
+        return func.coalesce(func.sum(case((column == value, 1), else_=0)), 0)
+
+    enrolled = and_(application.industry_status == "APPROVED", application.faculty_status == "APPROVED")
+    result = await session.execute(
+        select(
+            models.Internship.id.label("internship_id"),
+            models.Internship.title,
+            models.Internship.status,
+            func.count(application.id).label("applications"),
+            status_count(application.industry_status, "PENDING").label("industry_pending"),
+            status_count(application.industry_status, "APPROVED").label("industry_approved"),
+            status_count(application.industry_status, "REJECTED").label("industry_rejected"),
+            status_count(application.faculty_status, "PENDING").label("faculty_pending"),
+            status_count(application.faculty_status, "APPROVED").label("faculty_approved"),
+            status_count(application.faculty_status, "REJECTED").label("faculty_rejected"),
+            func.coalesce(func.sum(case((enrolled, 1), else_=0)), 0).label("enrolled"),
+            func.coalesce(func.sum(progress.total_hours), 0).label("total_hours"),
+            func.coalesce(func.sum(progress.pending_count), 0).label("pending_reviews"),
+        )
+        .select_from(models.Internship)
+        .outerjoin(application, application.internship_id == models.Internship.id)
+        .outerjoin(progress, progress.application_id == application.id)
+        .where(models.Internship.posted_by == posted_by)
+        .group_by(
+            models.Internship.id,
+            models.Internship.title,
+            models.Internship.status,
+            models.Internship.created_at,
+        )
+        .order_by(models.Internship.created_at.desc())
+    )
+    return [dict(row._mapping) for row in result.all()]
 
 
 async def get_application_by_student_and_internship(
@@ -227,12 +642,24 @@ async def get_application_by_student_and_internship(
 async def create_application(
     session: AsyncSession, application_in: ApplicationCreate, student_id: str
 ) -> models.Application:
+    resume_sha256 = None
+    if application_in.resume_snapshot_url is None:
+        # Reference the current resume blob rather than copying the file
+        resume_sha256 = (
+            await session.execute(select(models.Profile.resume_sha256).where(models.Profile.user_id == student_id))
+        ).scalar_one_or_none()
     application = models.Application(
         internship_id=application_in.internship_id,
         student_id=student_id,
         resume_snapshot_url=application_in.resume_snapshot_url,
+        resume_sha256=resume_sha256,
     )
     session.add(application)
+    await session.flush()
+    session.add(models.ApplicationProgress(application_id=application.id))
+    record_activity(
+        session, student_id, models.ActivityKind.APPLIED, application_id=application.id, occurred_at=application.applied_at
+    )
     await session.commit()
     await session.refresh(application, ['student', 'internship'])
     return application
@@ -296,33 +723,349 @@ async def list_applications(
     return list(result.scalars().unique().all())
 
 
+async def list_applicants_by_fit(
+    session: AsyncSession, internship: models.Internship
+) -> List[Tuple[models.Application, float]]:
+    """Applications for an internship paired with their skill-fit score, best fit first.
+
+    Scores come from the fit score cache; only students without a cached score are
+    loaded from the profile_skills index and scored in one vectorized batch.
+    """
+    applications = await list_applications(session, internship_id=internship.id)
+    student_ids = [application.student_id for application in applications]
+
+    generations = fit_score_cache.generations(student_ids)
+    scores = fit_score_cache.get_many(internship.id, internship.skills, generations)
+    missing = [student_id for student_id in dict.fromkeys(student_ids) if student_id not in scores]
+    if missing:
+        skills_by_student = await get_normalized_skills(session, missing)
+        batch = score_skill_overlap(
+            internship.skills or [], [skills_by_student[student_id] for student_id in missing]
+        )
+        computed = {student_id: float(score) for student_id, score in zip(missing, batch)}
+        fit_score_cache.set_many(internship.id, internship.skills, computed, generations)
+        scores.update(computed)
+
+    ranked = [(application, scores[application.student_id]) for application in applications]
+    # list_applications returns newest first; the stable sort keeps that order among ties
+    ranked.sort(key=lambda pair: pair[1], reverse=True)
+    return ranked
+
+
 async def update_application(
     session: AsyncSession,
     application: models.Application,
     application_in: ApplicationUpdate,
 ) -> models.Application:
     update_data = application_in.model_dump(exclude_unset=True)
+    before = (application.industry_status, application.faculty_status)
     for field, value in update_data.items():
         setattr(application, field, value)
 
+    for old, new, kind in (
+        (before[0], application.industry_status, models.ActivityKind.INDUSTRY_APPROVED),
+        (before[1], application.faculty_status, models.ActivityKind.FACULTY_APPROVED),
+    ):
+        if new == "APPROVED" and old != "APPROVED":
+            record_activity(session, application.student_id, kind, application_id=application.id)
     await session.commit()
     await session.refresh(application, ['student', 'internship'])
     return application
 
 
+def _progress_contribution(hours: float, approved: bool) -> Tuple[float, float, int, int]:
+    """(total_hours, approved_hours, entry_count, pending_count) one entry adds to its application."""
+    return hours, hours if approved else 0.0, 1, 0 if approved else 1
+
+
+async def apply_progress_delta(
+    session: AsyncSession,
+    application_id: str,
+    total_hours: float = 0.0,
+    approved_hours: float = 0.0,
+    entry_count: int = 0,
+    pending_count: int = 0,
+) -> None:
+    """Add deltas to an application's progress row inside the caller's transaction.
+
+    Callers write their logbook changes first; a missing row is rebuilt from
+    logbook_entries, which then already include them.
+    """
+    progress = models.ApplicationProgress
+    result = await session.execute(
+        sa.update(progress)
+        .where(progress.application_id == application_id)
+        .values(
+            total_hours=progress.total_hours + total_hours,
+            approved_hours=progress.approved_hours + approved_hours,
+            entry_count=progress.entry_count + entry_count,
+            pending_count=progress.pending_count + pending_count,
+            updated_at=datetime.utcnow(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        # Applications created before the progress table existed get their row lazily
+        entries = models.LogbookEntry
+        stats = await session.execute(
+            select(
+                func.coalesce(func.sum(entries.hours), 0),
+                func.coalesce(func.sum(case((entries.approved.is_(True), entries.hours), else_=0)), 0),
+                func.count(),
+                func.coalesce(func.sum(case((entries.approved.is_(True), 0), else_=1)), 0),
+            ).where(entries.application_id == application_id)
+        )
+        total, approved, count, pending = stats.one()
+        session.add(
+            models.ApplicationProgress(
+                application_id=application_id,
+                total_hours=float(total),
+                approved_hours=float(approved),
+                entry_count=count,
+                pending_count=pending,
+            )
+        )
+
+
+async def get_application_progress(
+    session: AsyncSession, application_id: str
+) -> Optional[models.ApplicationProgress]:
+    return await session.get(models.ApplicationProgress, application_id, populate_existing=True)
+
+
+async def get_hours_rollup(
+    session: AsyncSession, application_id: str, *, monthly: bool = False
+) -> List[Tuple[date, float, float, int]]:
+    """(period_start, hours, approved_hours, entries) per ISO week or month, oldest first."""
+    entries = models.LogbookEntry
+    period = (month_start if monthly else week_start)(entries.entry_date).label("period_start")
+    result = await session.execute(
+        select(
+            period,
+            func.sum(entries.hours),
+            func.sum(case((entries.approved.is_(True), entries.hours), else_=0)),
+            func.count(),
+        )
+        .where(entries.application_id == application_id)
+        .group_by(period)
+        .order_by(period)
+    )
+    return [(start, float(hours), float(approved), count) for start, hours, approved, count in result.all()]
+
+
+async def rebuild_application_progress(session: AsyncSession) -> int:
+    """Recompute every progress row from logbook_entries; the reconciliation job."""
+    entries = models.LogbookEntry
+    stats = (
+        select(
+            entries.application_id.label("application_id"),
+            func.sum(entries.hours).label("total_hours"),
+            func.sum(case((entries.approved.is_(True), entries.hours), else_=0)).label("approved_hours"),
+            func.count().label("entry_count"),
+            func.sum(case((entries.approved.is_(True), 0), else_=1)).label("pending_count"),
+        )
+        .group_by(entries.application_id)
+        .subquery()
+    )
+    await session.execute(delete(models.ApplicationProgress))
+    await session.execute(
+        sa.insert(models.ApplicationProgress).from_select(
+            ["application_id", "total_hours", "approved_hours", "entry_count", "pending_count", "updated_at"],
+            select(
+                models.Application.id,
+                func.coalesce(stats.c.total_hours, 0),
+                func.coalesce(stats.c.approved_hours, 0),
+                func.coalesce(stats.c.entry_count, 0),
+                func.coalesce(stats.c.pending_count, 0),
+                sa.literal(datetime.utcnow(), sa.DateTime(timezone=True)),
+            ).outerjoin(stats, stats.c.application_id == models.Application.id),
+        )
+    )
+    await session.commit()
+    result = await session.execute(select(func.count()).select_from(models.ApplicationProgress))
+    return result.scalar_one()
+
+
 async def create_logbook_entry(
     session: AsyncSession,
     logbook_in: LogbookEntryCreate,
     student_id: str,
 ) -> models.LogbookEntry:
-    data = logbook_in.model_dump()
+    data = logbook_in.model_dump(exclude={"id"})
     logbook_entry = models.LogbookEntry(student_id=student_id, **data)
     session.add(logbook_entry)
+    await apply_progress_delta(
+        session, logbook_entry.application_id, *_progress_contribution(logbook_entry.hours, False)
+    )
     await session.commit()
     await session.refresh(logbook_entry)
     return logbook_entry
 
 
+async def get_application_states(
+    session: AsyncSession, application_ids: List[str]
+) -> Dict[str, Tuple[str, str, str]]:
+    """(student_id, industry_status, faculty_status) per application id, without loading relationships."""
+    if not application_ids:
+        return {}
+    result = await session.execute(
+        select(
+            models.Application.id,
+            models.Application.student_id,
+            models.Application.industry_status,
+            models.Application.faculty_status,
+        ).where(models.Application.id.in_(application_ids))
+    )
+    return {row[0]: (row[1], row[2], row[3]) for row in result.all()}
+
+
+def _dialect_insert(session: AsyncSession, table: Any) -> Any:
+    """INSERT construct with ``on_conflict_*`` support for the session's database."""
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(table)
+
+
+async def create_logbook_entries(
+    session: AsyncSession, entries_in: List[LogbookEntryCreate], student_id: str
+) -> List[Optional[str]]:
+    """Insert many entries with one multi-row INSERT and one progress update per application.
+
+    Returns the new id per input entry, or None where a client-generated id already
+    existed and the entry was skipped.
+    """
+    if not entries_in:
+        return []
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": str(entry_in.id or uuid.uuid4()),
+            "student_id": student_id,
+            "approved": False,
+            "version": 1,
+            "created_at": now,
+            "updated_at": now,
+            **entry_in.model_dump(exclude={"id"}),
+        }
+        for entry_in in entries_in
+    ]
+    statement = (
+        _dialect_insert(session, models.LogbookEntry)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["id"])
+        .returning(models.LogbookEntry.id)
+    )
+    inserted = set((await session.execute(statement)).scalars().all())
+
+    pending: Dict[str, List[float]] = {}
+    for row in rows:
+        if row["id"] in inserted:
+            pending.setdefault(row["application_id"], []).append(row["hours"])
+    for application_id, hours in pending.items():
+        await apply_progress_delta(
+            session, application_id, total_hours=sum(hours), entry_count=len(hours), pending_count=len(hours)
+        )
+    await session.commit()
+    return [row["id"] if row["id"] in inserted else None for row in rows]
+
+
+def _same_content(entry: models.LogbookEntry, item: LogbookSyncItem) -> bool:
+    data = item.model_dump(include={"application_id", "entry_date", "hours", "description", "attachments"})
+    return all(getattr(entry, field) == value for field, value in data.items())
+
+
+async def sync_logbook_entries(
+    session: AsyncSession, items: List[LogbookSyncItem], student_id: str
+) -> List[Tuple[SyncStatus, Optional[models.LogbookEntry], Optional[str]]]:
+    """Apply offline drafts with one ``INSERT ... ON CONFLICT (id) DO UPDATE``.
+
+    New ids are inserted at version 1. An existing entry is overwritten only when it
+    belongs to the student and application, is still unapproved and is still at the
+    item's ``base_version``. Anything else is left alone and reported either as
+    UNCHANGED (a replay of what the server already holds) or CONFLICT, together with
+    the server copy. Returns (status, server entry, error) per item, in order.
+    """
+    if not items:
+        return []
+    entries = models.LogbookEntry
+    ids = [str(item.id) for item in items]
+    result = await session.execute(select(entries).where(entries.id.in_(ids)))
+    before = {entry.id: entry for entry in result.scalars().all()}
+    previous_hours = {entry_id: entry.hours for entry_id, entry in before.items()}
+
+    now = datetime.utcnow()
+    rows = []
+    for entry_id, item in zip(ids, items):
+        if item.base_version is not None and entry_id not in before:
+            continue
+        rows.append(
+            {
+                "id": entry_id,
+                "student_id": student_id,
+                "approved": False,
+                "version": (item.base_version or 0) + 1,
+                "created_at": now,
+                "updated_at": now,
+                **item.model_dump(exclude={"id", "base_version"}),
+            }
+        )
+
+    written: set = set()
+    if rows:
+        statement = _dialect_insert(session, entries).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                field: statement.excluded[field]
+                for field in ("entry_date", "hours", "description", "attachments", "version", "updated_at")
+            },
+            where=and_(
+                entries.student_id == statement.excluded.student_id,
+                entries.application_id == statement.excluded.application_id,
+                sa.not_(entries.approved),
+                entries.version == statement.excluded.version - 1,
+            ),
+        ).returning(entries.id)
+        written = set((await session.execute(statement)).scalars().all())
+
+    deltas: Dict[str, List[float]] = {}
+    for row in rows:
+        if row["id"] not in written:
+            continue
+        delta = deltas.setdefault(row["application_id"], [0.0, 0, 0])
+        if row["id"] in previous_hours:
+            delta[0] += row["hours"] - previous_hours[row["id"]]
+        else:
+            delta[0] += row["hours"]
+            delta[1] += 1
+            delta[2] += 1
+    for application_id, (hours, added, pending) in deltas.items():
+        if hours or added:
+            await apply_progress_delta(
+                session, application_id, total_hours=hours, entry_count=added, pending_count=pending
+            )
+    await session.commit()
+
+    result = await session.execute(
+        select(entries).where(entries.id.in_(ids)).execution_options(populate_existing=True)
+    )
+    server = {entry.id: entry for entry in result.scalars().all()}
+    outcomes: List[Tuple[SyncStatus, Optional[models.LogbookEntry], Optional[str]]] = []
+    for entry_id, item in zip(ids, items):
+        entry = server.get(entry_id)
+        if entry is None:
+            outcomes.append((SyncStatus.REJECTED, None, "Logbook entry not found"))
+        elif entry.student_id != student_id:
+            outcomes.append((SyncStatus.REJECTED, None, "Entry id already in use"))
+        elif entry_id in written:
+            status = SyncStatus.UPDATED if entry_id in before else SyncStatus.CREATED
+            outcomes.append((status, entry, None))
+        elif _same_content(entry, item):
+            outcomes.append((SyncStatus.UNCHANGED, entry, None))
+        else:
+            outcomes.append((SyncStatus.CONFLICT, entry, "Entry changed on the server"))
+    return outcomes
+
+
 async def get_logbook_entry(
     session: AsyncSession, logbook_entry_id: str
 ) -> Optional[models.LogbookEntry]:
@@ -387,15 +1130,154 @@ async def list_logbook_entries(
     return list(result.scalars().unique().all())
 
 
+def _review_scope(column, college_id: Optional[str]):
+    """Restrict a student id column to one college's students (no restriction without a college)."""
+    if not college_id:
+        return []
+    return [column.in_(select(models.User.id).where(models.User.college_id == college_id))]
+
+
+async def list_review_queue(
+    session: AsyncSession,
+    *,
+    college_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+) -> Tuple[List[models.LogbookEntry], Optional[str]]:
+    """Unapproved entries oldest first, keyset-paginated on (created_at, id).
+
+    The NOT approved filter matches the ix_logbook_entries_pending partial index.
+    Raises ValueError for a malformed cursor.
+    """
+    entries = models.LogbookEntry
+    query = select(entries).where(sa.not_(entries.approved)).where(*_review_scope(entries.student_id, college_id))
+    if cursor:
+        after_at, after_id = decode_cursor(cursor, 2)
+        try:
+            after_at = datetime.fromisoformat(after_at)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        query = query.where(
+            or_(entries.created_at > after_at, and_(entries.created_at == after_at, entries.id > after_id))
+        )
+    result = await session.execute(query.order_by(entries.created_at, entries.id).limit(limit + 1))
+    items = list(result.scalars().all())
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].created_at.isoformat(), items[-1].id)
+    return items, next_cursor
+
+
+async def count_review_queue(session: AsyncSession, *, college_id: Optional[str] = None) -> int:
+    """Pending entry count from the application_progress counters rather than logbook rows."""
+    progress = models.ApplicationProgress
+    result = await session.execute(
+        select(func.coalesce(func.sum(progress.pending_count), 0))
+        .join(models.Application, models.Application.id == progress.application_id)
+        .where(*_review_scope(models.Application.student_id, college_id))
+    )
+    return result.scalar_one()
+
+
+async def bulk_approve_logbook_entries(
+    session: AsyncSession,
+    *,
+    entry_ids: Optional[List[str]] = None,
+    application_id: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    college_id: Optional[str] = None,
+) -> List[Tuple[str, str, str, float]]:
+    """Approve pending entries in one UPDATE ... RETURNING; returns (id, application_id, student_id, hours).
+
+    Also moves the progress counters, records one timeline row per application and
+    sends each affected student a single notification, all in the same transaction.
+    """
+    entries = models.LogbookEntry
+    statement = (
+        sa.update(entries)
+        .where(sa.not_(entries.approved))
+        .where(*_review_scope(entries.student_id, college_id))
+        .values(approved=True, version=entries.version + 1)
+        .returning(entries.id, entries.application_id, entries.student_id, entries.hours)
+        .execution_options(synchronize_session=False)
+    )
+    if entry_ids is not None:
+        statement = statement.where(entries.id.in_(entry_ids))
+    if application_id is not None:
+        statement = statement.where(entries.application_id == application_id)
+    if start is not None:
+        statement = statement.where(entries.entry_date >= start)
+    if end is not None:
+        statement = statement.where(entries.entry_date <= end)
+    approved = [tuple(row) for row in (await session.execute(statement)).all()]
+
+    by_application: Dict[str, List[float]] = {}
+    by_student: Dict[str, List[Tuple[str, str, float]]] = {}
+    for entry_id, entry_application_id, student_id, hours in approved:
+        by_application.setdefault(entry_application_id, []).append(hours)
+        by_student.setdefault(student_id, []).append((entry_id, entry_application_id, hours))
+
+    for entry_application_id, hours in by_application.items():
+        await apply_progress_delta(
+            session, entry_application_id, approved_hours=sum(hours), pending_count=-len(hours)
+        )
+    for student_id, items in by_student.items():
+        application_ids = list(dict.fromkeys(item[1] for item in items))
+        for entry_application_id in application_ids:
+            count = sum(1 for item in items if item[1] == entry_application_id)
+            record_activity(
+                session,
+                student_id,
+                models.ActivityKind.LOGBOOK_APPROVED,
+                application_id=entry_application_id,
+                detail=f"{count} entries",
+            )
+        hours = sum(item[2] for item in items)
+        session.add(
+            models.Notification(
+                user_id=student_id,
+                title="Logbook entries approved",
+                body=f"{len(items)} logbook entries ({hours:g} hours) were approved.",
+                payload={"entry_ids": [item[0] for item in items], "application_ids": application_ids},
+            )
+        )
+    await session.commit()
+    return approved
+
+
 async def update_logbook_entry(
     session: AsyncSession,
     logbook_entry: models.LogbookEntry,
     logbook_in: LogbookEntryUpdate,
 ) -> models.LogbookEntry:
-    update_data = logbook_in.model_dump(exclude_unset=True)
+    before = _progress_contribution(logbook_entry.hours, logbook_entry.approved)
+    was_approved, previous_comments = logbook_entry.approved, logbook_entry.faculty_comments
+    update_data = logbook_in.model_dump(exclude_unset=True, exclude={"version"})
     for field, value in update_data.items():
         setattr(logbook_entry, field, value)
+    if update_data:
+        logbook_entry.version += 1
+
+    activity = dict(application_id=logbook_entry.application_id, subject_id=logbook_entry.id)
+    if logbook_entry.approved and not was_approved:
+        record_activity(session, logbook_entry.student_id, models.ActivityKind.LOGBOOK_APPROVED, **activity)
+    if logbook_entry.faculty_comments and logbook_entry.faculty_comments != previous_comments:
+        record_activity(
+            session,
+            logbook_entry.student_id,
+            models.ActivityKind.LOGBOOK_COMMENTED,
+            detail=logbook_entry.faculty_comments,
+            **activity,
+        )
 
+    after = _progress_contribution(logbook_entry.hours, logbook_entry.approved)
+    if after != before:
+        await apply_progress_delta(
+            session, logbook_entry.application_id, *(new - old for new, old in zip(after, before))
+        )
     await session.commit()
     await session.refresh(logbook_entry)
     return logbook_entry
@@ -423,8 +1305,18 @@ async def create_credit(
         internship_id=credit_in.internship_id,
         credits_awarded=credit_in.credits_awarded,
         faculty_signed_at=credit_in.faculty_signed_at,
+        term=academic_term((credit_in.faculty_signed_at or datetime.utcnow()).date()),
     )
     session.add(credit)
+    await session.flush()
+    await _record_credit_change(session, credit.student_id, credit.term, credit.credits_awarded, credit.id)
+    record_activity(
+        session,
+        credit.student_id,
+        models.ActivityKind.CREDIT_AWARDED,
+        subject_id=credit.id,
+        detail=str(credit.credits_awarded),
+    )
     await session.commit()
     await session.refresh(credit)
     return credit
@@ -493,31 +1385,376 @@ async def update_credit(
     credit_in: CreditUpdate,
 ) -> models.Credit:
     update_data = credit_in.model_dump(exclude_unset=True)
+    previous, previous_term = credit.credits_awarded, credit.term
     for field, value in update_data.items():
         setattr(credit, field, value)
 
+    if previous_term is None or "faculty_signed_at" in update_data:
+        credit.term = academic_term((credit.faculty_signed_at or datetime.utcnow()).date())
+    if previous_term is None:
+        # Never counted in the ledger: the whole amount is its opening entry
+        await _record_credit_change(session, credit.student_id, credit.term, credit.credits_awarded, credit.id)
+    elif credit.term != previous_term:
+        await _record_credit_change(session, credit.student_id, previous_term, -previous, credit.id)
+        await _record_credit_change(session, credit.student_id, credit.term, credit.credits_awarded, credit.id)
+    else:
+        await _record_credit_change(
+            session, credit.student_id, credit.term, credit.credits_awarded - previous, credit.id
+        )
     await session.commit()
     await session.refresh(credit)
     return credit
 
 
-async def create_report(
+async def _record_credit_change(
+    session: AsyncSession, student_id: str, term: str, delta: int, credit_id: Optional[str] = None
+) -> None:
+    """Move the student's term total by ``delta`` and append the ledger row (no commit)."""
+    if delta == 0:
+        return
+    totals = models.StudentCreditTerm
+    now = datetime.utcnow()
+    statement = _dialect_insert(session, totals).values(
+        student_id=student_id, term=term, credits=delta, updated_at=now
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=["student_id", "term"],
+            set_={"credits": totals.credits + statement.excluded.credits, "updated_at": now},
+        )
+    )
+
+    balance = await session.execute(
+        select(func.coalesce(func.sum(totals.credits), 0)).where(totals.student_id == student_id)
+    )
+    session.add(
+        models.CreditLedgerEntry(
+            student_id=student_id,
+            credit_id=credit_id,
+            term=term,
+            delta=delta,
+            balance=balance.scalar_one(),
+        )
+    )
+
+
+async def get_credit_transcript(session: AsyncSession, student_id: str) -> List[Tuple[str, int]]:
+    """(term, credits) for one student, read from the per-term totals."""
+    result = await session.execute(
+        select(models.StudentCreditTerm.term, models.StudentCreditTerm.credits)
+        .where(models.StudentCreditTerm.student_id == student_id)
+        .where(models.StudentCreditTerm.credits != 0)
+        .order_by(models.StudentCreditTerm.term)
+    )
+    return [(term, credits) for term, credits in result.all()]
+
+
+def _college_credit_terms(college_id: Optional[str], term: Optional[str]):
+    totals = models.StudentCreditTerm
+    query = select(totals).join(models.User, models.User.id == totals.student_id).where(totals.credits != 0)
+    if college_id:
+        query = query.where(models.User.college_id == college_id)
+    if term:
+        query = query.where(totals.term == term)
+    return query
+
+
+async def summarize_college_credits(
+    session: AsyncSession, *, college_id: Optional[str] = None, term: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Per-term credit totals and student counts for a college (or the platform)."""
+    totals = _college_credit_terms(college_id, term).subquery()
+    result = await session.execute(
+        select(
+            totals.c.term,
+            func.sum(totals.c.credits).label("credits"),
+            func.count(func.distinct(totals.c.student_id)).label("students"),
+        )
+        .group_by(totals.c.term)
+        .order_by(totals.c.term)
+    )
+    return [dict(row._mapping) for row in result.all()]
+
+
+async def stream_college_transcript_rows(
     session: AsyncSession,
-    report_in: ReportCreate,
     *,
-    qr_code_token: str,
-) -> models.Report:
+    college_id: Optional[str] = None,
+    term: Optional[str] = None,
+    batch_size: int = 500,
+) -> AsyncIterator[List[Tuple[Any, ...]]]:
+    """Batches of (student_id, name, email, term, credits) rows for a college-wide export.
+
+    Rows come off a server-side cursor ``batch_size`` at a time, so the export never
+    holds the whole college in memory.
+    """
+    totals = _college_credit_terms(college_id, term).subquery()
+    result = await session.stream(
+        select(models.User.id, models.User.name, models.User.email, totals.c.term, totals.c.credits)
+        .join(totals, totals.c.student_id == models.User.id)
+        .order_by(models.User.name, models.User.id, totals.c.term)
+    )
+    async for partition in result.partitions(batch_size):
+        yield [tuple(row) for row in partition]
+
+
+async def reconcile_credit_ledger(session: AsyncSession) -> int:
+    """Rebuild per-term totals from credits and append adjustment rows where the ledger drifted."""
+    result = await session.execute(select(models.Credit).where(models.Credit.term.is_(None)))
+    for credit in result.scalars().all():
+        credit.term = academic_term((credit.faculty_signed_at or datetime.utcnow()).date())
+    await session.flush()
+
+    ledger = models.CreditLedgerEntry
+    latest = (
+        select(ledger.student_id, func.max(ledger.id).label("last_id")).group_by(ledger.student_id).subquery()
+    )
+    balances_result = await session.execute(
+        select(ledger.student_id, ledger.balance).join(latest, latest.c.last_id == ledger.id)
+    )
+    balances = {student_id: balance for student_id, balance in balances_result.all()}
+
+    credits_result = await session.execute(
+        select(models.Credit.student_id, models.Credit.term, func.sum(models.Credit.credits_awarded))
+        .group_by(models.Credit.student_id, models.Credit.term)
+    )
+    terms: Dict[str, Dict[str, int]] = {}
+    for student_id, term, credits in credits_result.all():
+        terms.setdefault(student_id, {})[term] = credits
+
+    await session.execute(delete(models.StudentCreditTerm))
+    adjusted = 0
+    for student_id in set(terms) | set(balances):
+        student_terms = terms.get(student_id, {})
+        for term, credits in student_terms.items():
+            session.add(models.StudentCreditTerm(student_id=student_id, term=term, credits=credits))
+        total = sum(student_terms.values())
+        drift = total - balances.get(student_id, 0)
+        if drift:
+            session.add(
+                models.CreditLedgerEntry(
+                    student_id=student_id,
+                    term=max(student_terms) if student_terms else academic_term(date.today()),
+                    delta=drift,
+                    balance=total,
+                )
+            )
+            adjusted += 1
+    await session.commit()
+    return adjusted
+
+
+async def _issue_report_tokens(session: AsyncSession, reports: List[models.Report]) -> None:
+    """Give new reports (with ids assigned) a signed QR token of the student's current standing."""
+    if not reports:
+        return
+    applications, progress, credit = models.Application, models.ApplicationProgress, models.Credit
+    result = await session.execute(
+        select(
+            applications.id,
+            models.User.id,
+            models.User.name,
+            func.coalesce(func.max(progress.approved_hours), 0),
+            func.coalesce(func.sum(credit.credits_awarded), 0),
+        )
+        .join(models.User, models.User.id == applications.student_id)
+        .outerjoin(progress, progress.application_id == applications.id)
+        .outerjoin(
+            credit,
+            and_(credit.student_id == applications.student_id, credit.internship_id == applications.internship_id),
+        )
+        .where(applications.id.in_([report.application_id for report in reports]))
+        .group_by(applications.id, models.User.id, models.User.name)
+    )
+    standing = {row[0]: row[1:] for row in result.all()}
+    today = date.today()
+    for report in reports:
+        student_id, name, hours, credits = standing[str(report.application_id)]
+        report.qr_code_token = sign_report_token(
+            ReportClaims(
+                report_id=str(report.id),
+                student_id=student_id,
+                student_name=name,
+                credits=credits,
+                approved_hours=hours,
+                issued_on=today,
+            )
+        )
+
+
+async def create_report(session: AsyncSession, report_in: ReportCreate) -> models.Report:
+    """A report with an external ``pdf_url`` is READY at once; without one it is queued for rendering."""
     report = models.Report(
+        id=str(uuid.uuid4()),
         application_id=report_in.application_id,
-        pdf_url=str(report_in.pdf_url),
-        qr_code_token=qr_code_token,
+        pdf_url=str(report_in.pdf_url) if report_in.pdf_url else None,
+        status=(models.ReportStatus.READY if report_in.pdf_url else models.ReportStatus.PENDING).value,
     )
+    await _issue_report_tokens(session, [report])
     session.add(report)
+    await session.flush()
+    if report.status == models.ReportStatus.READY.value:
+        await _record_report_generated(session, report)
     await session.commit()
     await session.refresh(report)
     return report
 
 
+async def _record_report_generated(session: AsyncSession, report: models.Report) -> None:
+    application = await session.get(models.Application, report.application_id)
+    if application is not None:
+        record_activity(
+            session,
+            application.student_id,
+            models.ActivityKind.REPORT_GENERATED,
+            application_id=application.id,
+            subject_id=report.id,
+        )
+
+
+def _stale_report_claim(stale_before: datetime) -> Any:
+    reports = models.Report
+    return and_(
+        reports.status == models.ReportStatus.RENDERING.value,
+        or_(reports.claimed_at.is_(None), reports.claimed_at < stale_before),
+    )
+
+
+async def claim_report(
+    session: AsyncSession, report_id: str, stale_before: datetime
+) -> Optional[models.Report]:
+    """Move a PENDING report (or one claimed before ``stale_before``) to RENDERING.
+
+    None if another worker got there first.
+    """
+    result = await session.execute(
+        sa.update(models.Report)
+        .where(models.Report.id == report_id)
+        .where(or_(models.Report.status == models.ReportStatus.PENDING.value, _stale_report_claim(stale_before)))
+        .values(status=models.ReportStatus.RENDERING.value, error=None, claimed_at=datetime.utcnow())
+        .returning(models.Report.id)
+    )
+    claimed = result.scalar_one_or_none()
+    await session.commit()
+    return await session.get(models.Report, report_id, populate_existing=True) if claimed else None
+
+
+async def complete_report(
+    session: AsyncSession, report: models.Report, *, sha256: str, size: int, pdf_url: str
+) -> models.Report:
+    await register_blob(session, sha256, size, "application/pdf")
+    report.pdf_sha256 = sha256
+    report.pdf_url = pdf_url
+    report.status = models.ReportStatus.READY.value
+    report.generated_at = datetime.utcnow()
+    await _record_report_generated(session, report)
+    await session.commit()
+    await session.refresh(report)
+    return report
+
+
+async def fail_report(session: AsyncSession, report_id: str, error: str) -> None:
+    await session.execute(
+        sa.update(models.Report)
+        .where(models.Report.id == report_id)
+        .values(status=models.ReportStatus.FAILED.value, error=error[:2000])
+    )
+    await session.commit()
+
+
+async def requeue_stale_reports(
+    session: AsyncSession, stale_before: datetime, batch_id: Optional[str] = None
+) -> List[str]:
+    """Put RENDERING reports claimed before ``stale_before`` (of one batch, if given) back to PENDING.
+
+    Returns their ids.
+    """
+    statement = (
+        sa.update(models.Report)
+        .where(_stale_report_claim(stale_before))
+        .values(status=models.ReportStatus.PENDING.value, claimed_at=None)
+        .returning(models.Report.id)
+    )
+    if batch_id is not None:
+        items = select(models.ReportBatchItem.report_id).where(models.ReportBatchItem.batch_id == batch_id)
+        statement = statement.where(models.Report.id.in_(items))
+    requeued = list((await session.execute(statement)).scalars().all())
+    await session.commit()
+    return requeued
+
+
+async def list_pending_report_ids(session: AsyncSession, limit: int = 500) -> List[str]:
+    result = await session.execute(
+        select(models.Report.id)
+        .where(models.Report.status == models.ReportStatus.PENDING.value)
+        .order_by(models.Report.generated_at)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def get_report_context(session: AsyncSession, application_id: str) -> Dict[str, Any]:
+    """Everything the completion report template shows for one application."""
+    application = await get_application(session, application_id)
+    if application is None:
+        raise ValueError("Application not found")
+    student, internship = application.student, application.internship
+
+    college_name = None
+    if student.college_id:
+        college_name = (
+            await session.execute(select(models.College.name).where(models.College.id == student.college_id))
+        ).scalar_one_or_none()
+    enrollment_no = (
+        await session.execute(select(models.Profile.enrollment_no).where(models.Profile.user_id == student.id))
+    ).scalar_one_or_none()
+    organisation = (
+        await session.execute(
+            select(func.coalesce(models.IndustryProfile.company_name, models.User.name))
+            .select_from(models.User)
+            .outerjoin(models.IndustryProfile, models.IndustryProfile.user_id == models.User.id)
+            .where(models.User.id == internship.posted_by)
+        )
+    ).scalar_one_or_none()
+    progress = await session.get(models.ApplicationProgress, application_id)
+    credit = await get_credit_by_student_and_internship(session, student.id, internship.id)
+    entries = (
+        await session.execute(
+            select(models.LogbookEntry.entry_date, models.LogbookEntry.hours, models.LogbookEntry.description)
+            .where(models.LogbookEntry.application_id == application_id)
+            .where(models.LogbookEntry.approved)
+            .order_by(models.LogbookEntry.entry_date, models.LogbookEntry.created_at)
+        )
+    ).all()
+
+    duration_weeks = internship.duration_weeks or DEFAULT_DURATION_WEEKS
+    return {
+        "student": {
+            "name": student.name,
+            "email": student.email,
+            "college": college_name,
+            "college_id": student.college_id,
+            "enrollment_no": enrollment_no,
+        },
+        "internship": {
+            "title": internship.title,
+            "organisation": organisation or "",
+            "start_date": internship.start_date,
+            "duration_weeks": duration_weeks,
+        },
+        "hours": {
+            "total": progress.total_hours if progress else 0.0,
+            "approved": progress.approved_hours if progress else 0.0,
+            "required": float(duration_weeks * HOURS_PER_WEEK),
+        },
+        "credits": credit.credits_awarded if credit else None,
+        "entries": [
+            {"entry_date": entry_date, "hours": hours, "description": description}
+            for entry_date, hours, description in entries
+        ],
+    }
+
+
 async def get_report(session: AsyncSession, report_id: str) -> Optional[models.Report]:
     return await session.get(models.Report, report_id)
 
@@ -593,6 +1830,44 @@ async def get_report_by_token(session: AsyncSession, token: str) -> Optional[mod
     return result.scalars().first()
 
 
+async def get_report_claims(session: AsyncSession, report: models.Report) -> Optional[ReportClaims]:
+    """Current standing behind a report, for tokens issued before reports were signed."""
+    application = await get_application(session, report.application_id)
+    if application is None:
+        return None
+    progress = await session.get(models.ApplicationProgress, application.id)
+    credits = (
+        await session.execute(
+            select(func.coalesce(func.sum(models.Credit.credits_awarded), 0))
+            .where(models.Credit.student_id == application.student_id)
+            .where(models.Credit.internship_id == application.internship_id)
+        )
+    ).scalar_one()
+    return ReportClaims(
+        report_id=str(report.id),
+        student_id=str(application.student_id),
+        student_name=application.student.name,
+        credits=credits,
+        approved_hours=int(round(progress.approved_hours)) if progress else 0,
+        issued_on=report.generated_at.date(),
+    )
+
+
+async def revoke_report(
+    session: AsyncSession, report_id: str, *, revoked_by: str, reason: Optional[str] = None
+) -> None:
+    statement = _dialect_insert(session, models.RevokedReport).values(
+        report_id=report_id, revoked_by=revoked_by, reason=reason, revoked_at=datetime.utcnow()
+    )
+    await session.execute(statement.on_conflict_do_nothing(index_elements=["report_id"]))
+    await session.commit()
+
+
+async def list_revoked_report_ids(session: AsyncSession) -> List[str]:
+    result = await session.execute(select(models.RevokedReport.report_id))
+    return list(result.scalars().all())
+
+
 async def update_report(
     session: AsyncSession,
     report: models.Report,
@@ -610,6 +1885,790 @@ async def update_report(
     return report
 
 
+async def create_report_batch(
+    session: AsyncSession,
+    *,
+    requested_by: str,
+    stale_before: datetime,
+    college_id: Optional[str] = None,
+    internship_id: Optional[str] = None,
+) -> Tuple[models.ReportBatch, List[str]]:
+    """Snapshot the fully approved applications in scope, queueing a report where none is usable.
+
+    An application's latest report is reused unless it FAILED; one stuck in
+    RENDERING since before ``stale_before`` is queued again. Returns the batch
+    and the ids of its reports that still need rendering.
+    """
+    applications = models.Application
+    in_scope = (
+        select(applications.id)
+        .where(applications.industry_status == "APPROVED")
+        .where(applications.faculty_status == "APPROVED")
+        .where(*_application_scope(applications, college_id=college_id))
+    )
+    if internship_id:
+        in_scope = in_scope.where(applications.internship_id == internship_id)
+    application_ids = list((await session.execute(in_scope)).scalars().all())
+
+    reports = models.Report
+    await session.execute(
+        sa.update(reports)
+        .where(reports.application_id.in_(in_scope))
+        .where(_stale_report_claim(stale_before))
+        .values(status=models.ReportStatus.PENDING.value, claimed_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    existing = await session.execute(
+        select(reports.application_id, reports.id, reports.status)
+        .where(reports.application_id.in_(in_scope))
+        .where(reports.status != models.ReportStatus.FAILED.value)
+        .order_by(reports.generated_at)
+    )
+    latest = {application_id: (report_id, report_status) for application_id, report_id, report_status in existing.all()}
+
+    batch = models.ReportBatch(requested_by=requested_by, college_id=college_id, internship_id=internship_id)
+    session.add(batch)
+    queued = [
+        models.Report(id=str(uuid.uuid4()), application_id=application_id, status=models.ReportStatus.PENDING.value)
+        for application_id in application_ids
+        if application_id not in latest
+    ]
+    await _issue_report_tokens(session, queued)
+    session.add_all(queued)
+    await session.flush()
+
+    items = list(latest.values()) + [(report.id, report.status) for report in queued]
+    session.add_all(models.ReportBatchItem(batch_id=batch.id, report_id=report_id) for report_id, _ in items)
+    pending = [report_id for report_id, report_status in items if report_status == models.ReportStatus.PENDING.value]
+    await session.commit()
+    await session.refresh(batch)
+    return batch, pending
+
+
+async def get_report_batch(session: AsyncSession, batch_id: str) -> Optional[models.ReportBatch]:
+    return await session.get(models.ReportBatch, batch_id)
+
+
+async def count_report_batch_statuses(session: AsyncSession, batch_id: str) -> Dict[str, int]:
+    result = await session.execute(
+        select(models.Report.status, func.count())
+        .join(models.ReportBatchItem, models.ReportBatchItem.report_id == models.Report.id)
+        .where(models.ReportBatchItem.batch_id == batch_id)
+        .group_by(models.Report.status)
+    )
+    return {report_status: count for report_status, count in result.all()}
+
+
+async def list_report_batch_files(session: AsyncSession, batch_id: str) -> List[Tuple[Any, ...]]:
+    """(report_id, application_id, status, pdf_sha256, pdf_url, student name, internship title) rows."""
+    reports, applications = models.Report, models.Application
+    result = await session.execute(
+        select(
+            reports.id,
+            reports.application_id,
+            reports.status,
+            reports.pdf_sha256,
+            reports.pdf_url,
+            models.User.name,
+            models.Internship.title,
+        )
+        .join(models.ReportBatchItem, models.ReportBatchItem.report_id == reports.id)
+        .join(applications, applications.id == reports.application_id)
+        .join(models.User, models.User.id == applications.student_id)
+        .join(models.Internship, models.Internship.id == applications.internship_id)
+        .where(models.ReportBatchItem.batch_id == batch_id)
+        .order_by(models.User.name, applications.id)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+# ==================== Analytics Functions ====================
+
+def _application_scope(application, *, college_id: Optional[str] = None, posted_by: Optional[str] = None):
+    """WHERE clauses limiting an Application-like table to a college or a provider's postings."""
+    clauses = []
+    if college_id:
+        clauses.append(
+            application.student_id.in_(select(models.User.id).where(models.User.college_id == college_id))
+        )
+    if posted_by:
+        clauses.append(
+            application.internship_id.in_(
+                select(models.Internship.id).where(models.Internship.posted_by == posted_by)
+            )
+        )
+    return clauses
+
+
+def tracking_status_expression(today: date):
+    """CASE expression classifying an enrolled application as ENROLLED / IN_PROGRESS / COMPLETED.
+
+    Reads the application_progress counters, so the query must outer join that table.
+    """
+    progress = models.ApplicationProgress
+    weeks = func.coalesce(models.Internship.duration_weeks, DEFAULT_DURATION_WEEKS)
+    end_date_passed = and_(
+        models.Internship.start_date.is_not(None),
+        days_between(models.Internship.start_date, sa.literal(today, sa.Date)) >= weeks * 7,
+    )
+    return case(
+        (func.coalesce(progress.entry_count, 0) == 0, TrackingStatus.ENROLLED.value),
+        (
+            and_(
+                progress.pending_count == 0,
+                or_(progress.total_hours >= weeks * HOURS_PER_WEEK, end_date_passed),
+            ),
+            TrackingStatus.COMPLETED.value,
+        ),
+        else_=TrackingStatus.IN_PROGRESS.value,
+    )
+
+
+async def count_tracking_statuses(
+    session: AsyncSession,
+    *,
+    college_id: Optional[str] = None,
+    posted_by: Optional[str] = None,
+    today: Optional[date] = None,
+) -> Dict[TrackingStatus, int]:
+    """Count fully approved applications per tracking status in a single aggregate query."""
+    classified = (
+        select(tracking_status_expression(today or date.today()).label("status"))
+        .select_from(models.Application)
+        .join(models.Internship, models.Application.internship_id == models.Internship.id)
+        .outerjoin(
+            models.ApplicationProgress,
+            models.ApplicationProgress.application_id == models.Application.id,
+        )
+        .where(models.Application.industry_status == "APPROVED")
+        .where(models.Application.faculty_status == "APPROVED")
+        .where(*_application_scope(models.Application, college_id=college_id, posted_by=posted_by))
+        .subquery()
+    )
+    result = await session.execute(
+        select(classified.c.status, func.count()).group_by(classified.c.status)
+    )
+    counts = {status: 0 for status in TrackingStatus}
+    for status, count in result.all():
+        counts[TrackingStatus(status)] = count
+    return counts
+
+
+async def get_platform_metrics(
+    session: AsyncSession,
+    *,
+    college_id: Optional[str] = None,
+    posted_by: Optional[str] = None,
+    today: Optional[date] = None,
+) -> Dict[str, Any]:
+    today = today or date.today()
+    scope = _application_scope(models.Application, college_id=college_id, posted_by=posted_by)
+    credit_scope = _application_scope(models.Credit, college_id=college_id, posted_by=posted_by)
+
+    open_internships = select(func.count()).select_from(models.Internship).where(
+        models.Internship.status == "OPEN"
+    )
+    if posted_by:
+        open_internships = open_internships.where(models.Internship.posted_by == posted_by)
+
+    result = await session.execute(
+        select(
+            open_internships.scalar_subquery().label("internships_open"),
+            select(func.count())
+            .select_from(models.Application)
+            .where(*scope)
+            .scalar_subquery()
+            .label("applications_submitted"),
+            select(func.count())
+            .select_from(models.Application)
+            .where(*scope)
+            .where(
+                or_(models.Application.industry_status == "PENDING", models.Application.faculty_status == "PENDING")
+            )
+            .where(models.Application.industry_status != "REJECTED")
+            .where(models.Application.faculty_status != "REJECTED")
+            .scalar_subquery()
+            .label("applications_pending_review"),
+            select(func.count())
+            .select_from(models.LogbookEntry)
+            .join(models.Application, models.LogbookEntry.application_id == models.Application.id)
+            .where(*scope)
+            .scalar_subquery()
+            .label("logbook_entries"),
+            select(func.coalesce(func.sum(models.LogbookEntry.hours), 0))
+            .select_from(models.LogbookEntry)
+            .join(models.Application, models.LogbookEntry.application_id == models.Application.id)
+            .where(*scope)
+            .where(models.LogbookEntry.entry_date > today - timedelta(days=7))
+            .scalar_subquery()
+            .label("weekly_hours"),
+            select(func.coalesce(func.sum(models.Credit.credits_awarded), 0))
+            .where(*credit_scope)
+            .scalar_subquery()
+            .label("credits_awarded"),
+        )
+    )
+    return dict(result.one()._mapping)
+
+
+def record_activity(
+    session: AsyncSession,
+    student_id: str,
+    kind: models.ActivityKind,
+    *,
+    application_id: Optional[str] = None,
+    subject_id: Optional[str] = None,
+    detail: Optional[str] = None,
+    occurred_at: Optional[datetime] = None,
+) -> None:
+    """Append a timeline row for the student inside the caller's transaction."""
+    session.add(
+        models.StudentActivity(
+            student_id=student_id,
+            kind=kind.value,
+            occurred_at=occurred_at or datetime.utcnow(),
+            application_id=application_id,
+            subject_id=subject_id,
+            detail=detail[:255] if detail else None,
+        )
+    )
+
+
+async def list_student_timeline(
+    session: AsyncSession, student_id: str, *, cursor: Optional[str] = None, limit: int = 20
+) -> Tuple[List[Tuple[models.StudentActivity, Optional[str]]], Optional[str]]:
+    """Newest-first activity with the internship title, keyset-paginated on (occurred_at, id).
+
+    Raises ValueError for a malformed cursor.
+    """
+    activity = models.StudentActivity
+    query = (
+        select(activity, models.Internship.title)
+        .outerjoin(models.Application, models.Application.id == activity.application_id)
+        .outerjoin(models.Internship, models.Internship.id == models.Application.internship_id)
+        .where(activity.student_id == student_id)
+    )
+    if cursor:
+        before_at, before_id = decode_cursor(cursor, 2)
+        try:
+            before_at, before_id = datetime.fromisoformat(before_at), int(before_id)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        query = query.where(
+            or_(
+                activity.occurred_at < before_at,
+                and_(activity.occurred_at == before_at, activity.id < before_id),
+            )
+        )
+    rows = (
+        await session.execute(query.order_by(activity.occurred_at.desc(), activity.id.desc()).limit(limit + 1))
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1][0]
+        next_cursor = encode_cursor(last.occurred_at.isoformat(), last.id)
+    return [(row[0], row[1]) for row in rows], next_cursor
+
+
+async def get_student_dashboard(
+    session: AsyncSession, student_id: str, *, today: Optional[date] = None, notification_limit: int = 5
+) -> Dict[str, Any]:
+    """Home screen summary for a student: one aggregate statement plus the latest notifications."""
+    today = today or date.today()
+    week_start = today - timedelta(days=today.weekday())
+    own_applications = select(models.Application.id).where(models.Application.student_id == student_id)
+    not_rejected = and_(
+        models.Application.industry_status != "REJECTED",
+        models.Application.faculty_status != "REJECTED",
+    )
+
+    result = await session.execute(
+        select(
+            select(func.count())
+            .select_from(models.Application)
+            .where(models.Application.student_id == student_id, not_rejected)
+            .scalar_subquery()
+            .label("active_applications"),
+            select(func.count())
+            .select_from(models.Application)
+            .where(
+                models.Application.student_id == student_id,
+                models.Application.industry_status == "APPROVED",
+                models.Application.faculty_status == "APPROVED",
+            )
+            .scalar_subquery()
+            .label("enrolled_applications"),
+            select(func.coalesce(func.sum(models.LogbookEntry.hours), 0))
+            .where(
+                models.LogbookEntry.application_id.in_(own_applications),
+                models.LogbookEntry.entry_date >= week_start,
+            )
+            .scalar_subquery()
+            .label("hours_this_week"),
+            select(func.coalesce(func.sum(models.Credit.credits_awarded), 0))
+            .where(models.Credit.student_id == student_id)
+            .scalar_subquery()
+            .label("total_credits"),
+            select(func.count())
+            .select_from(models.Notification)
+            .where(models.Notification.user_id == student_id, models.Notification.read.is_(False))
+            .scalar_subquery()
+            .label("unread_notifications"),
+        )
+    )
+    summary = dict(result.one()._mapping)
+
+    notifications = await session.execute(
+        select(models.Notification)
+        .where(models.Notification.user_id == student_id)
+        .order_by(models.Notification.created_at.desc())
+        .limit(notification_limit)
+    )
+    summary["week_start"] = week_start
+    summary["latest_notifications"] = list(notifications.scalars().all())
+    return summary
+
+
+async def get_admin_stats(session: AsyncSession, *, today: Optional[date] = None) -> Dict[str, Any]:
+    """Platform counters for the admin panel: four small GROUP BY queries, no row loading."""
+    today = today or date.today()
+    day_start = datetime.combine(today, datetime.min.time())
+
+    users = await session.execute(
+        select(
+            models.User.role,
+            models.User.is_active,
+            func.count(),
+            func.sum(case((models.User.created_at >= day_start, 1), else_=0)),
+        ).group_by(models.User.role, models.User.is_active)
+    )
+    internships = await session.execute(
+        select(models.Internship.status, func.count()).group_by(models.Internship.status)
+    )
+    industry = await session.execute(
+        select(models.Application.industry_status, func.count()).group_by(models.Application.industry_status)
+    )
+    faculty = await session.execute(
+        select(models.Application.faculty_status, func.count()).group_by(models.Application.faculty_status)
+    )
+
+    users_by_role = {role: {"active": 0, "inactive": 0} for role in models.UserRole}
+    signups_today = 0
+    for role, is_active, count, created_today in users.all():
+        users_by_role[models.UserRole(role)]["active" if is_active else "inactive"] += count
+        signups_today += created_today or 0
+    pending_approvals = sum(
+        users_by_role[role]["inactive"] for role in (models.UserRole.FACULTY, models.UserRole.INDUSTRY)
+    )
+    return {
+        "users": [{"role": role, **counts} for role, counts in users_by_role.items()],
+        "pending_approvals": pending_approvals,
+        "internships_by_status": dict(internships.all()),
+        "applications_by_industry_status": dict(industry.all()),
+        "applications_by_faculty_status": dict(faculty.all()),
+        "signups_today": signups_today,
+    }
+
+
+FUNNEL_JOB = "funnel_snapshots"
+
+
+async def _funnel_internships_to_refresh(
+    session: AsyncSession, since: datetime, today: date
+) -> List[str]:
+    """Internships whose funnel may have changed since ``since``.
+
+    That is any posting with an application or progress row written after ``since``,
+    or flagged by ``mark_funnels_stale`` after it, plus postings whose end date passed
+    in between (they can flip to COMPLETED).
+    """
+    changed_applications = select(models.Application.internship_id).where(models.Application.updated_at > since)
+    flagged = select(models.Internship.id).where(models.Internship.funnel_changed_at > since)
+    changed_progress = (
+        select(models.Application.internship_id)
+        .join(models.ApplicationProgress, models.ApplicationProgress.application_id == models.Application.id)
+        .where(models.ApplicationProgress.updated_at > since)
+    )
+    weeks = func.coalesce(models.Internship.duration_weeks, DEFAULT_DURATION_WEEKS)
+    ended = (
+        select(models.Internship.id)
+        .where(models.Internship.start_date.is_not(None))
+        .where(days_between(models.Internship.start_date, sa.literal(since.date(), sa.Date)) < weeks * 7)
+        .where(days_between(models.Internship.start_date, sa.literal(today, sa.Date)) >= weeks * 7)
+    )
+    result = await session.execute(sa.union(changed_applications, changed_progress, flagged, ended))
+    return [row[0] for row in result.all()]
+
+
+async def mark_funnels_stale(session: AsyncSession, internship_ids) -> None:
+    """Flag internships for the next incremental funnel refresh (no commit).
+
+    For changes that leave no newer application row behind: deleted applications,
+    or a student's college or department changing. ``internship_ids`` may be a
+    list or a select of ids.
+    """
+    await session.execute(
+        sa.update(models.Internship)
+        .where(models.Internship.id.in_(internship_ids))
+        .values(funnel_changed_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def mark_student_funnels_stale(session: AsyncSession, student_id: str) -> None:
+    """Flag every internship the student applied to, e.g. after a college or department move."""
+    await mark_funnels_stale(
+        session, select(models.Application.internship_id).where(models.Application.student_id == student_id)
+    )
+
+
+async def refresh_funnel_snapshots(
+    session: AsyncSession, *, full: bool = False, now: Optional[datetime] = None
+) -> int:
+    """Rebuild funnel snapshot rows for internships touched since the previous run.
+
+    Each affected internship's rows are deleted and re-aggregated with one GROUP BY;
+    ``full`` rebuilds every internship. Returns the number of internships refreshed.
+    """
+    now = now or datetime.utcnow()
+    state = await session.get(models.JobState, FUNNEL_JOB)
+
+    if full or state is None:
+        internship_ids = None
+        await session.execute(delete(models.FunnelSnapshot))
+    else:
+        internship_ids = await _funnel_internships_to_refresh(session, state.last_run_at, now.date())
+        if internship_ids:
+            await session.execute(
+                delete(models.FunnelSnapshot).where(models.FunnelSnapshot.internship_id.in_(internship_ids))
+            )
+
+    if internship_ids is None or internship_ids:
+        both_approved = and_(
+            models.Application.industry_status == "APPROVED",
+            models.Application.faculty_status == "APPROVED",
+        )
+        applied_on = func.date(models.Application.applied_at, type_=sa.Date)
+        department = func.coalesce(models.Profile.department, "")
+        aggregate = (
+            select(
+                applied_on,
+                models.User.college_id,
+                department,
+                models.Application.internship_id,
+                func.count(),
+                func.sum(case((models.Application.industry_status == "APPROVED", 1), else_=0)),
+                func.sum(case((models.Application.faculty_status == "APPROVED", 1), else_=0)),
+                func.sum(case((both_approved, 1), else_=0)),
+                func.sum(
+                    case(
+                        (
+                            and_(
+                                both_approved,
+                                tracking_status_expression(now.date()) == TrackingStatus.COMPLETED.value,
+                            ),
+                            1,
+                        ),
+                        else_=0,
+                    )
+                ),
+                sa.literal(now, sa.DateTime(timezone=True)),
+            )
+            .select_from(models.Application)
+            .join(models.User, models.Application.student_id == models.User.id)
+            .outerjoin(models.Profile, models.Profile.user_id == models.User.id)
+            .join(models.Internship, models.Application.internship_id == models.Internship.id)
+            .outerjoin(
+                models.ApplicationProgress,
+                models.ApplicationProgress.application_id == models.Application.id,
+            )
+            .group_by(applied_on, models.User.college_id, department, models.Application.internship_id)
+        )
+        if internship_ids is not None:
+            aggregate = aggregate.where(models.Application.internship_id.in_(internship_ids))
+        await session.execute(
+            sa.insert(models.FunnelSnapshot).from_select(
+                [
+                    "applied_on",
+                    "college_id",
+                    "department",
+                    "internship_id",
+                    "applied",
+                    "industry_approved",
+                    "faculty_approved",
+                    "enrolled",
+                    "completed",
+                    "refreshed_at",
+                ],
+                aggregate,
+            )
+        )
+
+    if state is None:
+        session.add(models.JobState(name=FUNNEL_JOB, last_run_at=now))
+    else:
+        state.last_run_at = now
+    await session.commit()
+
+    if internship_ids is None:
+        result = await session.execute(select(func.count(func.distinct(models.FunnelSnapshot.internship_id))))
+        return result.scalar_one()
+    return len(internship_ids)
+
+
+async def get_funnel_series(
+    session: AsyncSession,
+    *,
+    college_id: Optional[str] = None,
+    posted_by: Optional[str] = None,
+    department: Optional[str] = None,
+    internship_id: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> List[Dict[str, Any]]:
+    """Daily funnel totals read from analytics_funnel_snapshots only."""
+    snapshot = models.FunnelSnapshot
+    query = select(
+        snapshot.applied_on,
+        func.sum(snapshot.applied).label("applied"),
+        func.sum(snapshot.industry_approved).label("industry_approved"),
+        func.sum(snapshot.faculty_approved).label("faculty_approved"),
+        func.sum(snapshot.enrolled).label("enrolled"),
+        func.sum(snapshot.completed).label("completed"),
+    ).group_by(snapshot.applied_on).order_by(snapshot.applied_on)
+    if college_id:
+        query = query.where(snapshot.college_id == college_id)
+    if posted_by:
+        query = query.where(
+            snapshot.internship_id.in_(select(models.Internship.id).where(models.Internship.posted_by == posted_by))
+        )
+    if department is not None:
+        query = query.where(snapshot.department == department)
+    if internship_id:
+        query = query.where(snapshot.internship_id == internship_id)
+    if start:
+        query = query.where(snapshot.applied_on >= start)
+    if end:
+        query = query.where(snapshot.applied_on <= end)
+    result = await session.execute(query)
+    return [dict(row._mapping) for row in result.all()]
+
+
+BATCH_ANALYTICS_ROWS = 50_000
+
+
+async def run_college_analytics(
+    session: AsyncSession, *, today: Optional[date] = None, batch_rows: int = BATCH_ANALYTICS_ROWS
+) -> int:
+    """Recompute analytics_college_summaries from streamed column chunks; returns applications analysed."""
+    today = today or date.today()
+    enrolled_ids = select(models.Application.id).where(
+        models.Application.industry_status == "APPROVED",
+        models.Application.faculty_status == "APPROVED",
+    )
+
+    applications = batch_analytics.DictionaryEncoder()
+    colleges = batch_analytics.DictionaryEncoder()
+    college_chunks, week_chunks, start_chunks = [], [], []
+    stream = await session.stream(
+        select(
+            models.Application.id,
+            models.User.college_id,
+            models.Internship.duration_weeks,
+            models.Internship.start_date,
+        )
+        .join(models.User, models.User.id == models.Application.student_id)
+        .join(models.Internship, models.Internship.id == models.Application.internship_id)
+        .where(models.Application.id.in_(enrolled_ids))
+        .execution_options(yield_per=batch_rows)
+    )
+    async for rows in stream.partitions():
+        ids, college_ids, durations, start_dates = zip(*rows)
+        applications.encode(ids)
+        college_chunks.append(colleges.encode(college_ids))
+        week_chunks.append(np.fromiter((weeks or DEFAULT_DURATION_WEEKS for weeks in durations), dtype=np.int64))
+        start_chunks.append(
+            np.fromiter(
+                (day.toordinal() if day else batch_analytics.NO_START_DATE for day in start_dates),
+                dtype=np.int64,
+            )
+        )
+
+    totals = batch_analytics.LogbookAccumulator(len(applications))
+    stream = await session.stream(
+        select(models.LogbookEntry.application_id, models.LogbookEntry.hours, models.LogbookEntry.approved)
+        .where(models.LogbookEntry.application_id.in_(enrolled_ids))
+        .execution_options(yield_per=batch_rows)
+    )
+    async for rows in stream.partitions():
+        ids, hours, approved = zip(*rows)
+        totals.add(
+            applications.lookup(ids),
+            np.asarray(hours, dtype=np.float64),
+            np.asarray(approved, dtype=bool),
+        )
+
+    def concat(chunks):
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+    college_codes = concat(college_chunks)
+    status = batch_analytics.classify(
+        entry_count=totals.entry_count,
+        pending_count=totals.pending_count,
+        total_hours=totals.total_hours,
+        duration_weeks=concat(week_chunks),
+        start_ordinal=concat(start_chunks),
+        today_ordinal=today.toordinal(),
+    )
+    per_college = batch_analytics.summarize_groups(college_codes, len(colleges), status, totals.total_hours)
+    (platform,) = batch_analytics.summarize_groups(
+        np.zeros(len(applications), dtype=np.int64), 1, status, totals.total_hours
+    )
+
+    computed_at = datetime.utcnow()
+    await session.execute(delete(models.CollegeAnalyticsSummary))
+    session.add(models.CollegeAnalyticsSummary(college_id=None, computed_at=computed_at, **platform))
+    for college_id, summary in zip(colleges.values, per_college):
+        if college_id is not None:
+            session.add(models.CollegeAnalyticsSummary(college_id=college_id, computed_at=computed_at, **summary))
+    await session.commit()
+    return len(applications)
+
+
+async def list_college_analytics(
+    session: AsyncSession, *, college_id: Optional[str] = None
+) -> List[models.CollegeAnalyticsSummary]:
+    query = select(models.CollegeAnalyticsSummary)
+    if college_id:
+        query = query.where(models.CollegeAnalyticsSummary.college_id == college_id)
+    result = await session.execute(
+        query.order_by(models.CollegeAnalyticsSummary.college_id.is_not(None), models.CollegeAnalyticsSummary.id)
+    )
+    return list(result.scalars().all())
+
+
+# ==================== Upload Functions ====================
+
+async def create_upload_session(
+    session: AsyncSession, upload_in: UploadCreate, owner_id: str
+) -> models.UploadSession:
+    upload = models.UploadSession(owner_id=owner_id, **upload_in.model_dump())
+    session.add(upload)
+    await session.commit()
+    await session.refresh(upload)
+    return upload
+
+
+async def get_upload_session(session: AsyncSession, upload_id: str) -> Optional[models.UploadSession]:
+    return await session.get(models.UploadSession, upload_id)
+
+
+async def register_blob(session: AsyncSession, sha256: str, size: int, content_type: Optional[str]) -> None:
+    """Record a stored blob; a blob seen before keeps its original row. Does not commit."""
+    await session.execute(
+        _dialect_insert(session, models.Blob)
+        .values(sha256=sha256, size=size, content_type=content_type, created_at=datetime.utcnow())
+        .on_conflict_do_nothing(index_elements=["sha256"])
+    )
+
+
+async def complete_upload_session(
+    session: AsyncSession, upload: models.UploadSession, sha256: str
+) -> models.UploadSession:
+    """Point the upload at its blob, registering the blob if this is its first copy."""
+    await register_blob(session, sha256, upload.size, upload.content_type)
+    upload.sha256 = sha256
+    upload.completed_at = datetime.utcnow()
+    await session.commit()
+    await session.refresh(upload)
+    return upload
+
+
+async def get_blob(session: AsyncSession, sha256: str) -> Optional[models.Blob]:
+    return await session.get(models.Blob, sha256)
+
+
+async def can_read_blob(session: AsyncSession, sha256: str, user: models.User) -> bool:
+    """Whether a record ``user`` may see references the blob; admins may read any.
+
+    Users read what they uploaded and their own resumes and attachments; faculty
+    those of their college's students; industry partners those of applicants
+    to their postings.
+    """
+    if user.role == models.UserRole.ADMIN:
+        return True
+    applications, entries, profiles = models.Application, models.LogbookEntry, models.Profile
+    # Attachments are JSON holding the digest as text; sha256 is validated hex, so LIKE is safe
+    attached = sa.cast(entries.attachments, sa.String).like(f"%{sha256}%")
+    references = [
+        select(models.UploadSession.id).where(
+            models.UploadSession.owner_id == user.id, models.UploadSession.sha256 == sha256
+        )
+    ]
+    if user.role == models.UserRole.STUDENT:
+        references += [
+            select(profiles.user_id).where(profiles.user_id == user.id, profiles.resume_sha256 == sha256),
+            select(applications.id).where(applications.student_id == user.id, applications.resume_sha256 == sha256),
+            select(entries.id).where(entries.student_id == user.id, attached),
+        ]
+    else:
+        if user.role == models.UserRole.FACULTY:
+            if not user.college_id:
+                return False
+            visible = select(applications.id).where(*_application_scope(applications, college_id=user.college_id))
+            students = select(models.User.id).where(models.User.college_id == user.college_id)
+        else:
+            visible = select(applications.id).where(*_application_scope(applications, posted_by=user.id))
+            students = select(applications.student_id).where(applications.id.in_(visible))
+        references += [
+            select(profiles.user_id).where(profiles.user_id.in_(students), profiles.resume_sha256 == sha256),
+            select(applications.id).where(applications.id.in_(visible), applications.resume_sha256 == sha256),
+            select(entries.id).where(entries.application_id.in_(visible), attached),
+        ]
+    for statement in references:
+        if (await session.execute(statement.limit(1))).first() is not None:
+            return True
+    return False
+
+
+async def set_profile_resume(
+    session: AsyncSession,
+    user_id: str,
+    *,
+    sha256: str,
+    size: int,
+    content_type: Optional[str],
+    resume_url: str,
+) -> models.Profile:
+    """Make a stored blob the user's resume, creating the profile if needed."""
+    await register_blob(session, sha256, size, content_type)
+    profile = await session.get(models.Profile, user_id)
+    if profile is None:
+        profile = models.Profile(user_id=user_id)
+        session.add(profile)
+    profile.resume_sha256 = sha256
+    profile.resume_url = resume_url
+    await session.commit()
+    await session.refresh(profile)
+    return profile
+
+
+async def delete_stale_upload_sessions(session: AsyncSession, older_than: datetime) -> List[str]:
+    """Drop unfinished uploads started before ``older_than``; returns their ids."""
+    uploads = models.UploadSession
+    result = await session.execute(
+        delete(uploads)
+        .where(uploads.completed_at.is_(None))
+        .where(uploads.created_at < older_than)
+        .returning(uploads.id)
+    )
+    upload_ids = list(result.scalars().all())
+    await session.commit()
+    return upload_ids
+
+
 # ==================== Notification Functions ====================
 
 async def create_notification(
@@ -744,6 +2803,8 @@ async def update_user(session: AsyncSession, user_id: str, user_update) -> model
     
     await session.commit()
     await session.refresh(user)
+    if "is_active" in update_data:
+        admin_stats_cache.clear()
     return user
 
 
@@ -763,19 +2824,37 @@ async def delete_user(session: AsyncSession, user_id: str) -> None:
     for college in colleges_as_coordinator:
         college.coordinator_user_id = None
     
-    # Delete profile if exists
+    # Delete profile (and its skill index rows) if exists
     if user.profile:
+        await session.execute(
+            delete(models.ProfileSkill).where(models.ProfileSkill.user_id == user_id)
+        )
         await session.delete(user.profile)
     
     # Delete industry profile if exists
     if user.industry_profile:
         await session.delete(user.industry_profile)
     
-    # Delete applications
+    # Delete timeline and applications
+    await session.execute(delete(models.StudentActivity).where(models.StudentActivity.student_id == user_id))
     result = await session.execute(
         select(models.Application).where(models.Application.student_id == user_id)
     )
     applications = result.scalars().all()
+    if applications:
+        await mark_funnels_stale(session, list({application.internship_id for application in applications}))
+    await session.execute(
+        delete(models.ApplicationProgress).where(
+            models.ApplicationProgress.application_id.in_([application.id for application in applications])
+        )
+    )
+    await session.execute(
+        delete(models.FunnelSnapshot).where(
+            models.FunnelSnapshot.internship_id.in_(
+                select(models.Internship.id).where(models.Internship.posted_by == user_id)
+            )
+        )
+    )
     for application in applications:
         await session.delete(application)
     
@@ -787,7 +2866,9 @@ async def delete_user(session: AsyncSession, user_id: str) -> None:
     for entry in logbook_entries:
         await session.delete(entry)
     
-    # Delete credits
+    # Delete credits and their ledger
+    await session.execute(delete(models.CreditLedgerEntry).where(models.CreditLedgerEntry.student_id == user_id))
+    await session.execute(delete(models.StudentCreditTerm).where(models.StudentCreditTerm.student_id == user_id))
     result = await session.execute(
         select(models.Credit).where(models.Credit.student_id == user_id)
     )
@@ -809,8 +2890,24 @@ async def delete_user(session: AsyncSession, user_id: str) -> None:
     )
     internships = result.scalars().all()
     for internship in internships:
+        await _clear_internship_similarity(session, internship.id)
+        await session.execute(
+            delete(models.InternshipSkill).where(models.InternshipSkill.internship_id == internship.id)
+        )
         await session.delete(internship)
     
+    await session.execute(
+        sa.update(models.RevokedReport).where(models.RevokedReport.revoked_by == user_id).values(revoked_by=None)
+    )
+
+    # Delete report batches the user requested (the reports themselves belong to applications)
+    batch_ids = select(models.ReportBatch.id).where(models.ReportBatch.requested_by == user_id)
+    await session.execute(delete(models.ReportBatchItem).where(models.ReportBatchItem.batch_id.in_(batch_ids)))
+    await session.execute(delete(models.ReportBatch).where(models.ReportBatch.requested_by == user_id))
+
+    # Delete upload sessions (stored blobs are shared by content and kept)
+    await session.execute(delete(models.UploadSession).where(models.UploadSession.owner_id == user_id))
+
     # Delete audit logs
     result = await session.execute(
         select(models.AuditLog).where(models.AuditLog.user_id == user_id)
@@ -822,3 +2919,6 @@ async def delete_user(session: AsyncSession, user_id: str) -> None:
     # Finally delete the user
     await session.delete(user)
     await session.commit()
+    admin_stats_cache.clear()
+    if internships:
+        internship_facet_cache.clear()
@@ -0,0 +1,67 @@
+import sqlalchemy as sa
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class days_between(FunctionElement):
+    """Whole days from ``start`` to ``end`` (both dates)."""
+
+    type = sa.Integer()
+    inherit_cache = True
+    name = "days_between"
+
+
+@compiles(days_between)
+def _days_between_default(element, compiler, **kw):  # type: ignore[no-untyped-def]
+    start, end = list(element.clauses)
+    return "(%s - %s)" % (compiler.process(end, **kw), compiler.process(start, **kw))
+
+
+@compiles(days_between, "sqlite")
+def _days_between_sqlite(element, compiler, **kw):  # type: ignore[no-untyped-def]
+    start, end = list(element.clauses)
+    return "CAST(julianday(%s) - julianday(%s) AS INTEGER)" % (
+        compiler.process(end, **kw),
+        compiler.process(start, **kw),
+    )
+
+
+class week_start(FunctionElement):
+    """Monday of the ISO week containing ``day`` (a date)."""
+
+    type = sa.Date()
+    inherit_cache = True
+    name = "week_start"
+
+
+@compiles(week_start)
+def _week_start_default(element, compiler, **kw):  # type: ignore[no-untyped-def]
+    (day,) = list(element.clauses)
+    return "CAST(date_trunc('week', %s) AS DATE)" % compiler.process(day, **kw)
+
+
+@compiles(week_start, "sqlite")
+def _week_start_sqlite(element, compiler, **kw):  # type: ignore[no-untyped-def]
+    (day,) = list(element.clauses)
+    day_sql = compiler.process(day, **kw)
+    return "date(%s, '-' || ((CAST(strftime('%%w', %s) AS INTEGER) + 6) %% 7) || ' days')" % (day_sql, day_sql)
+
+
+class month_start(FunctionElement):
+    """First day of the month containing ``day`` (a date)."""
+
+    type = sa.Date()
+    inherit_cache = True
+    name = "month_start"
+
+
+@compiles(month_start)
+def _month_start_default(element, compiler, **kw):  # type: ignore[no-untyped-def]
+    (day,) = list(element.clauses)
+    return "CAST(date_trunc('month', %s) AS DATE)" % compiler.process(day, **kw)
+
+
+@compiles(month_start, "sqlite")
+def _month_start_sqlite(element, compiler, **kw):  # type: ignore[no-untyped-def]
+    (day,) = list(element.clauses)
+    return "date(%s, 'start of month')" % compiler.process(day, **kw)
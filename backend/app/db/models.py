@@ -17,6 +17,23 @@ class UserRole(str, Enum):
     ADMIN = "ADMIN"
 
 
+class ActivityKind(str, Enum):
+    APPLIED = "APPLIED"
+    INDUSTRY_APPROVED = "INDUSTRY_APPROVED"
+    FACULTY_APPROVED = "FACULTY_APPROVED"
+    LOGBOOK_APPROVED = "LOGBOOK_APPROVED"
+    LOGBOOK_COMMENTED = "LOGBOOK_COMMENTED"
+    CREDIT_AWARDED = "CREDIT_AWARDED"
+    REPORT_GENERATED = "REPORT_GENERATED"
+
+
+class ReportStatus(str, Enum):
+    PENDING = "PENDING"
+    RENDERING = "RENDERING"
+    READY = "READY"
+    FAILED = "FAILED"
+
+
 class College(Base):
     __tablename__ = "colleges"
 
@@ -41,6 +58,7 @@ class College(Base):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (sa.Index("ix_users_role_active", "role", "is_active"),)
 
     id: Mapped[str] = mapped_column(GUID, primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(sa.String(255), nullable=False)
@@ -49,7 +67,9 @@ class User(Base):
     role: Mapped[UserRole] = mapped_column(sa.Enum(UserRole, name="userrole"), nullable=False)
     phone: Mapped[Optional[str]] = mapped_column(sa.String(20), nullable=True)
     university: Mapped[Optional[str]] = mapped_column(sa.String(255), nullable=True)
-    college_id: Mapped[Optional[str]] = mapped_column(GUID, sa.ForeignKey("colleges.id"), nullable=True)
+    college_id: Mapped[Optional[str]] = mapped_column(
+        GUID, sa.ForeignKey("colleges.id"), nullable=True, index=True
+    )
     email_verified: Mapped[bool] = mapped_column(sa.Boolean, default=False, nullable=False)
     is_active: Mapped[bool] = mapped_column(sa.Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -79,20 +99,30 @@ class Profile(Base):
     __tablename__ = "profiles"
 
     user_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("users.id"), primary_key=True)
-    college: Mapped[Optional[str]] = mapped_column(sa.String(255), nullable=True)
+    college: Mapped[Optional[str]] = mapped_column(sa.String(255), nullable=True, index=True)
     enrollment_no: Mapped[Optional[str]] = mapped_column(sa.String(100))
-    course: Mapped[Optional[str]] = mapped_column(sa.String(255))
-    year: Mapped[Optional[str]] = mapped_column(sa.String(50))
+    course: Mapped[Optional[str]] = mapped_column(sa.String(255), index=True)
+    year: Mapped[Optional[str]] = mapped_column(sa.String(50), index=True)
     designation: Mapped[Optional[str]] = mapped_column(sa.String(255))
     department: Mapped[Optional[str]] = mapped_column(sa.String(255))
     faculty_id: Mapped[Optional[str]] = mapped_column(sa.String(100))
     skills: Mapped[Optional[dict]] = mapped_column(JSONType, nullable=True)
     resume_url: Mapped[Optional[str]] = mapped_column(sa.String(512), nullable=True)
+    resume_sha256: Mapped[Optional[str]] = mapped_column(sa.String(64), sa.ForeignKey("blobs.sha256"))
     verified: Mapped[bool] = mapped_column(sa.Boolean, default=False, nullable=False)
 
     user: Mapped[User] = relationship("User", back_populates="profile")
 
 
+# Lower-cased copy of Profile.skills, used as an inverted index for talent search
+class ProfileSkill(Base):
+    __tablename__ = "profile_skills"
+    __table_args__ = (sa.Index("ix_profile_skills_skill_user", "skill", "user_id"),)
+
+    user_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("profiles.user_id"), primary_key=True)
+    skill: Mapped[str] = mapped_column(sa.String(100), primary_key=True)
+
+
 class IndustryProfile(Base):
     __tablename__ = "industry_profiles"
 
@@ -121,18 +151,58 @@ class Internship(Base):
     start_date: Mapped[Optional[date]] = mapped_column(sa.Date)
     duration_weeks: Mapped[Optional[int]] = mapped_column(sa.Integer)
     credits: Mapped[Optional[int]] = mapped_column(sa.Integer)
-    posted_by: Mapped[str] = mapped_column(GUID, sa.ForeignKey("users.id"))
-    status: Mapped[str] = mapped_column(sa.String(50), default="OPEN", nullable=False)
+    posted_by: Mapped[str] = mapped_column(GUID, sa.ForeignKey("users.id"), index=True)
+    status: Mapped[str] = mapped_column(sa.String(50), default="OPEN", nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
     )
+    # Touched when the funnel changes without an application write (deleted
+    # applications, applicants moving college or department)
+    funnel_changed_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True), index=True)
+
+
+# Lower-cased copy of Internship.skills, used to filter and facet the catalogue in SQL
+class InternshipSkill(Base):
+    __tablename__ = "internship_skills"
+    __table_args__ = (sa.Index("ix_internship_skills_skill_internship", "skill", "internship_id"),)
+
+    internship_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("internships.id"), primary_key=True)
+    skill: Mapped[str] = mapped_column(sa.String(100), primary_key=True)
+
+
+class InternshipSignature(Base):
+    __tablename__ = "internship_signatures"
+
+    internship_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("internships.id"), primary_key=True)
+    signature: Mapped[list] = mapped_column(JSONType, nullable=False)
+
+
+class InternshipLshBucket(Base):
+    __tablename__ = "internship_lsh_buckets"
+
+    band: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
+    bucket: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    internship_id: Mapped[str] = mapped_column(
+        GUID, sa.ForeignKey("internships.id"), primary_key=True, index=True
+    )
+
+
+class InternshipNeighbour(Base):
+    __tablename__ = "internship_neighbours"
+    __table_args__ = (sa.Index("ix_internship_neighbours_rank", "internship_id", "similarity"),)
+
+    internship_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("internships.id"), primary_key=True)
+    neighbour_id: Mapped[str] = mapped_column(
+        GUID, sa.ForeignKey("internships.id"), primary_key=True, index=True
+    )
+    similarity: Mapped[float] = mapped_column(sa.Float, nullable=False)
 
 
 class Application(Base):
     __tablename__ = "applications"
 
     id: Mapped[str] = mapped_column(GUID, primary_key=True, default=uuid.uuid4)
-    internship_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("internships.id"))
+    internship_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("internships.id"), index=True)
     student_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("users.id"))
     applied_at: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
@@ -140,15 +210,44 @@ class Application(Base):
     industry_status: Mapped[str] = mapped_column(sa.String(50), default="PENDING", nullable=False)
     faculty_status: Mapped[str] = mapped_column(sa.String(50), default="PENDING", nullable=False)
     resume_snapshot_url: Mapped[Optional[str]] = mapped_column(sa.String(512))
+    # The profile resume at apply time; blobs are immutable, so this is the snapshot
+    resume_sha256: Mapped[Optional[str]] = mapped_column(sa.String(64), sa.ForeignKey("blobs.sha256"))
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True
+    )
     
     # Relationships
     student: Mapped["User"] = sa.orm.relationship("User", foreign_keys=[student_id])
     internship: Mapped["Internship"] = sa.orm.relationship("Internship", foreign_keys=[internship_id])
 
 
+# Running logbook totals per application, kept in step with every logbook write
+class ApplicationProgress(Base):
+    __tablename__ = "application_progress"
+
+    application_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("applications.id"), primary_key=True)
+    total_hours: Mapped[float] = mapped_column(sa.Float, default=0, nullable=False)
+    approved_hours: Mapped[float] = mapped_column(sa.Float, default=0, nullable=False)
+    entry_count: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    pending_count: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True
+    )
+
 
 class LogbookEntry(Base):
     __tablename__ = "logbook_entries"
+    __table_args__ = (
+        sa.Index("ix_logbook_entries_application_date", "application_id", "entry_date"),
+        # Review queue: only unapproved entries, oldest first
+        sa.Index(
+            "ix_logbook_entries_pending",
+            "created_at",
+            "id",
+            postgresql_where=sa.text("NOT approved"),
+            sqlite_where=sa.text("NOT approved"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(GUID, primary_key=True, default=uuid.uuid4)
     application_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("applications.id"))
@@ -159,9 +258,14 @@ class LogbookEntry(Base):
     attachments: Mapped[Optional[dict]] = mapped_column(JSONType)
     faculty_comments: Mapped[Optional[str]] = mapped_column(sa.Text)
     approved: Mapped[bool] = mapped_column(sa.Boolean, default=False, nullable=False)
+    # Bumped on every change so offline clients can detect conflicting edits
+    version: Mapped[int] = mapped_column(sa.Integer, default=1, server_default="1", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
 
 
 class Credit(Base):
@@ -172,6 +276,35 @@ class Credit(Base):
     internship_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("internships.id"))
     credits_awarded: Mapped[int] = mapped_column(sa.Integer, nullable=False)
     faculty_signed_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True))
+    term: Mapped[Optional[str]] = mapped_column(sa.String(20), index=True)
+
+
+# Append-only history of credit changes; balance is the student's running total after the row
+class CreditLedgerEntry(Base):
+    __tablename__ = "credit_ledger"
+    __table_args__ = (sa.Index("ix_credit_ledger_student", "student_id", "id"),)
+
+    id: Mapped[int] = mapped_column(sa.Integer, primary_key=True, autoincrement=True)
+    student_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("users.id"), nullable=False)
+    credit_id: Mapped[Optional[str]] = mapped_column(GUID, sa.ForeignKey("credits.id"), nullable=True)
+    term: Mapped[str] = mapped_column(sa.String(20), nullable=False)
+    delta: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    balance: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
+    )
+
+
+# Credits per student and academic term, kept in step with the ledger
+class StudentCreditTerm(Base):
+    __tablename__ = "student_credit_terms"
+
+    student_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("users.id"), primary_key=True)
+    term: Mapped[str] = mapped_column(sa.String(20), primary_key=True, index=True)
+    credits: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
 
 
 class Report(Base):
@@ -179,13 +312,71 @@ class Report(Base):
 
     id: Mapped[str] = mapped_column(GUID, primary_key=True, default=uuid.uuid4)
     application_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("applications.id"), nullable=False)
-    pdf_url: Mapped[str] = mapped_column(sa.String(512), nullable=False)
+    # External URL, or the download path of a server-rendered PDF once READY
+    pdf_url: Mapped[Optional[str]] = mapped_column(sa.String(512), nullable=True)
+    pdf_sha256: Mapped[Optional[str]] = mapped_column(sa.String(64), sa.ForeignKey("blobs.sha256"))
+    status: Mapped[str] = mapped_column(
+        sa.String(20), default=ReportStatus.READY.value, server_default=ReportStatus.READY.value, nullable=False, index=True
+    )
+    error: Mapped[Optional[str]] = mapped_column(sa.Text)
+    # When a worker moved it to RENDERING; an old claim means the worker died
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True))
     generated_at: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
     )
     qr_code_token: Mapped[str] = mapped_column(sa.String(255), unique=True, nullable=False)
 
 
+# Revoked reports; verifiers treat their QR tokens as no longer valid
+class RevokedReport(Base):
+    __tablename__ = "revoked_reports"
+
+    report_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("reports.id"), primary_key=True)
+    revoked_by: Mapped[Optional[str]] = mapped_column(GUID, sa.ForeignKey("users.id"))
+    reason: Mapped[Optional[str]] = mapped_column(sa.String(255))
+    revoked_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
+    )
+
+
+# A cohort export: the reports of every fully approved application in scope at request time
+class ReportBatch(Base):
+    __tablename__ = "report_batches"
+
+    id: Mapped[str] = mapped_column(GUID, primary_key=True, default=uuid.uuid4)
+    requested_by: Mapped[str] = mapped_column(GUID, sa.ForeignKey("users.id"), nullable=False)
+    college_id: Mapped[Optional[str]] = mapped_column(GUID, sa.ForeignKey("colleges.id"))
+    internship_id: Mapped[Optional[str]] = mapped_column(GUID, sa.ForeignKey("internships.id"))
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
+    )
+
+
+class ReportBatchItem(Base):
+    __tablename__ = "report_batch_items"
+
+    batch_id: Mapped[str] = mapped_column(
+        GUID, sa.ForeignKey("report_batches.id", ondelete="CASCADE"), primary_key=True
+    )
+    report_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("reports.id"), primary_key=True)
+
+
+# Append-only student feed, written in the same transaction as the change it describes
+class StudentActivity(Base):
+    __tablename__ = "student_activity"
+    __table_args__ = (sa.Index("ix_student_activity_feed", "student_id", "occurred_at", "id"),)
+
+    id: Mapped[int] = mapped_column(sa.Integer, primary_key=True, autoincrement=True)
+    student_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("users.id"), nullable=False)
+    kind: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
+    )
+    application_id: Mapped[Optional[str]] = mapped_column(GUID, sa.ForeignKey("applications.id"), nullable=True)
+    subject_id: Mapped[Optional[str]] = mapped_column(GUID, nullable=True)
+    detail: Mapped[Optional[str]] = mapped_column(sa.String(255))
+
+
 class Notification(Base):
     __tablename__ = "notifications"
 
@@ -200,6 +391,84 @@ class Notification(Base):
     )
 
 
+# Tracking and hours summary per college (college_id NULL = whole platform), rebuilt by jobs.py
+class CollegeAnalyticsSummary(Base):
+    __tablename__ = "analytics_college_summaries"
+
+    id: Mapped[int] = mapped_column(sa.Integer, primary_key=True, autoincrement=True)
+    college_id: Mapped[Optional[str]] = mapped_column(
+        GUID, sa.ForeignKey("colleges.id"), nullable=True, index=True
+    )
+    enrolled_total: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    enrolled: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    in_progress: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    completed: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    completion_rate: Mapped[float] = mapped_column(sa.Float, default=0, nullable=False)
+    mean_hours: Mapped[float] = mapped_column(sa.Float, default=0, nullable=False)
+    p50_hours: Mapped[float] = mapped_column(sa.Float, default=0, nullable=False)
+    p90_hours: Mapped[float] = mapped_column(sa.Float, default=0, nullable=False)
+    hour_histogram: Mapped[list] = mapped_column(JSONType, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
+    )
+
+
+# Application funnel per (applied day, college, department, internship), rebuilt by jobs.py
+class FunnelSnapshot(Base):
+    __tablename__ = "analytics_funnel_snapshots"
+    __table_args__ = (
+        sa.Index("ix_funnel_snapshots_college_day", "college_id", "applied_on"),
+        sa.Index("ix_funnel_snapshots_internship", "internship_id"),
+    )
+
+    id: Mapped[int] = mapped_column(sa.Integer, primary_key=True, autoincrement=True)
+    applied_on: Mapped[date] = mapped_column(sa.Date, nullable=False)
+    college_id: Mapped[Optional[str]] = mapped_column(GUID, sa.ForeignKey("colleges.id"), nullable=True)
+    department: Mapped[str] = mapped_column(sa.String(255), default="", nullable=False)
+    internship_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("internships.id"), nullable=False)
+    applied: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    industry_approved: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    faculty_approved: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    enrolled: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    completed: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
+
+
+class JobState(Base):
+    __tablename__ = "job_state"
+
+    name: Mapped[str] = mapped_column(sa.String(100), primary_key=True)
+    last_run_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
+
+
+# Uploaded file contents, stored once per SHA-256 (see app/services/uploads.py)
+class Blob(Base):
+    __tablename__ = "blobs"
+
+    sha256: Mapped[str] = mapped_column(sa.String(64), primary_key=True)
+    size: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    content_type: Mapped[Optional[str]] = mapped_column(sa.String(255))
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False
+    )
+
+
+# A resumable upload; bytes received so far live in a part file until completion
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+
+    id: Mapped[str] = mapped_column(GUID, primary_key=True, default=uuid.uuid4)
+    owner_id: Mapped[str] = mapped_column(GUID, sa.ForeignKey("users.id"), nullable=False, index=True)
+    filename: Mapped[str] = mapped_column(sa.String(255), nullable=False)
+    content_type: Mapped[Optional[str]] = mapped_column(sa.String(255))
+    size: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    sha256: Mapped[Optional[str]] = mapped_column(sa.String(64), sa.ForeignKey("blobs.sha256"))
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True))
+
+
 class AuditLog(Base):
     __tablename__ = "audit_logs"
 
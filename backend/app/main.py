@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -12,12 +14,25 @@ from app.api.v1 import (
     reports,
     notifications,
     admin,
+    analytics,
+    me,
+    uploads,
 )
 from app.core.config import settings
+from app.services.report_renderer import get_renderer_pool
+from app.services.report_templates import get_report_templates
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile report templates and read their assets before the first request
+    get_report_templates().preload()
+    yield
+    await get_renderer_pool().close()
 
 
 def create_application() -> FastAPI:
-    app = FastAPI(title=settings.APP_NAME, version="0.1.0")
+    app = FastAPI(title=settings.APP_NAME, version="0.1.0", lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -37,6 +52,9 @@ def create_application() -> FastAPI:
     app.include_router(reports.router, prefix=settings.API_V1_PREFIX)
     app.include_router(notifications.router, prefix=settings.API_V1_PREFIX)
     app.include_router(admin.router, prefix=settings.API_V1_PREFIX, tags=["admin"])
+    app.include_router(analytics.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(me.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(uploads.router, prefix=settings.API_V1_PREFIX)
 
     @app.get("/health", tags=["health"])
     async def health_check():
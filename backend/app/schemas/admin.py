@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from app.db.models import UserRole
+
+
+class RoleCounts(BaseModel):
+    role: UserRole
+    active: int
+    inactive: int
+
+
+class AdminStats(BaseModel):
+    users: List[RoleCounts]
+    pending_approvals: int
+    internships_by_status: Dict[str, int]
+    applications_by_industry_status: Dict[str, int]
+    applications_by_faculty_status: Dict[str, int]
+    signups_today: int
+    generated_at: datetime
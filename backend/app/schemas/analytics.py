@@ -0,0 +1,62 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TrackingSummary(BaseModel):
+    total_enrolled: int
+    enrolled: int
+    in_progress: int
+    completed: int
+    enrolled_percentage: float
+    in_progress_percentage: float
+    completed_percentage: float
+
+
+class MetricsResponse(BaseModel):
+    internships_open: int
+    applications_submitted: int
+    applications_pending_review: int
+    logbook_entries: int
+    weekly_hours: float
+    credits_awarded: int
+    tracking: TrackingSummary
+
+
+class FunnelCounts(BaseModel):
+    applied: int = 0
+    industry_approved: int = 0
+    faculty_approved: int = 0
+    enrolled: int = 0
+    completed: int = 0
+
+
+class FunnelPoint(FunnelCounts):
+    applied_on: date
+
+
+class FunnelResponse(BaseModel):
+    totals: FunnelCounts
+    series: List[FunnelPoint]
+
+
+class HourBucket(BaseModel):
+    bucket: str
+    count: int
+
+
+class CollegeAnalyticsRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    college_id: Optional[str] = Field(..., description="None for the platform-wide row")
+    enrolled_total: int
+    enrolled: int
+    in_progress: int
+    completed: int
+    completion_rate: float
+    mean_hours: float
+    p50_hours: float
+    p90_hours: float
+    hour_histogram: List[HourBucket]
+    computed_at: datetime
@@ -1,8 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.core.config import settings
 
 
 class ApplicationDecision(str, Enum):
@@ -60,7 +62,53 @@ class ApplicationRead(BaseModel):
     industry_status: ApplicationDecision
     faculty_status: ApplicationDecision
     resume_snapshot_url: Optional[str]
+    resume_sha256: Optional[str] = None
     
     # Nested relations
     student: Optional[StudentInfo] = None
     internship: Optional[InternshipInfo] = None
+
+    @model_validator(mode="after")
+    def _resume_download_url(self) -> "ApplicationRead":
+        if self.resume_snapshot_url is None and self.resume_sha256:
+            self.resume_snapshot_url = f"{settings.API_V1_PREFIX}/applications/{self.id}/resume"
+        return self
+
+
+class ApplicantSort(str, Enum):
+    FIT = "fit"
+    APPLIED_AT = "applied_at"
+
+
+class RankedApplicantRead(ApplicationRead):
+    fit_score: float = Field(..., ge=0, le=1, description="Share of the internship's skills the applicant lists")
+
+
+class ApplicationProgressRead(BaseModel):
+    application_id: str
+    total_hours: float
+    approved_hours: float
+    entry_count: int
+    pending_count: int
+    required_hours: float
+    tracking_status: Optional[str] = Field(
+        default=None, description="ENROLLED, IN_PROGRESS or COMPLETED once both approvals are in"
+    )
+
+
+class RollupPeriod(str, Enum):
+    WEEK = "week"
+    MONTH = "month"
+
+
+class HoursRollup(BaseModel):
+    """Logged hours per ISO week or month as parallel arrays, one element per period."""
+
+    application_id: str
+    period: RollupPeriod
+    period_start: List[date]
+    label: List[str] = Field(..., description="ISO week (2026-W02) or month (2026-01)")
+    hours: List[float]
+    approved_hours: List[float]
+    pending_hours: List[float]
+    entries: List[int]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -27,3 +27,24 @@ class CreditRead(BaseModel):
     internship_id: str
     credits_awarded: int
     faculty_signed_at: Optional[datetime]
+
+
+class TermCredits(BaseModel):
+    term: str = Field(..., description="Academic term, e.g. 2026-27-S1")
+    credits: int
+
+
+class CreditTranscript(BaseModel):
+    student_id: str
+    total_credits: int
+    terms: List[TermCredits]
+
+
+class CollegeTermCredits(TermCredits):
+    students: int
+
+
+class CollegeCreditSummary(BaseModel):
+    college_id: Optional[str]
+    total_credits: int
+    terms: List[CollegeTermCredits]
@@ -0,0 +1,39 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from app.db.models import ActivityKind, UserRole
+from app.schemas.notification import NotificationRead
+
+
+class DashboardUser(BaseModel):
+    id: str
+    name: str
+    role: UserRole
+
+
+class StudentDashboard(BaseModel):
+    user: DashboardUser
+    active_applications: int
+    enrolled_applications: int
+    week_start: date
+    hours_this_week: float
+    total_credits: int
+    unread_notifications: int
+    latest_notifications: List[NotificationRead]
+
+
+class TimelineEvent(BaseModel):
+    id: int
+    kind: ActivityKind
+    occurred_at: datetime
+    application_id: Optional[str] = None
+    internship_title: Optional[str] = None
+    subject_id: Optional[str] = None
+    detail: Optional[str] = None
+
+
+class TimelinePage(BaseModel):
+    items: List[TimelineEvent]
+    next_cursor: Optional[str] = None
@@ -3,6 +3,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.search import FacetCount
+
 
 class InternshipBase(BaseModel):
     title: str = Field(..., max_length=255)
@@ -50,3 +52,37 @@ class InternshipRead(BaseModel):
     status: str
     posted_by: str
     created_at: datetime
+
+
+class SimilarInternshipRead(InternshipRead):
+    similarity: float = Field(..., ge=0, le=1, description="Estimated Jaccard similarity of skills and title")
+
+
+class InternshipFacets(BaseModel):
+    remote: List[FacetCount] = []
+    credits: List[FacetCount] = []
+    locations: List[FacetCount] = []
+    skills: List[FacetCount] = []
+
+
+class InternshipListWithFacets(BaseModel):
+    items: List[InternshipRead]
+    facets: InternshipFacets
+
+
+class ReviewStatusCounts(BaseModel):
+    pending: int = 0
+    approved: int = 0
+    rejected: int = 0
+
+
+class InternshipSummaryRead(BaseModel):
+    internship_id: str
+    title: str
+    status: str
+    applications: int
+    industry_status: ReviewStatusCounts
+    faculty_status: ReviewStatusCounts
+    enrolled: int
+    total_hours: float
+    pending_reviews: int = Field(..., description="Logbook entries awaiting approval")
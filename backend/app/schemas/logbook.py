@@ -1,12 +1,16 @@
 from datetime import date, datetime
+from enum import Enum
 from typing import List, Optional
+from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class Attachment(BaseModel):
     name: str = Field(..., max_length=255)
     url: str = Field(..., max_length=512)
+    sha256: Optional[str] = Field(default=None, pattern=r"^[0-9a-f]{64}$", description="Blob of a native upload")
+    size: Optional[int] = Field(default=None, ge=0)
 
 
 class LogbookEntryBase(BaseModel):
@@ -18,7 +22,9 @@ class LogbookEntryBase(BaseModel):
 
 
 class LogbookEntryCreate(LogbookEntryBase):
-    pass
+    id: Optional[UUID] = Field(
+        default=None, description="Client-generated id; retrying with the same id returns the original entry"
+    )
 
 
 class LogbookEntryUpdate(BaseModel):
@@ -28,6 +34,7 @@ class LogbookEntryUpdate(BaseModel):
     attachments: Optional[List[Attachment]] = None
     approved: Optional[bool] = None
     faculty_comments: Optional[str] = Field(default=None, max_length=1000)
+    version: Optional[int] = Field(default=None, description="Version the change was based on; 409 if stale")
 
 
 class LogbookEntryRead(BaseModel):
@@ -42,4 +49,96 @@ class LogbookEntryRead(BaseModel):
     attachments: Optional[List[Attachment]]
     faculty_comments: Optional[str]
     approved: bool
+    version: int
     created_at: datetime
+    updated_at: datetime
+
+
+class LogbookReviewPage(BaseModel):
+    items: List[LogbookEntryRead]
+    next_cursor: Optional[str] = None
+
+
+class LogbookReviewCount(BaseModel):
+    pending: int
+
+
+class LogbookBulkApprove(BaseModel):
+    """Either explicit entry ids, or an application with an optional date range."""
+
+    ids: Optional[List[str]] = Field(default=None, max_length=1000)
+    application_id: Optional[str] = None
+    start: Optional[date] = None
+    end: Optional[date] = None
+
+    @model_validator(mode="after")
+    def _one_selector(self) -> "LogbookBulkApprove":
+        if (self.ids is None) == (self.application_id is None):
+            raise ValueError("Provide either ids or application_id")
+        if self.ids is not None and (self.start or self.end):
+            raise ValueError("start/end only apply together with application_id")
+        return self
+
+
+class LogbookBulkApproveResult(BaseModel):
+    approved: int
+    approved_hours: float
+    entry_ids: List[str]
+
+
+class LogbookBatchCreate(BaseModel):
+    entries: List[LogbookEntryCreate] = Field(..., min_length=1, max_length=500)
+
+    @model_validator(mode="after")
+    def _unique_ids(self) -> "LogbookBatchCreate":
+        ids = [entry.id for entry in self.entries if entry.id is not None]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Each entry id may appear only once per batch")
+        return self
+
+
+class LogbookBatchItemResult(BaseModel):
+    index: int = Field(..., description="Position of the entry in the request")
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class LogbookBatchResult(BaseModel):
+    created: int
+    results: List[LogbookBatchItemResult]
+
+
+class SyncStatus(str, Enum):
+    CREATED = "CREATED"
+    UPDATED = "UPDATED"
+    UNCHANGED = "UNCHANGED"
+    CONFLICT = "CONFLICT"
+    REJECTED = "REJECTED"
+
+
+class LogbookSyncItem(LogbookEntryBase):
+    id: UUID = Field(..., description="Client-generated id of the draft")
+    base_version: Optional[int] = Field(
+        default=None, ge=1, description="Server version the edit was made against; omit for new drafts"
+    )
+
+
+class LogbookSyncRequest(BaseModel):
+    entries: List[LogbookSyncItem] = Field(..., min_length=1, max_length=500)
+
+    @model_validator(mode="after")
+    def _unique_ids(self) -> "LogbookSyncRequest":
+        if len({entry.id for entry in self.entries}) != len(self.entries):
+            raise ValueError("Each entry id may appear only once per sync")
+        return self
+
+
+class LogbookSyncItemResult(BaseModel):
+    id: str
+    status: SyncStatus
+    error: Optional[str] = None
+    entry: Optional[LogbookEntryRead] = Field(default=None, description="Server copy after the sync")
+
+
+class LogbookSyncResult(BaseModel):
+    results: List[LogbookSyncItemResult]
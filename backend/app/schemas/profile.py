@@ -35,6 +35,7 @@ class ProfileRead(BaseModel):
     faculty_id: Optional[str] = None
     skills: Optional[dict] = None
     resume_url: Optional[str] = None
+    resume_sha256: Optional[str] = None
     verified: bool = False
     
     model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
@@ -6,7 +6,9 @@ from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 class ReportCreate(BaseModel):
     application_id: str = Field(..., description="Application associated with the report")
-    pdf_url: HttpUrl
+    pdf_url: Optional[HttpUrl] = Field(
+        default=None, description="Externally hosted PDF; omit to have the server render the report"
+    )
 
 
 class ReportUpdate(BaseModel):
@@ -18,6 +20,51 @@ class ReportRead(BaseModel):
 
     id: str
     application_id: str
-    pdf_url: HttpUrl
+    pdf_url: Optional[str]
+    status: str
+    error: Optional[str] = None
     generated_at: datetime
     qr_code_token: str
+
+
+class ReportStatusRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    status: str
+    error: Optional[str] = None
+    pdf_url: Optional[str] = None
+    generated_at: datetime
+
+
+class ReportBatchCreate(BaseModel):
+    college_id: Optional[str] = Field(default=None, description="College whose students to include (admin only)")
+    internship_id: Optional[str] = Field(default=None, description="Only applications to this internship")
+
+
+class ReportBatchRead(BaseModel):
+    id: str
+    college_id: Optional[str] = None
+    internship_id: Optional[str] = None
+    created_at: datetime
+    status: str = Field(..., description="RENDERING until every report is READY or FAILED, then READY")
+    total: int
+    ready: int
+    failed: int
+    progress: float = Field(..., ge=0, le=1, description="Share of reports that have finished rendering")
+    download_url: Optional[str] = None
+
+
+class ReportRevoke(BaseModel):
+    reason: Optional[str] = Field(default=None, max_length=255)
+
+
+class ReportVerification(BaseModel):
+    id: str = Field(..., description="Report id")
+    student_id: str
+    student_name: str
+    credits: int
+    approved_hours: int
+    issued_on: date
+    revoked: bool
+    verify_url: str = Field(..., description="Human-readable verification page")
@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from app.schemas.profile import ProfileRead
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class StudentFacets(BaseModel):
+    course: List[FacetCount] = []
+    year: List[FacetCount] = []
+    college: List[FacetCount] = []
+    skills: List[FacetCount] = []
+
+
+class StudentSearchHit(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    name: str
+    email: str
+    college_id: Optional[str]
+    profile: Optional[ProfileRead] = None
+
+
+class StudentSearchPage(BaseModel):
+    items: List[StudentSearchHit]
+    next_cursor: Optional[str] = None
+    facets: Optional[StudentFacets] = None
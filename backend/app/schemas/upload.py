@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+SHA256_PATTERN = r"^[0-9a-f]{64}$"
+
+
+class UploadCreate(BaseModel):
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: Optional[str] = Field(default=None, max_length=255)
+    size: int = Field(..., gt=0, description="Total size in bytes")
+
+
+class UploadComplete(BaseModel):
+    sha256: Optional[str] = Field(
+        default=None, pattern=SHA256_PATTERN, description="Expected digest; the upload fails if it differs"
+    )
+
+
+class UploadRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    filename: str
+    content_type: Optional[str]
+    size: int
+    offset: int = Field(..., description="Bytes received; the next chunk starts here")
+    sha256: Optional[str] = None
+    url: Optional[str] = Field(default=None, description="Download path once the upload is complete")
+    created_at: datetime
+    completed_at: Optional[datetime] = None
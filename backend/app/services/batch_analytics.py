@@ -0,0 +1,129 @@
+"""Vectorized end-of-term analytics over column arrays (``python jobs.py batch-analytics``).
+
+Rows are streamed out of the database in chunks and folded into NumPy columns:
+ids are dictionary-encoded to dense integer codes, logbook entries are reduced
+per application with ``bincount`` as each chunk arrives, so memory grows with
+the number of applications rather than the number of logbook rows.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Sequence
+
+import numpy as np
+
+from app.services.tracking import HOURS_PER_WEEK, TrackingStatus
+
+
+STATUS_ORDER = (TrackingStatus.ENROLLED, TrackingStatus.IN_PROGRESS, TrackingStatus.COMPLETED)
+HOUR_BUCKET_EDGES = np.array([40, 80, 160, 320], dtype=np.float64)
+HOUR_BUCKET_LABELS = ("0-40", "40-80", "80-160", "160-320", "320+")
+NO_START_DATE = np.iinfo(np.int64).min
+
+
+class DictionaryEncoder:
+    """Assigns dense integer codes to values in first-seen order."""
+
+    def __init__(self) -> None:
+        self.codes: Dict[Hashable, int] = {}
+        self.values: List[Hashable] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, values: Sequence[Hashable]) -> np.ndarray:
+        codes = self.codes
+        result = np.empty(len(values), dtype=np.int64)
+        for index, value in enumerate(values):
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(self.values)
+                self.values.append(value)
+            result[index] = code
+        return result
+
+    def lookup(self, values: Iterable[Hashable]) -> np.ndarray:
+        """Codes for already-encoded values; unknown values map to -1."""
+        codes = self.codes
+        return np.fromiter((codes.get(value, -1) for value in values), dtype=np.int64)
+
+
+class LogbookAccumulator:
+    """Per-application logbook totals built up chunk by chunk."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.total_hours = np.zeros(size, dtype=np.float64)
+        self.approved_hours = np.zeros(size, dtype=np.float64)
+        self.entry_count = np.zeros(size, dtype=np.int64)
+        self.pending_count = np.zeros(size, dtype=np.int64)
+
+    def add(self, application_codes: np.ndarray, hours: np.ndarray, approved: np.ndarray) -> None:
+        known = application_codes >= 0
+        codes, hours, approved = application_codes[known], hours[known], approved[known]
+        self.total_hours += np.bincount(codes, weights=hours, minlength=self.size)
+        self.approved_hours += np.bincount(codes, weights=np.where(approved, hours, 0.0), minlength=self.size)
+        self.entry_count += np.bincount(codes, minlength=self.size)
+        self.pending_count += np.bincount(codes, weights=(~approved).astype(np.float64), minlength=self.size).astype(
+            np.int64
+        )
+
+
+def classify(
+    *,
+    entry_count: np.ndarray,
+    pending_count: np.ndarray,
+    total_hours: np.ndarray,
+    duration_weeks: np.ndarray,
+    start_ordinal: np.ndarray,
+    today_ordinal: int,
+) -> np.ndarray:
+    """Index into STATUS_ORDER per application; same rules as ``tracking.classify``."""
+    has_start = start_ordinal != NO_START_DATE
+    end_passed = has_start & (today_ordinal - np.where(has_start, start_ordinal, 0) >= duration_weeks * 7)
+    completed = (pending_count == 0) & ((total_hours >= duration_weeks * HOURS_PER_WEEK) | end_passed)
+    return np.where(entry_count == 0, 0, np.where(completed, 2, 1)).astype(np.int8)
+
+
+def summarize_groups(
+    group_codes: np.ndarray, group_count: int, status: np.ndarray, total_hours: np.ndarray
+) -> List[Dict[str, Any]]:
+    """Status counts, completion rate, hour percentiles and an hour histogram per group."""
+    statuses = len(STATUS_ORDER)
+    by_status = np.bincount(group_codes * statuses + status, minlength=group_count * statuses).reshape(
+        group_count, statuses
+    )
+    totals = by_status.sum(axis=1)
+    hour_sums = np.bincount(group_codes, weights=total_hours, minlength=group_count)
+
+    buckets = np.searchsorted(HOUR_BUCKET_EDGES, total_hours, side="right")
+    bucket_count = len(HOUR_BUCKET_LABELS)
+    histogram = np.bincount(group_codes * bucket_count + buckets, minlength=group_count * bucket_count).reshape(
+        group_count, bucket_count
+    )
+
+    # Sort hours within each group once, then read percentiles off contiguous slices
+    order = np.lexsort((total_hours, group_codes))
+    sorted_hours = total_hours[order]
+    bounds = np.concatenate(([0], np.cumsum(totals)))
+
+    summaries = []
+    for group in range(group_count):
+        total = int(totals[group])
+        hours = sorted_hours[bounds[group] : bounds[group + 1]]
+        p50, p90 = np.percentile(hours, [50, 90]) if total else (0.0, 0.0)
+        summaries.append(
+            {
+                "enrolled_total": total,
+                "enrolled": int(by_status[group, 0]),
+                "in_progress": int(by_status[group, 1]),
+                "completed": int(by_status[group, 2]),
+                "completion_rate": round(float(by_status[group, 2]) / total, 4) if total else 0.0,
+                "mean_hours": round(float(hour_sums[group]) / total, 2) if total else 0.0,
+                "p50_hours": round(float(p50), 2),
+                "p90_hours": round(float(p90), 2),
+                "hour_histogram": [
+                    {"bucket": label, "count": int(count)}
+                    for label, count in zip(HOUR_BUCKET_LABELS, histogram[group])
+                ],
+            }
+        )
+    return summaries
@@ -0,0 +1,15 @@
+from typing import Optional, Tuple
+
+from app.services.cache import TTLCache
+
+
+CREDIT_BUCKETS: Tuple[Tuple[int, Optional[int], str], ...] = (
+    (0, 2, "0-2"),
+    (3, 4, "3-4"),
+    (5, 6, "5-6"),
+    (7, None, "7+"),
+)
+NO_CREDITS = "unspecified"
+
+# Facets for a filter combination; cleared whenever a posting is written
+internship_facet_cache = TTLCache(ttl_seconds=300, maxsize=512)
@@ -0,0 +1,58 @@
+import re
+import zlib
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+NUM_PERMUTATIONS = 64
+BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(20261019)
+_A = _rng.integers(1, int(_PRIME), size=NUM_PERMUTATIONS, dtype=np.uint64)
+_B = _rng.integers(0, int(_PRIME), size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+_STOPWORDS = {"a", "an", "and", "for", "in", "of", "on", "the", "to", "with", "intern", "internship"}
+
+
+def internship_tokens(title: Optional[str], skills: Optional[Iterable[str]]) -> Set[str]:
+    """Shingles for a posting: ``skill:<name>`` for each skill plus ``title:<word>`` tokens."""
+    tokens = {f"skill:{str(skill).strip().lower()}" for skill in skills or [] if str(skill).strip()}
+    for word in _TOKEN_RE.findall((title or "").lower()):
+        word = word.strip(".")
+        if word and word not in _STOPWORDS:
+            tokens.add(f"title:{word}")
+    return tokens
+
+
+def signature(tokens: Iterable[str]) -> List[int]:
+    """MinHash signature with ``NUM_PERMUTATIONS`` universal hashes ``(a * x + b) mod p``.
+
+    Token hashes use crc32 so signatures are stable across processes. An empty token
+    set has no signature.
+    """
+    hashes = np.fromiter(
+        (zlib.crc32(token.encode("utf-8")) for token in tokens), dtype=np.uint64
+    ) % _PRIME
+    if hashes.size == 0:
+        return []
+    permuted = (np.outer(hashes, _A) + _B) % _PRIME
+    return permuted.min(axis=0).astype(np.int64).tolist()
+
+
+def band_keys(sig: List[int]) -> List[Tuple[int, int]]:
+    """(band, bucket) pairs for LSH; postings sharing any pair are candidate neighbours."""
+    keys = []
+    for band in range(BANDS):
+        rows = sig[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        bucket = zlib.crc32(np.asarray(rows, dtype=np.int64).tobytes())
+        keys.append((band, bucket))
+    return keys
+
+
+def estimate_similarity(left: List[int], right: List[int]) -> float:
+    """Estimated Jaccard similarity: the share of matching signature positions."""
+    return float(np.mean(np.asarray(left) == np.asarray(right)))
@@ -0,0 +1,212 @@
+"""HTML to PDF conversion for server-side reports.
+
+Renderers are expensive to start (a headless Chromium takes about a second),
+so a :class:`RendererPool` keeps up to ``size`` of them warm and lends them out
+one render at a time. ``REPORT_RENDERER`` picks the implementation:
+
+* ``chromium`` - pyppeteer driving headless Chromium; full CSS support.
+* ``basic`` - a pure-Python fallback that lays the document's text out on
+  plain A4 pages. No browser needed, so it is what tests use.
+* ``auto`` - Chromium when it starts, otherwise the basic renderer.
+"""
+
+import asyncio
+import logging
+import textwrap
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Awaitable, Callable, List, Optional
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+BLOCK_TAGS = {"br", "div", "h1", "h2", "h3", "h4", "li", "p", "section", "table", "tr", "header", "footer"}
+SKIP_TAGS = {"head", "script", "style", "title"}
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 in points
+LINE_HEIGHT, MARGIN, FONT_SIZE = 14, 50, 10
+LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT
+WRAP_COLUMNS = 95
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: List[str] = []
+        self._current: List[str] = []
+        self._skipping = 0
+
+    def _flush(self) -> None:
+        text = " ".join("".join(self._current).split())
+        if text:
+            self.lines.append(text)
+        self._current = []
+
+    def handle_starttag(self, tag, attrs):  # type: ignore[no-untyped-def]
+        if tag in SKIP_TAGS:
+            self._skipping += 1
+        elif tag in BLOCK_TAGS:
+            self._flush()
+        elif tag in ("td", "th"):
+            self._current.append("   ")
+
+    def handle_endtag(self, tag):  # type: ignore[no-untyped-def]
+        if tag in SKIP_TAGS:
+            self._skipping = max(0, self._skipping - 1)
+        elif tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):  # type: ignore[no-untyped-def]
+        if not self._skipping:
+            self._current.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+
+def html_to_lines(html: str) -> List[str]:
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    lines: List[str] = []
+    for line in parser.lines:
+        lines.extend(textwrap.wrap(line, WRAP_COLUMNS) or [""])
+    return lines
+
+
+def _pdf_string(text: str) -> bytes:
+    encoded = text.encode("latin-1", "replace")
+    return b"(" + encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def text_pdf(lines: List[str]) -> bytes:
+    """A minimal PDF 1.4 document showing ``lines`` in Helvetica, paginated."""
+    pages = [lines[start:start + LINES_PER_PAGE] for start in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    objects: List[bytes] = [b"", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page_lines in pages:
+        stream = b"BT /F1 %d Tf %d TL %d %d Td " % (FONT_SIZE, LINE_HEIGHT, MARGIN, PAGE_HEIGHT - MARGIN)
+        stream += b"".join(_pdf_string(line) + b" Tj T* " for line in page_lines) + b"ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents %d 0 R >>" % (PAGE_WIDTH, PAGE_HEIGHT, content_id)
+        )
+        page_ids.append(len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_at = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_at)
+    return bytes(output)
+
+
+class Renderer(ABC):
+    async def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def render(self, html: str) -> bytes:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+
+class BasicRenderer(Renderer):
+    async def render(self, html: str) -> bytes:
+        return await asyncio.to_thread(lambda: text_pdf(html_to_lines(html)))
+
+
+class ChromiumRenderer(Renderer):
+    """One headless browser with a page kept open between renders."""
+
+    def __init__(self) -> None:
+        self._browser = None
+        self._page = None
+
+    async def start(self) -> None:
+        from pyppeteer import launch
+
+        self._browser = await launch(
+            headless=True,
+            args=["--no-sandbox", "--disable-dev-shm-usage"],
+            handleSIGINT=False,
+            handleSIGTERM=False,
+            handleSIGHUP=False,
+        )
+        self._page = await self._browser.newPage()
+
+    async def render(self, html: str) -> bytes:
+        await self._page.setContent(html)
+        return await self._page.pdf({"format": "A4", "printBackground": True})
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = self._page = None
+
+
+async def start_renderer(kind: str) -> Renderer:
+    if kind in ("chromium", "auto"):
+        renderer = ChromiumRenderer()
+        try:
+            await renderer.start()
+            return renderer
+        except Exception:
+            if kind == "chromium":
+                raise
+            logger.warning("Chromium unavailable; rendering reports with the basic renderer", exc_info=True)
+    renderer = BasicRenderer()
+    await renderer.start()
+    return renderer
+
+
+class RendererPool:
+    """At most ``size`` started renderers, reused across renders."""
+
+    def __init__(self, factory: Callable[[], Awaitable[Renderer]], size: int) -> None:
+        self._factory = factory
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[Renderer] = []
+        self.started = 0
+
+    async def render(self, html: str) -> bytes:
+        async with self._slots:
+            renderer: Optional[Renderer] = self._idle.pop() if self._idle else None
+            if renderer is None:
+                renderer = await self._factory()
+                self.started += 1
+            try:
+                pdf = await renderer.render(html)
+            except Exception:
+                # A crashed browser is not returned to the pool
+                await renderer.close()
+                raise
+            self._idle.append(renderer)
+            return pdf
+
+    async def close(self) -> None:
+        while self._idle:
+            await self._idle.pop().close()
+
+
+@lru_cache()
+def _pool(kind: str, size: int) -> RendererPool:
+    return RendererPool(lambda: start_renderer(kind), size)
+
+
+def get_renderer_pool() -> RendererPool:
+    return _pool(settings.REPORT_RENDERER, settings.REPORT_RENDERER_POOL_SIZE)
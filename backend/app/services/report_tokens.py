@@ -0,0 +1,127 @@
+"""Signed QR tokens for report verification.
+
+A token carries what a verifier needs to see: the report and student ids, the
+student's name, credits and approved hours as of issue, and the issue date. It
+is signed with HMAC-SHA256, so ``GET /reports/qr/{token}`` can check it without
+touching the database. The only shared state is the revocation list, which
+each worker reloads at most every ``REVOCATION_TTL_SECONDS``.
+
+Layout (then URL-safe base64 without padding)::
+
+    version:1 | report_id:16 | student_id:16 | credits:2 | hours:2 | issued_day:4 | name:<=48 | mac:16
+"""
+
+import base64
+import hashlib
+import hmac
+import io
+import struct
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import FrozenSet, Optional
+
+import segno
+
+from app.core.config import settings
+from app.services.cache import TTLCache
+
+
+TOKEN_VERSION = 1
+MAC_BYTES = 16
+NAME_BYTES = 48
+REVOCATION_TTL_SECONDS = 60
+_HEADER = struct.Struct(">B16s16sHHI")
+_EPOCH = date(1970, 1, 1)
+
+# Reloaded from revoked_reports at most once a minute per worker; cleared on revoke
+revocation_cache = TTLCache(ttl_seconds=REVOCATION_TTL_SECONDS, maxsize=1)
+# Verification pages keyed by (token, revoked), so a revocation is never served from cache
+verification_page_cache = TTLCache(ttl_seconds=300, maxsize=4096)
+# QR images keyed by (token, format, encoded URL); a token's image never changes
+qr_image_cache = TTLCache(ttl_seconds=24 * 3600, maxsize=1024)
+
+
+@dataclass(frozen=True)
+class ReportClaims:
+    report_id: str
+    student_id: str
+    student_name: str
+    credits: int
+    approved_hours: int
+    issued_on: date
+
+
+def _signing_key() -> bytes:
+    secret = settings.REPORT_TOKEN_SECRET or settings.SECRET_KEY
+    return hmac.new(secret.encode(), b"report-qr-token", hashlib.sha256).digest()
+
+
+def _mac(payload: bytes) -> bytes:
+    return hmac.new(_signing_key(), payload, hashlib.sha256).digest()[:MAC_BYTES]
+
+
+def _clamp(value: float) -> int:
+    return max(0, min(0xFFFF, int(round(value))))
+
+
+def sign_report_token(claims: ReportClaims) -> str:
+    name = claims.student_name.encode()[:NAME_BYTES].decode(errors="ignore").encode()
+    payload = _HEADER.pack(
+        TOKEN_VERSION,
+        uuid.UUID(str(claims.report_id)).bytes,
+        uuid.UUID(str(claims.student_id)).bytes,
+        _clamp(claims.credits),
+        _clamp(claims.approved_hours),
+        (claims.issued_on - _EPOCH).days,
+    ) + name
+    return base64.urlsafe_b64encode(payload + _mac(payload)).rstrip(b"=").decode()
+
+
+def verify_report_token(token: str) -> ReportClaims:
+    """Claims of a genuine token; raises ValueError for anything else (including legacy tokens)."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Malformed report token") from exc
+    if len(raw) < _HEADER.size + MAC_BYTES:
+        raise ValueError("Malformed report token")
+    payload, mac = raw[:-MAC_BYTES], raw[-MAC_BYTES:]
+    if not hmac.compare_digest(mac, _mac(payload)):
+        raise ValueError("Invalid report token signature")
+    version, report_id, student_id, credits, hours, issued_day = _HEADER.unpack_from(payload)
+    if version != TOKEN_VERSION:
+        raise ValueError("Unsupported report token version")
+    return ReportClaims(
+        report_id=str(uuid.UUID(bytes=report_id)),
+        student_id=str(uuid.UUID(bytes=student_id)),
+        student_name=payload[_HEADER.size:].decode(errors="replace"),
+        credits=credits,
+        approved_hours=hours,
+        issued_on=_EPOCH + timedelta(days=issued_day),
+    )
+
+
+def cached_revocations() -> Optional[FrozenSet[str]]:
+    return revocation_cache.get("report_ids")
+
+
+def remember_revocations(report_ids: FrozenSet[str]) -> None:
+    revocation_cache.set("report_ids", report_ids)
+
+
+def forget_revocations() -> None:
+    revocation_cache.clear()
+    verification_page_cache.clear()
+
+
+def qr_image(token: str, url: str, kind: str) -> bytes:
+    """A ``png`` or ``svg`` QR code encoding ``url``, cached per token."""
+    key = (token, kind, url)
+    image = qr_image_cache.get(key)
+    if image is None:
+        buffer = io.BytesIO()
+        segno.make(url, error="m").save(buffer, kind=kind, scale=4, border=2)
+        image = buffer.getvalue()
+        qr_image_cache.set(key, image)
+    return image
@@ -0,0 +1,137 @@
+"""Server-side completion reports: jinja2 HTML, rendered to PDF off the request path.
+
+``generate_report`` is what background tasks and ``jobs.py render-reports`` run.
+It claims a PENDING report, renders it through the shared renderer pool and
+stores the PDF as a content-addressed blob. A claim older than
+``REPORT_RENDER_TIMEOUT_SECONDS`` belongs to a worker that died, so the report
+may be claimed again.
+"""
+
+import asyncio
+import csv
+import io
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.db import crud, models
+from app.services import uploads
+from app.services.report_renderer import get_renderer_pool
+from app.services.report_templates import get_report_templates
+from app.services.report_tokens import ReportClaims
+from app.services.storage import get_storage
+from app.services.zipstream import stream_zip
+
+
+logger = logging.getLogger(__name__)
+
+COMPLETION_TEMPLATE = "reports/completion.html"
+HEADER_TEMPLATE = "reports/_header.html"
+VERIFY_TEMPLATE = "reports/verify.html"
+
+
+def render_report_html(context: Dict[str, Any], report: models.Report) -> str:
+    templates = get_report_templates()
+    return templates.render(
+        COMPLETION_TEMPLATE,
+        **context,
+        header=templates.fragment(HEADER_TEMPLATE, college=context["student"]["college"]),
+        report_id=report.id,
+        generated_at=datetime.utcnow(),
+        verify_path=report_verify_url(report.qr_code_token),
+    )
+
+
+def render_verification_page(claims: ReportClaims, revoked: bool) -> str:
+    return get_report_templates().render(VERIFY_TEMPLATE, claims=claims, revoked=revoked)
+
+
+def report_verify_url(qr_token: str) -> str:
+    return f"{settings.API_V1_PREFIX}/reports/verify/{qr_token}"
+
+
+def report_pdf_url(report_id: str) -> str:
+    return f"{settings.API_V1_PREFIX}/reports/{report_id}/pdf"
+
+
+def batch_download_url(batch_id: str) -> str:
+    return f"{settings.API_V1_PREFIX}/reports/batches/{batch_id}/download"
+
+
+async def _one_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+def stale_claim_cutoff() -> datetime:
+    return datetime.utcnow() - timedelta(seconds=settings.REPORT_RENDER_TIMEOUT_SECONDS)
+
+
+async def generate_report(sessionmaker: async_sessionmaker, report_id: str) -> str:
+    """Render one queued report; returns its final status."""
+    async with sessionmaker() as session:
+        report = await crud.claim_report(session, report_id, stale_claim_cutoff())
+        if report is None:
+            current = await crud.get_report(session, report_id)
+            return current.status if current is not None else models.ReportStatus.FAILED.value
+        try:
+            context = await crud.get_report_context(session, report.application_id)
+            pdf = await get_renderer_pool().render(render_report_html(context, report))
+            sha256, size = await uploads.store_stream(_one_chunk(pdf), len(pdf), "application/pdf")
+            await crud.complete_report(session, report, sha256=sha256, size=size, pdf_url=report_pdf_url(report.id))
+        except Exception as exc:
+            logger.exception("Rendering report %s failed", report_id)
+            await session.rollback()
+            await crud.fail_report(session, report_id, f"{type(exc).__name__}: {exc}")
+            return models.ReportStatus.FAILED.value
+    return models.ReportStatus.READY.value
+
+
+async def generate_reports(sessionmaker: async_sessionmaker, report_ids: List[str]) -> Dict[str, int]:
+    """Render several reports concurrently, as many at a time as there are pooled renderers."""
+    slots = asyncio.Semaphore(settings.REPORT_RENDERER_POOL_SIZE)
+
+    async def bounded(report_id: str) -> str:
+        async with slots:
+            return await generate_report(sessionmaker, report_id)
+
+    statuses = await asyncio.gather(*(bounded(report_id) for report_id in report_ids))
+    counts: Dict[str, int] = {}
+    for status in statuses:
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+def _archive_name(student_name: str, application_id: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", student_name).strip("-") or "student"
+    return f"{slug}-{str(application_id)[:8]}.pdf"
+
+
+def _manifest_csv(rows: List[Tuple[Any, ...]], names: Dict[str, str]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["student", "internship", "application_id", "report_id", "status", "file", "external_url"])
+    for report_id, application_id, report_status, _, pdf_url, student_name, title in rows:
+        external = pdf_url if report_status == models.ReportStatus.READY.value and report_id not in names else ""
+        writer.writerow([student_name, title, application_id, report_id, report_status, names.get(report_id, ""), external])
+    return buffer.getvalue().encode()
+
+
+def stream_batch_zip(rows: List[Tuple[Any, ...]]) -> AsyncIterator[bytes]:
+    """A deflated ZIP of a batch's rendered PDFs plus ``manifest.csv``, built while it streams.
+
+    ``rows`` come from ``crud.list_report_batch_files``. Reports that failed, or
+    that point at an externally hosted PDF, are only listed in the manifest.
+    """
+    storage = get_storage()
+    names: Dict[str, str] = {}
+    members = []
+    for report_id, application_id, report_status, sha256, _, student_name, _ in rows:
+        if report_status == models.ReportStatus.READY.value and sha256:
+            names[report_id] = _archive_name(student_name, application_id)
+            members.append((names[report_id], storage.iter_chunks(uploads.blob_key(sha256))))
+    members.append(("manifest.csv", _one_chunk(_manifest_csv(rows, names))))
+    return stream_zip(members)
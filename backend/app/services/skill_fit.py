@@ -0,0 +1,95 @@
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.cache import TTLCache
+
+
+FIT_SCORE_TTL_SECONDS = 300
+
+
+def _normalize(skills: Optional[Iterable[str]]) -> List[str]:
+    return [term for term in (str(skill).strip().lower() for skill in skills or []) if term]
+
+
+def score_skill_overlap(
+    required_skills: Optional[Sequence[str]],
+    applicant_skills: Sequence[Optional[Iterable[str]]],
+) -> np.ndarray:
+    """Fraction of the required skills each applicant covers, as a float array.
+
+    Skills are mapped onto a vocabulary built from the required skills, so the
+    overlap for the whole batch is one row sum over a boolean matrix.
+    """
+    vocabulary = {skill: index for index, skill in enumerate(dict.fromkeys(_normalize(required_skills)))}
+    if not vocabulary or not applicant_skills:
+        return np.zeros(len(applicant_skills), dtype=np.float64)
+
+    matrix = np.zeros((len(applicant_skills), len(vocabulary)), dtype=bool)
+    for row, skills in enumerate(applicant_skills):
+        columns = [vocabulary[skill] for skill in _normalize(skills) if skill in vocabulary]
+        matrix[row, columns] = True
+
+    return matrix.sum(axis=1, dtype=np.int64) / len(vocabulary)
+
+
+class FitScoreCache:
+    """Applicant fit scores keyed by internship, its required skills and student.
+
+    Scores live in a :class:`TTLCache`. Keying on the posting's skills means an
+    edited posting is rescored on every worker at once. A student whose profile
+    skills change gets a new generation here (``invalidate_student``, called
+    after the commit) and expires from other workers' caches within ``ttl_seconds``.
+
+    Callers take :meth:`generations` before loading skills and pass the same
+    mapping to :meth:`set_many`, so scores computed from skills read before a
+    bump are filed under the old generation.
+    """
+
+    def __init__(self, ttl_seconds: float = FIT_SCORE_TTL_SECONDS, maxsize: int = 50_000) -> None:
+        self._scores = TTLCache(ttl_seconds=ttl_seconds, maxsize=maxsize)
+        self._generations: Dict[str, int] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _required(required_skills: Optional[Sequence[str]]) -> Tuple[str, ...]:
+        return tuple(sorted(set(_normalize(required_skills))))
+
+    def generations(self, student_ids: Iterable[str]) -> Dict[str, int]:
+        with self._lock:
+            return {student_id: self._generations.get(student_id, 0) for student_id in student_ids}
+
+    def get_many(
+        self, internship_id: str, required_skills: Optional[Sequence[str]], generations: Dict[str, int]
+    ) -> Dict[str, float]:
+        required = self._required(required_skills)
+        scores = {}
+        for student_id, generation in generations.items():
+            score = self._scores.get((internship_id, required, student_id, generation))
+            if score is not None:
+                scores[student_id] = score
+        return scores
+
+    def set_many(
+        self,
+        internship_id: str,
+        required_skills: Optional[Sequence[str]],
+        scores: Dict[str, float],
+        generations: Dict[str, int],
+    ) -> None:
+        required = self._required(required_skills)
+        for student_id, score in scores.items():
+            self._scores.set((internship_id, required, student_id, generations[student_id]), score)
+
+    def invalidate_student(self, student_id: str) -> None:
+        with self._lock:
+            self._generations[student_id] = self._generations.get(student_id, 0) + 1
+
+    def clear(self) -> None:
+        self._scores.clear()
+        with self._lock:
+            self._generations.clear()
+
+
+fit_score_cache = FitScoreCache()
@@ -0,0 +1,5 @@
+from app.services.cache import TTLCache
+
+
+# Admin panel counters keyed by day; short-lived so approvals and signups show up quickly
+admin_stats_cache = TTLCache(ttl_seconds=30, maxsize=4)
@@ -0,0 +1,267 @@
+"""Where stored files live: the local filesystem or an S3-compatible bucket.
+
+Keys are slash-separated paths such as ``blobs/ab/ab12...``. Callers stage a
+file on local disk and hand it to :meth:`StorageBackend.put_file`, which takes
+ownership of it. Downloads are served either straight from disk (Range, ETag
+and sendfile/pathsend via Starlette's ``FileResponse``) or, for S3, by
+redirecting to a short-lived presigned URL so the bytes never pass through the
+API workers.
+"""
+
+import hashlib
+import hmac
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import quote, urlsplit
+
+import aiofiles
+import aiofiles.os
+import httpx
+from fastapi import Request
+from fastapi.responses import FileResponse, RedirectResponse, Response
+
+from app.core.config import settings
+
+
+STREAM_CHUNK_BYTES = 1024 * 1024
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+
+
+class StorageBackend(ABC):
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def put_file(self, key: str, path: Path, content_type: Optional[str] = None) -> None:
+        """Store the local file at ``path`` under ``key``; the local file is consumed."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def iter_chunks(self, key: str) -> AsyncIterator[bytes]:
+        """The stored bytes of ``key``, streamed in chunks of at most ``STREAM_CHUNK_BYTES``."""
+
+    def local_path(self, key: str) -> Optional[Path]:
+        """Filesystem path of ``key`` when the backend is local, else None."""
+        return None
+
+    def signed_url(self, key: str, expires_in: int) -> Optional[str]:
+        """A URL that lets a client fetch ``key`` directly, if the backend supports it."""
+        return None
+
+
+class LocalStorage(StorageBackend):
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def local_path(self, key: str) -> Path:
+        return self.root / key
+
+    async def exists(self, key: str) -> bool:
+        return self.local_path(key).exists()
+
+    async def put_file(self, key: str, path: Path, content_type: Optional[str] = None) -> None:
+        target = self.local_path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        await aiofiles.os.replace(path, target)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await aiofiles.os.remove(self.local_path(key))
+        except FileNotFoundError:
+            pass
+
+    def iter_chunks(self, key: str) -> AsyncIterator[bytes]:
+        return _read_chunks(self.local_path(key))
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def _sigv4_signature(secret_key: str, datestamp: str, region: str, string_to_sign: str) -> str:
+    signing_key = _hmac(_hmac(_hmac(_hmac(f"AWS4{secret_key}".encode(), datestamp), region), "s3"), "aws4_request")
+    return hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+
+def _string_to_sign(amz_date: str, scope: str, canonical_request: str) -> str:
+    digest = hashlib.sha256(canonical_request.encode()).hexdigest()
+    return "\n".join(["AWS4-HMAC-SHA256", amz_date, scope, digest])
+
+
+def presign_url(
+    method: str,
+    url: str,
+    *,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    expires_in: int,
+    now: Optional[datetime] = None,
+) -> str:
+    """AWS Signature Version 4 query-string signing of ``url`` (path already percent-encoded)."""
+    now = now or datetime.utcnow()
+    parts = urlsplit(url)
+    amz_date, datestamp = now.strftime("%Y%m%dT%H%M%SZ"), now.strftime("%Y%m%d")
+    scope = f"{datestamp}/{region}/s3/aws4_request"
+    query = {
+        "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+        "X-Amz-Credential": f"{access_key}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires_in),
+        "X-Amz-SignedHeaders": "host",
+    }
+    canonical_query = "&".join(f"{quote(name, safe='')}={quote(value, safe='')}" for name, value in sorted(query.items()))
+    canonical_request = "\n".join(
+        [method, parts.path, canonical_query, f"host:{parts.netloc}\n", "host", UNSIGNED_PAYLOAD]
+    )
+    signature = _sigv4_signature(secret_key, datestamp, region, _string_to_sign(amz_date, scope, canonical_request))
+    return f"{parts.scheme}://{parts.netloc}{parts.path}?{canonical_query}&X-Amz-Signature={signature}"
+
+
+def signed_headers(
+    method: str, url: str, *, access_key: str, secret_key: str, region: str, now: Optional[datetime] = None
+) -> Dict[str, str]:
+    """Headers authorising a server-side request to ``url`` with an unsigned payload."""
+    now = now or datetime.utcnow()
+    parts = urlsplit(url)
+    amz_date, datestamp = now.strftime("%Y%m%dT%H%M%SZ"), now.strftime("%Y%m%d")
+    scope = f"{datestamp}/{region}/s3/aws4_request"
+    headers = {"host": parts.netloc, "x-amz-content-sha256": UNSIGNED_PAYLOAD, "x-amz-date": amz_date}
+    names = ";".join(sorted(headers))
+    canonical_headers = "".join(f"{name}:{headers[name]}\n" for name in sorted(headers))
+    canonical_request = "\n".join([method, parts.path, parts.query, canonical_headers, names, UNSIGNED_PAYLOAD])
+    signature = _sigv4_signature(secret_key, datestamp, region, _string_to_sign(amz_date, scope, canonical_request))
+    headers["authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={access_key}/{scope}, SignedHeaders={names}, Signature={signature}"
+    )
+    del headers["host"]
+    return headers
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, "rb") as handle:
+        while chunk := await handle.read(STREAM_CHUNK_BYTES):
+            yield chunk
+
+
+class S3Storage(StorageBackend):
+    """Path-style access to an S3-compatible bucket (AWS, MinIO, ...) over httpx."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        bucket: str,
+        access_key: str,
+        secret_key: str,
+        region: str = "us-east-1",
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.endpoint = endpoint.rstrip("/")
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self._client = httpx.AsyncClient(transport=transport, timeout=60.0)
+
+    def _url(self, key: str) -> str:
+        return f"{self.endpoint}/{quote(self.bucket)}/{quote(key)}"
+
+    async def _request(self, method: str, key: str, **kwargs) -> httpx.Response:  # type: ignore[no-untyped-def]
+        url = self._url(key)
+        headers = signed_headers(
+            method, url, access_key=self.access_key, secret_key=self.secret_key, region=self.region
+        )
+        headers.update(kwargs.pop("headers", {}))
+        return await self._client.request(method, url, headers=headers, **kwargs)
+
+    async def exists(self, key: str) -> bool:
+        response = await self._request("HEAD", key)
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
+
+    async def put_file(self, key: str, path: Path, content_type: Optional[str] = None) -> None:
+        headers = {"content-length": str(os.stat(path).st_size)}
+        if content_type:
+            headers["content-type"] = content_type
+        response = await self._request("PUT", key, headers=headers, content=_read_chunks(path))
+        response.raise_for_status()
+        await aiofiles.os.remove(path)
+
+    async def delete(self, key: str) -> None:
+        response = await self._request("DELETE", key)
+        if response.status_code != 404:
+            response.raise_for_status()
+
+    async def iter_chunks(self, key: str) -> AsyncIterator[bytes]:
+        url = self._url(key)
+        headers = signed_headers("GET", url, access_key=self.access_key, secret_key=self.secret_key, region=self.region)
+        async with self._client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_BYTES):
+                yield chunk
+
+    def signed_url(self, key: str, expires_in: int) -> str:
+        return presign_url(
+            "GET",
+            self._url(key),
+            access_key=self.access_key,
+            secret_key=self.secret_key,
+            region=self.region,
+            expires_in=expires_in,
+        )
+
+
+@lru_cache()
+def _s3_storage(endpoint: str, bucket: str, access_key: str, secret_key: str, region: str) -> S3Storage:
+    return S3Storage(endpoint, bucket, access_key, secret_key, region)
+
+
+def get_storage() -> StorageBackend:
+    if settings.STORAGE_BACKEND == "s3":
+        return _s3_storage(
+            settings.S3_ENDPOINT or "",
+            settings.S3_BUCKET or "",
+            settings.S3_ACCESS_KEY or "",
+            settings.S3_SECRET_KEY or "",
+            settings.S3_REGION,
+        )
+    return LocalStorage(Path(settings.UPLOAD_DIR))
+
+
+def download_response(
+    request: Request,
+    key: str,
+    *,
+    etag: str,
+    media_type: Optional[str] = None,
+    filename: Optional[str] = None,
+) -> Response:
+    """Serve a stored, immutable file: redirect to a signed URL, or stream it from disk.
+
+    ``etag`` should identify the content (e.g. its SHA-256); a matching
+    ``If-None-Match`` gets a 304 and Range requests get 206 partial content.
+    """
+    storage = get_storage()
+    signed = storage.signed_url(key, settings.SIGNED_URL_TTL_SECONDS)
+    if signed:
+        return RedirectResponse(signed, status_code=307)
+    quoted_etag = f'"{etag}"'
+    headers = {"etag": quoted_etag, "cache-control": "private, max-age=31536000, immutable"}
+    if quoted_etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(
+        storage.local_path(key),
+        media_type=media_type or "application/octet-stream",
+        filename=filename,
+        headers=headers,
+    )
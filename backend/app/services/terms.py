@@ -0,0 +1,14 @@
+"""Academic terms used to group NEP credits.
+
+The academic year runs July to June: July-December is semester 1 and
+January-June semester 2, so 2026-08-01 falls in ``2026-27-S1`` and
+2027-02-01 in ``2026-27-S2``. Labels sort chronologically as strings.
+"""
+
+from datetime import date
+
+
+def academic_term(day: date) -> str:
+    if day.month >= 7:
+        return f"{day.year}-{(day.year + 1) % 100:02d}-S1"
+    return f"{day.year - 1}-{day.year % 100:02d}-S2"
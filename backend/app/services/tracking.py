@@ -0,0 +1,45 @@
+"""Internship tracking status rules (see INTERNSHIP_TRACKING_LOGIC.md)."""
+
+from datetime import date, timedelta
+from enum import Enum
+from typing import Optional
+
+
+HOURS_PER_WEEK = 40
+DEFAULT_DURATION_WEEKS = 8
+
+
+class TrackingStatus(str, Enum):
+    ENROLLED = "ENROLLED"
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+
+
+def required_hours(duration_weeks: Optional[int]) -> float:
+    return float((duration_weeks or DEFAULT_DURATION_WEEKS) * HOURS_PER_WEEK)
+
+
+def classify(
+    *,
+    entry_count: int,
+    pending_count: int,
+    total_hours: float,
+    start_date: Optional[date],
+    duration_weeks: Optional[int],
+    today: Optional[date] = None,
+) -> TrackingStatus:
+    """Status of an application already approved by both faculty and industry."""
+    if entry_count == 0:
+        return TrackingStatus.ENROLLED
+    if pending_count == 0:
+        if total_hours >= required_hours(duration_weeks):
+            return TrackingStatus.COMPLETED
+        if start_date is not None:
+            end_date = start_date + timedelta(weeks=duration_weeks or DEFAULT_DURATION_WEEKS)
+            if end_date <= (today or date.today()):
+                return TrackingStatus.COMPLETED
+    return TrackingStatus.IN_PROGRESS
+
+
+def percentage(part: int, total: int) -> float:
+    return round(part * 100.0 / total, 1) if total else 0.0
@@ -0,0 +1,161 @@
+"""Resumable uploads into a content-addressed blob store.
+
+Chunks are appended to ``<UPLOAD_DIR>/parts/<upload id>`` as they stream in, so
+memory use per upload is one network chunk. On completion the part file is
+hashed (again streaming) and handed to the storage backend under
+``blobs/<sha[:2]>/<sha>``; if that blob already exists the part is simply
+discarded.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import mimetypes
+import os
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple
+
+import aiofiles
+import aiofiles.os
+
+from app.core.config import settings
+from app.services.storage import get_storage
+
+
+READ_CHUNK_BYTES = 1024 * 1024
+LOCK_POLL_SECONDS = 0.02
+
+
+class UploadTooLarge(Exception):
+    """The upload grew past its declared size."""
+
+
+class ChecksumMismatch(Exception):
+    """The received bytes do not hash to the digest the client announced."""
+
+
+def part_path(upload_id: str) -> Path:
+    return Path(settings.UPLOAD_DIR) / "parts" / str(upload_id)
+
+
+def blob_key(sha256: str) -> str:
+    return f"blobs/{sha256[:2]}/{sha256}"
+
+
+def file_extension(content_type: Optional[str]) -> str:
+    """``.pdf`` for ``application/pdf`` and so on; empty when the type is missing or unknown."""
+    if not content_type:
+        return ""
+    return mimetypes.guess_extension(content_type.split(";")[0].strip().lower()) or ""
+
+
+def lock_path(upload_id: str) -> Path:
+    return part_path(upload_id).with_name(f"{upload_id}.lock")
+
+
+@asynccontextmanager
+async def upload_lock(upload_id: str) -> AsyncIterator[None]:
+    """Held across an offset check and the write it guards, so two chunks never interleave.
+
+    An ``flock`` on the upload's lock file next to its part file, so it holds
+    across every worker sharing ``UPLOAD_DIR``; waiters poll instead of
+    parking a thread.
+    """
+    path = lock_path(upload_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab") as handle:
+        while True:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+async def discard_lock(upload_id: str) -> None:
+    """Remove a completed upload's lock file; waiters still holding it re-check and find it completed."""
+    try:
+        await aiofiles.os.remove(lock_path(upload_id))
+    except FileNotFoundError:
+        pass
+
+
+def received(upload_id: str) -> int:
+    """Bytes stored so far; this is the offset the next chunk must start at."""
+    try:
+        return os.stat(part_path(upload_id)).st_size
+    except FileNotFoundError:
+        return 0
+
+
+async def append_chunk(upload_id: str, chunks: AsyncIterator[bytes], limit: int) -> int:
+    """Append a streamed chunk to the part file and return the new offset.
+
+    If the data would take the file past ``limit`` bytes the chunk is rolled back
+    and :class:`UploadTooLarge` is raised. A dropped connection keeps whatever was
+    written, and the client resumes from :func:`received`.
+    """
+    path = part_path(upload_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    start = received(upload_id)
+    offset = start
+    async with aiofiles.open(path, "ab") as handle:
+        async for chunk in chunks:
+            offset += len(chunk)
+            if offset > limit:
+                await handle.truncate(start)
+                raise UploadTooLarge(f"Upload exceeds its declared size of {limit} bytes")
+            await handle.write(chunk)
+    return offset
+
+
+async def finalize(
+    upload_id: str, expected_sha256: Optional[str] = None, content_type: Optional[str] = None
+) -> Tuple[str, int]:
+    """Hash the part file and move it into the blob store; returns (sha256, size).
+
+    With ``expected_sha256`` a mismatching part is deleted, so the client starts over.
+    """
+    path = part_path(upload_id)
+    digest = hashlib.sha256()
+    size = 0
+    async with aiofiles.open(path, "rb") as handle:
+        while chunk := await handle.read(READ_CHUNK_BYTES):
+            digest.update(chunk)
+            size += len(chunk)
+    sha256 = digest.hexdigest()
+    if expected_sha256 and expected_sha256 != sha256:
+        await discard(upload_id)
+        raise ChecksumMismatch(f"Received bytes hash to {sha256}")
+    storage = get_storage()
+    if await storage.exists(blob_key(sha256)):
+        await discard(upload_id)
+    else:
+        await storage.put_file(blob_key(sha256), path, content_type)
+    return sha256, size
+
+
+async def store_stream(
+    chunks: AsyncIterator[bytes], limit: int, content_type: Optional[str] = None
+) -> Tuple[str, int]:
+    """One-shot upload of a streamed body straight into the blob store; returns (sha256, size)."""
+    staging_id = f"direct-{uuid.uuid4()}"
+    try:
+        await append_chunk(staging_id, chunks, limit)
+    except BaseException:
+        await discard(staging_id)
+        raise
+    return await finalize(staging_id, content_type=content_type)
+
+
+async def discard(upload_id: str) -> None:
+    try:
+        await aiofiles.os.remove(part_path(upload_id))
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,52 @@
+"""Build a ZIP archive while it is being sent.
+
+Members are deflated as their bytes arrive and each compressed piece is handed
+to the caller straight away, so neither the archive nor any member is ever held
+whole in memory or on disk. ``zipfile`` writes to the unseekable sink with data
+descriptors (sizes and CRC after each member), which every unzip tool reads.
+"""
+
+import asyncio
+import io
+import time
+import zipfile
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Tuple
+
+
+class _Sink(io.RawIOBase):
+    """Write-only, unseekable buffer that is emptied after every piece of output."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pieces: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[no-untyped-def]
+        self._pieces.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._pieces)
+        self._pieces.clear()
+        return data
+
+
+async def stream_zip(members: Iterable[Tuple[str, AsyncIterable[bytes]]]) -> AsyncIterator[bytes]:
+    """Yield a deflated ZIP of ``(name, chunks)`` members, reading each member only when it is reached."""
+    sink = _Sink()
+    date_time = time.localtime()[:6]
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, chunks in members:
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(info, "w") as member:
+                async for chunk in chunks:
+                    # Deflate off the event loop; the writes stay sequential
+                    await asyncio.to_thread(member.write, chunk)
+                    piece = sink.drain()
+                    if piece:
+                        yield piece
+            yield sink.drain()
+    yield sink.drain()
@@ -5,7 +5,8 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_sessionmaker
+from app.core.config import settings
 from app.db.base import Base
 from app.main import app
 
@@ -22,6 +23,18 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def upload_dir(tmp_path_factory):
+    settings.UPLOAD_DIR = str(tmp_path_factory.mktemp("storage"))
+    yield settings.UPLOAD_DIR
+
+
+@pytest.fixture(scope="session", autouse=True)
+def report_renderer():
+    settings.REPORT_RENDERER = "basic"
+    yield settings.REPORT_RENDERER
+
+
 @pytest_asyncio.fixture(scope="session", autouse=True)
 async def prepare_database():
     async with test_engine.begin() as conn:
@@ -39,7 +52,27 @@ async def async_client():
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_sessionmaker] = lambda: TestSessionLocal
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as client:
         yield client
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_sessionmaker, None)
+
+
+async def register_active(async_client, payload, admin_headers=None):
+    """Register a user, activating FACULTY/INDUSTRY accounts as an admin; returns (user_id, auth headers)."""
+    register_resp = await async_client.post("/api/v1/auth/register", json=payload)
+    assert register_resp.status_code == 201
+    user = register_resp.json()
+    if not user["is_active"]:
+        activate_resp = await async_client.patch(
+            f"/api/v1/admin/users/{user['id']}/activate", headers=admin_headers
+        )
+        assert activate_resp.status_code == 200
+    login_resp = await async_client.post(
+        "/api/v1/auth/login",
+        json={"email": payload["email"], "password": payload["password"]},
+    )
+    assert login_resp.status_code == 200
+    return user["id"], {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
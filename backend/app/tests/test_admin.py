@@ -0,0 +1,56 @@
+import pytest
+
+from app.services.stats import admin_stats_cache
+
+
+async def _login(async_client, payload):
+    login_resp = await async_client.post(
+        "/api/v1/auth/login",
+        json={"email": payload["email"], "password": payload["password"]},
+    )
+    assert login_resp.status_code == 200
+    return {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+
+
+def _role_counts(stats, role):
+    return next(item for item in stats["users"] if item["role"] == role)
+
+
+@pytest.mark.asyncio
+async def test_admin_stats_counts_and_cache(async_client):
+    admin_payload = {"name": "Stats Admin", "email": "stats-admin@example.com", "password": "AdminPass123", "role": "ADMIN"}
+    assert (await async_client.post("/api/v1/auth/register", json=admin_payload)).status_code == 201
+    admin_headers = await _login(async_client, admin_payload)
+    admin_stats_cache.clear()
+
+    before = (await async_client.get("/api/v1/admin/stats", headers=admin_headers)).json()
+    assert before["pending_approvals"] == sum(
+        _role_counts(before, role)["inactive"] for role in ("FACULTY", "INDUSTRY")
+    )
+    assert before["signups_today"] >= 1
+
+    register_resp = await async_client.post(
+        "/api/v1/auth/register",
+        json={"name": "Stats Provider", "email": "stats-provider@example.com", "password": "ProviderPass123", "role": "INDUSTRY"},
+    )
+    provider_id = register_resp.json()["id"]
+
+    cached = (await async_client.get("/api/v1/admin/stats", headers=admin_headers)).json()
+    assert cached == before
+
+    admin_stats_cache.clear()
+    fresh = (await async_client.get("/api/v1/admin/stats", headers=admin_headers)).json()
+    assert fresh["pending_approvals"] == before["pending_approvals"] + 1
+    assert fresh["signups_today"] == before["signups_today"] + 1
+
+    activate_resp = await async_client.patch(f"/api/v1/admin/users/{provider_id}/activate", headers=admin_headers)
+    assert activate_resp.status_code == 200
+    activated = (await async_client.get("/api/v1/admin/stats", headers=admin_headers)).json()
+    assert activated["pending_approvals"] == before["pending_approvals"]
+    assert _role_counts(activated, "INDUSTRY")["active"] == _role_counts(before, "INDUSTRY")["active"] + 1
+
+    provider_headers = await _login(
+        async_client, {"email": "stats-provider@example.com", "password": "ProviderPass123"}
+    )
+    forbidden = await async_client.get("/api/v1/admin/stats", headers=provider_headers)
+    assert forbidden.status_code == 403
@@ -0,0 +1,278 @@
+from datetime import date
+
+import pytest
+
+from app.db import crud
+from app.tests.conftest import TestSessionLocal, register_active
+
+
+async def _approve(async_client, admin_headers, application_id):
+    resp = await async_client.patch(
+        f"/api/v1/applications/{application_id}",
+        headers=admin_headers,
+        json={"industry_status": "APPROVED", "faculty_status": "APPROVED"},
+    )
+    assert resp.status_code == 200
+
+
+async def _log(async_client, headers, application_id, entry_date, hours):
+    resp = await async_client.post(
+        "/api/v1/logbook-entries",
+        headers=headers,
+        json={"application_id": application_id, "entry_date": entry_date, "hours": hours, "description": "Work"},
+    )
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_metrics_classify_tracking_status_per_college(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Metrics Admin", "email": "metrics-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    college_resp = await async_client.post(
+        "/api/v1/colleges", headers=admin_headers, json={"name": "Metrics College"}
+    )
+    assert college_resp.status_code == 201
+    college_id = college_resp.json()["id"]
+
+    _, faculty_headers = await register_active(
+        async_client,
+        {
+            "name": "Metrics Faculty",
+            "email": "metrics-faculty@example.com",
+            "password": "FacultyPass123",
+            "role": "FACULTY",
+            "college_id": college_id,
+        },
+        admin_headers,
+    )
+    _, industry_headers = await register_active(
+        async_client,
+        {"name": "Metrics Provider", "email": "metrics-provider@example.com", "password": "ProviderPass123", "role": "INDUSTRY"},
+        admin_headers,
+    )
+    internship_resp = await async_client.post(
+        "/api/v1/internships",
+        headers=industry_headers,
+        json={"title": "Metrics Intern", "start_date": "2020-01-06", "duration_weeks": 1, "credits": 2},
+    )
+    internship_id = internship_resp.json()["id"]
+
+    students = {}
+    for name in ("enrolled", "progress", "completed", "pending"):
+        _, headers = await register_active(
+            async_client,
+            {
+                "name": f"Metrics {name}",
+                "email": f"metrics-{name}@example.com",
+                "password": "StudentPass123",
+                "role": "STUDENT",
+                "college_id": college_id,
+            },
+        )
+        apply_resp = await async_client.post(
+            "/api/v1/applications", headers=headers, json={"internship_id": internship_id}
+        )
+        students[name] = (headers, apply_resp.json()["id"])
+
+    for name in ("enrolled", "progress", "completed"):
+        await _approve(async_client, admin_headers, students[name][1])
+
+    await _log(async_client, students["progress"][0], students["progress"][1], "2020-01-06", 8)
+    approved_entry = await _log(async_client, students["completed"][0], students["completed"][1], "2020-01-06", 6)
+    approve_resp = await async_client.patch(
+        f"/api/v1/logbook-entries/{approved_entry}", headers=faculty_headers, json={"approved": True}
+    )
+    assert approve_resp.status_code == 200
+
+    faculty_metrics = await async_client.get("/api/v1/analytics/metrics", headers=faculty_headers)
+    assert faculty_metrics.status_code == 200
+    metrics = faculty_metrics.json()
+    assert metrics["applications_submitted"] == 4
+    assert metrics["applications_pending_review"] == 1
+    assert metrics["logbook_entries"] == 2
+    assert metrics["tracking"] == {
+        "total_enrolled": 3,
+        "enrolled": 1,
+        "in_progress": 1,
+        "completed": 1,
+        "enrolled_percentage": 33.3,
+        "in_progress_percentage": 33.3,
+        "completed_percentage": 33.3,
+    }
+
+    admin_scoped = await async_client.get(
+        "/api/v1/analytics/metrics", headers=admin_headers, params={"college_id": college_id}
+    )
+    assert admin_scoped.json()["tracking"] == metrics["tracking"]
+
+    _, unassigned_headers = await register_active(
+        async_client,
+        {
+            "name": "Unassigned Faculty",
+            "email": "metrics-unassigned@example.com",
+            "password": "FacultyPass123",
+            "role": "FACULTY",
+            "college_id": None,
+        },
+        admin_headers,
+    )
+    unscoped = await async_client.get(
+        "/api/v1/analytics/metrics", headers=unassigned_headers, params={"college_id": college_id}
+    )
+    assert unscoped.status_code == 400
+
+    industry_metrics = await async_client.get("/api/v1/analytics/metrics", headers=industry_headers)
+    assert industry_metrics.status_code == 200
+    assert industry_metrics.json()["internships_open"] == 1
+    assert industry_metrics.json()["tracking"]["total_enrolled"] == 3
+
+    forbidden = await async_client.get("/api/v1/analytics/metrics", headers=students["enrolled"][0])
+    assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_funnel_reads_incrementally_refreshed_snapshots(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Funnel Admin", "email": "funnel-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    college_id = (
+        await async_client.post("/api/v1/colleges", headers=admin_headers, json={"name": "Funnel College"})
+    ).json()["id"]
+    internship_id = (
+        await async_client.post(
+            "/api/v1/internships",
+            headers=admin_headers,
+            json={"title": "Funnel Intern", "duration_weeks": 1},
+        )
+    ).json()["id"]
+
+    applications = []
+    for index in range(3):
+        _, headers = await register_active(
+            async_client,
+            {
+                "name": f"Funnel Student {index}",
+                "email": f"funnel-student-{index}@example.com",
+                "password": "StudentPass123",
+                "role": "STUDENT",
+                "college_id": college_id,
+            },
+        )
+        resp = await async_client.post("/api/v1/applications", headers=headers, json={"internship_id": internship_id})
+        applications.append((headers, resp.json()["id"]))
+
+    await async_client.patch(
+        f"/api/v1/applications/{applications[0][1]}", headers=admin_headers, json={"industry_status": "APPROVED"}
+    )
+    await _approve(async_client, admin_headers, applications[1][1])
+
+    async with TestSessionLocal() as session:
+        await crud.refresh_funnel_snapshots(session, full=True)
+
+    params = {"college_id": college_id}
+    funnel = (await async_client.get("/api/v1/analytics/funnel", headers=admin_headers, params=params)).json()
+    assert funnel["totals"] == {
+        "applied": 3,
+        "industry_approved": 2,
+        "faculty_approved": 1,
+        "enrolled": 1,
+        "completed": 0,
+    }
+    assert funnel["series"][0]["applied_on"] == date.today().isoformat()
+
+    entry_id = await _log(async_client, applications[1][0], applications[1][1], "2025-11-03", 40)
+    await async_client.patch(f"/api/v1/logbook-entries/{entry_id}", headers=admin_headers, json={"approved": True})
+    await _approve(async_client, admin_headers, applications[2][1])
+
+    stale = (await async_client.get("/api/v1/analytics/funnel", headers=admin_headers, params=params)).json()
+    assert stale["totals"]["completed"] == 0
+
+    async with TestSessionLocal() as session:
+        refreshed = await crud.refresh_funnel_snapshots(session)
+    assert refreshed == 1
+
+    funnel = (await async_client.get("/api/v1/analytics/funnel", headers=admin_headers, params=params)).json()
+    assert funnel["totals"]["enrolled"] == 2
+    assert funnel["totals"]["completed"] == 1
+
+    async with TestSessionLocal() as session:
+        assert await crud.refresh_funnel_snapshots(session) == 0
+
+    # A department move writes no application row, so the posting is flagged instead
+    moved = await async_client.patch(
+        "/api/v1/users/me", headers=applications[0][0], json={"profile": {"department": "Mechanical"}}
+    )
+    assert moved.status_code == 200
+    async with TestSessionLocal() as session:
+        assert await crud.refresh_funnel_snapshots(session) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_analytics_summarizes_colleges(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Batch Admin", "email": "batch-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    college_id = (
+        await async_client.post("/api/v1/colleges", headers=admin_headers, json={"name": "Batch College"})
+    ).json()["id"]
+    internship_id = (
+        await async_client.post(
+            "/api/v1/internships", headers=admin_headers, json={"title": "Batch Intern", "duration_weeks": 1}
+        )
+    ).json()["id"]
+
+    students = {}
+    for name in ("idle", "logging", "done"):
+        _, headers = await register_active(
+            async_client,
+            {
+                "name": f"Batch {name}",
+                "email": f"batch-{name}@example.com",
+                "password": "StudentPass123",
+                "role": "STUDENT",
+                "college_id": college_id,
+            },
+        )
+        apply_resp = await async_client.post(
+            "/api/v1/applications", headers=headers, json={"internship_id": internship_id}
+        )
+        students[name] = (headers, apply_resp.json()["id"])
+        await _approve(async_client, admin_headers, students[name][1])
+
+    await _log(async_client, students["logging"][0], students["logging"][1], "2026-01-05", 8)
+    for hours in (25, 15):
+        entry_id = await _log(async_client, students["done"][0], students["done"][1], "2026-01-06", hours)
+        await async_client.patch(f"/api/v1/logbook-entries/{entry_id}", headers=admin_headers, json={"approved": True})
+
+    async with TestSessionLocal() as session:
+        analysed = await crud.run_college_analytics(session, batch_rows=2)
+    assert analysed >= 3
+
+    resp = await async_client.get("/api/v1/analytics/colleges", headers=admin_headers, params={"college_id": college_id})
+    assert resp.status_code == 200
+    (summary,) = resp.json()
+    assert summary["college_id"] == college_id
+    assert {key: summary[key] for key in ("enrolled_total", "enrolled", "in_progress", "completed")} == {
+        "enrolled_total": 3,
+        "enrolled": 1,
+        "in_progress": 1,
+        "completed": 1,
+    }
+    assert summary["completion_rate"] == pytest.approx(1 / 3, abs=1e-4)
+    assert summary["mean_hours"] == 16.0
+    assert summary["p50_hours"] == 8.0
+    assert summary["p90_hours"] == 33.6
+    assert summary["hour_histogram"][:2] == [{"bucket": "0-40", "count": 2}, {"bucket": "40-80", "count": 1}]
+
+    metrics = await async_client.get("/api/v1/analytics/metrics", headers=admin_headers, params={"college_id": college_id})
+    tracking = metrics.json()["tracking"]
+    assert (tracking["enrolled"], tracking["in_progress"], tracking["completed"]) == (1, 1, 1)
+
+    platform = (await async_client.get("/api/v1/analytics/colleges", headers=admin_headers)).json()
+    assert platform[0]["college_id"] is None
+    assert platform[0]["enrolled_total"] == analysed
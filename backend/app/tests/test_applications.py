@@ -189,3 +189,81 @@ async def test_industry_and_faculty_can_review_applications(async_client):
 
     forbidden_list = await async_client.get("/api/v1/applications", headers=other_industry_headers)
     assert all(item["id"] != application_id for item in forbidden_list.json())
+
+
+@pytest.mark.asyncio
+async def test_applications_reference_the_stored_resume(async_client):
+    admin_headers = await _register_and_login(
+        async_client,
+        {"name": "Resume Admin", "email": "resume-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    student_headers = await _register_and_login(
+        async_client,
+        {"name": "Resume Student", "email": "resume-student@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+    internship_ids = [
+        (
+            await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": f"Resume Role {n}"})
+        ).json()["id"]
+        for n in range(3)
+    ]
+
+    first_resume = b"%PDF-1.4 first resume"
+    upload = await async_client.put(
+        "/api/v1/users/me/resume",
+        headers={**student_headers, "Content-Type": "application/pdf"},
+        content=first_resume,
+    )
+    assert upload.status_code == 200
+    first_sha = upload.json()["resume_sha256"]
+    assert upload.json()["resume_url"] == f"/api/v1/uploads/blobs/{first_sha}"
+
+    applications = []
+    for internship_id in internship_ids[:2]:
+        resp = await async_client.post(
+            "/api/v1/applications", headers=student_headers, json={"internship_id": internship_id}
+        )
+        assert resp.status_code == 201
+        applications.append(resp.json())
+    assert {application["resume_sha256"] for application in applications} == {first_sha}
+    assert applications[0]["resume_snapshot_url"] == f"/api/v1/applications/{applications[0]['id']}/resume"
+
+    await async_client.put(
+        "/api/v1/users/me/resume",
+        headers={**student_headers, "Content-Type": "application/pdf"},
+        content=b"%PDF-1.4 second resume",
+    )
+    latest = (
+        await async_client.post(
+            "/api/v1/applications", headers=student_headers, json={"internship_id": internship_ids[2]}
+        )
+    ).json()
+    assert latest["resume_sha256"] not in (None, first_sha)
+
+    snapshot = await async_client.get(applications[1]["resume_snapshot_url"], headers=admin_headers)
+    assert snapshot.status_code == 200
+    assert snapshot.content == first_resume
+    assert snapshot.headers["content-type"] == "application/pdf"
+    assert snapshot.headers["etag"] == f'"{first_sha}"'
+    assert 'filename="resume-Resume-Student.pdf"' in snapshot.headers["content-disposition"]
+    revalidated = await async_client.get(
+        applications[1]["resume_snapshot_url"], headers={**admin_headers, "If-None-Match": f'"{first_sha}"'}
+    )
+    assert revalidated.status_code == 304
+
+    other_headers = await _register_and_login(
+        async_client,
+        {"name": "No Resume", "email": "no-resume@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+    forbidden = await async_client.get(applications[1]["resume_snapshot_url"], headers=other_headers)
+    assert forbidden.status_code == 403
+    # The old resume is still the student's through their applications; nobody else's
+    blob_url = f"/api/v1/uploads/blobs/{first_sha}"
+    assert (await async_client.get(blob_url, headers=student_headers)).content == first_resume
+    assert (await async_client.get(blob_url, headers=other_headers)).status_code == 404
+    without_resume = (
+        await async_client.post("/api/v1/applications", headers=other_headers, json={"internship_id": internship_ids[0]})
+    ).json()
+    assert without_resume["resume_snapshot_url"] is None
+    missing = await async_client.get(f"/api/v1/applications/{without_resume['id']}/resume", headers=other_headers)
+    assert missing.status_code == 404
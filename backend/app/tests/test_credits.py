@@ -1,5 +1,8 @@
 import pytest
 
+from app.db import crud
+from app.tests.conftest import TestSessionLocal, register_active
+
 
 async def _register_and_login(async_client, payload):
     register_resp = await async_client.post("/api/v1/auth/register", json=payload)
@@ -181,4 +184,176 @@ async def test_non_faculty_cannot_award_credit(async_client):
             "credits_awarded": 2,
         },
     )
-    assert award_resp.status_code == 403
\ No newline at end of file
+    assert award_resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_credit_ledger_transcripts_and_export(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Ledger Admin", "email": "ledger-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    college_id = (
+        await async_client.post("/api/v1/colleges", headers=admin_headers, json={"name": "Ledger College"})
+    ).json()["id"]
+    _, faculty_headers = await register_active(
+        async_client,
+        {
+            "name": "Ledger Faculty",
+            "email": "ledger-faculty@example.com",
+            "password": "FacultyPass123",
+            "role": "FACULTY",
+            "college_id": college_id,
+        },
+        admin_headers,
+    )
+    students = {}
+    for name in ("Asha", "Bala"):
+        students[name] = await register_active(
+            async_client,
+            {
+                "name": f"Ledger {name}",
+                "email": f"ledger-{name.lower()}@example.com",
+                "password": "StudentPass123",
+                "role": "STUDENT",
+                "college_id": college_id,
+            },
+        )
+
+    async def award(student, title, credits, signed_at):
+        internship_id = (
+            await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": title})
+        ).json()["id"]
+        application_id = (
+            await async_client.post(
+                "/api/v1/applications", headers=students[student][1], json={"internship_id": internship_id}
+            )
+        ).json()["id"]
+        await async_client.patch(
+            f"/api/v1/applications/{application_id}",
+            headers=admin_headers,
+            json={"industry_status": "APPROVED", "faculty_status": "APPROVED"},
+        )
+        resp = await async_client.post(
+            "/api/v1/credits",
+            headers=faculty_headers,
+            json={
+                "student_id": students[student][0],
+                "internship_id": internship_id,
+                "credits_awarded": credits,
+                "faculty_signed_at": signed_at,
+            },
+        )
+        assert resp.status_code == 201
+        return resp.json()["id"]
+
+    await award("Asha", "Ledger Odd", 4, "2026-09-01T10:00:00Z")
+    spring_credit = await award("Asha", "Ledger Even", 2, "2027-02-01T10:00:00Z")
+    await award("Bala", "Ledger Bala", 3, "2026-10-01T10:00:00Z")
+
+    update_resp = await async_client.patch(
+        f"/api/v1/credits/{spring_credit}", headers=faculty_headers, json={"credits_awarded": 5}
+    )
+    assert update_resp.status_code == 200
+
+    transcript = (await async_client.get("/api/v1/credits/transcript", headers=students["Asha"][1])).json()
+    assert transcript == {
+        "student_id": students["Asha"][0],
+        "total_credits": 9,
+        "terms": [{"term": "2026-27-S1", "credits": 4}, {"term": "2026-27-S2", "credits": 5}],
+    }
+    by_faculty = await async_client.get(
+        "/api/v1/credits/transcript", headers=faculty_headers, params={"student_id": students["Bala"][0]}
+    )
+    assert by_faculty.json()["total_credits"] == 3
+
+    summary = (await async_client.get("/api/v1/credits/transcripts/college", headers=faculty_headers)).json()
+    assert summary["college_id"] == college_id
+    assert summary["total_credits"] == 12
+    assert summary["terms"] == [
+        {"term": "2026-27-S1", "credits": 7, "students": 2},
+        {"term": "2026-27-S2", "credits": 5, "students": 1},
+    ]
+
+    export_resp = await async_client.get(
+        "/api/v1/credits/transcripts/export",
+        headers=admin_headers,
+        params={"college_id": college_id, "term": "2026-27-S1"},
+    )
+    assert export_resp.status_code == 200
+    assert export_resp.headers["content-type"].startswith("text/csv")
+    lines = export_resp.text.strip().splitlines()
+    assert lines[0] == "student_id,name,email,term,credits"
+    assert lines[1:] == [
+        f"{students['Asha'][0]},Ledger Asha,ledger-asha@example.com,2026-27-S1,4",
+        f"{students['Bala'][0]},Ledger Bala,ledger-bala@example.com,2026-27-S1,3",
+    ]
+
+    forbidden = await async_client.get("/api/v1/credits/transcripts/college", headers=students["Bala"][1])
+    assert forbidden.status_code == 403
+
+    async with TestSessionLocal() as session:
+        assert await crud.reconcile_credit_ledger(session) == 0
+        assert await crud.get_credit_transcript(session, students["Asha"][0]) == [("2026-27-S1", 4), ("2026-27-S2", 5)]
+
+
+@pytest.mark.asyncio
+async def test_credit_update_moves_terms_and_opens_legacy_credits(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Term Admin", "email": "term-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    student_id, student_headers = await register_active(
+        async_client,
+        {"name": "Term Student", "email": "term-student@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+
+    credit_ids = []
+    for title, signed_at in (("Term Move", "2026-09-01T10:00:00Z"), ("Term Legacy", "2026-08-01T10:00:00Z")):
+        internship_id = (
+            await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": title})
+        ).json()["id"]
+        application_id = (
+            await async_client.post(
+                "/api/v1/applications", headers=student_headers, json={"internship_id": internship_id}
+            )
+        ).json()["id"]
+        await async_client.patch(
+            f"/api/v1/applications/{application_id}",
+            headers=admin_headers,
+            json={"industry_status": "APPROVED", "faculty_status": "APPROVED"},
+        )
+        resp = await async_client.post(
+            "/api/v1/credits",
+            headers=admin_headers,
+            json={
+                "student_id": student_id,
+                "internship_id": internship_id,
+                "credits_awarded": 3,
+                "faculty_signed_at": signed_at,
+            },
+        )
+        assert resp.status_code == 201
+        credit_ids.append(resp.json()["id"])
+    moved_id, legacy_id = credit_ids
+
+    # A credit from before the ledger: no term and not counted anywhere
+    async with TestSessionLocal() as session:
+        legacy = await crud.get_credit(session, legacy_id)
+        await crud._record_credit_change(session, student_id, legacy.term, -legacy.credits_awarded)
+        legacy.term = None
+        await session.commit()
+
+    resp = await async_client.patch(
+        f"/api/v1/credits/{moved_id}", headers=admin_headers, json={"faculty_signed_at": "2027-02-01T10:00:00Z"}
+    )
+    assert resp.status_code == 200
+    resp = await async_client.patch(f"/api/v1/credits/{legacy_id}", headers=admin_headers, json={"credits_awarded": 4})
+    assert resp.status_code == 200
+
+    transcript = (await async_client.get("/api/v1/credits/transcript", headers=student_headers)).json()
+    assert transcript["terms"] == [{"term": "2026-27-S1", "credits": 4}, {"term": "2026-27-S2", "credits": 3}]
+    assert transcript["total_credits"] == 7
+
+    async with TestSessionLocal() as session:
+        assert await crud.reconcile_credit_ledger(session) == 0
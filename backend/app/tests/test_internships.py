@@ -1,5 +1,7 @@
 import pytest
 
+from app.tests.conftest import register_active
+
 
 @pytest.mark.asyncio
 async def test_industry_can_create_filter_and_update_internship(async_client):
@@ -143,3 +145,266 @@ async def test_industry_cannot_update_other_provider_internship(async_client):
     )
     assert update_resp.status_code == 403
     assert update_resp.json()["detail"] == "Cannot modify another provider's posting"
+
+
+@pytest.mark.asyncio
+async def test_applicants_ranked_by_skill_fit(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Fit Admin", "email": "fit-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    _, industry_headers = await register_active(
+        async_client,
+        {"name": "Fit Provider", "email": "fit-provider@example.com", "password": "ProviderPass123", "role": "INDUSTRY"},
+        admin_headers,
+    )
+    create_resp = await async_client.post(
+        "/api/v1/internships",
+        headers=industry_headers,
+        json={"title": "Platform Intern", "skills": ["Python", "SQL", "Docker", "AWS"]},
+    )
+    assert create_resp.status_code == 201
+    internship_id = create_resp.json()["id"]
+
+    student_headers = {}
+    for name, skills in [("weak", ["Java"]), ("strong", ["python", "sql", "docker"]), ("mid", ["SQL"])]:
+        payload = {
+            "name": f"Fit {name}",
+            "email": f"fit-{name}@example.com",
+            "password": "StudentPass123",
+            "role": "STUDENT",
+            "student_profile": {"skills": skills},
+        }
+        _, student_headers[name] = await register_active(async_client, payload)
+        apply_resp = await async_client.post(
+            "/api/v1/applications",
+            headers=student_headers[name],
+            json={"internship_id": internship_id},
+        )
+        assert apply_resp.status_code == 201
+
+    ranked_resp = await async_client.get(
+        f"/api/v1/internships/{internship_id}/applicants", headers=industry_headers
+    )
+    assert ranked_resp.status_code == 200
+    ranked = ranked_resp.json()
+    assert [item["student"]["name"] for item in ranked] == ["Fit strong", "Fit mid", "Fit weak"]
+    assert [item["fit_score"] for item in ranked] == [0.75, 0.25, 0.0]
+
+    by_time = await async_client.get(
+        f"/api/v1/internships/{internship_id}/applicants",
+        headers=industry_headers,
+        params={"sort": "applied_at"},
+    )
+    assert [item["student"]["name"] for item in by_time.json()] == ["Fit mid", "Fit strong", "Fit weak"]
+
+    profile_resp = await async_client.patch(
+        "/api/v1/users/me",
+        headers=student_headers["weak"],
+        json={"profile": {"skills": ["Python", "SQL", "Docker", "AWS"]}},
+    )
+    assert profile_resp.status_code == 200
+    ranked = (
+        await async_client.get(f"/api/v1/internships/{internship_id}/applicants", headers=industry_headers)
+    ).json()
+    assert ranked[0]["student"]["name"] == "Fit weak"
+    assert ranked[0]["fit_score"] == 1.0
+
+    update_resp = await async_client.patch(
+        f"/api/v1/internships/{internship_id}", headers=industry_headers, json={"skills": ["SQL"]}
+    )
+    assert update_resp.status_code == 200
+    ranked = (
+        await async_client.get(f"/api/v1/internships/{internship_id}/applicants", headers=industry_headers)
+    ).json()
+    assert all(item["fit_score"] == 1.0 for item in ranked)
+
+    forbidden = await async_client.get(
+        f"/api/v1/internships/{internship_id}/applicants", headers=student_headers["mid"]
+    )
+    assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_similar_internships_follow_posting_changes(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Similar Admin", "email": "similar-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    _, industry_headers = await register_active(
+        async_client,
+        {
+            "name": "Similar Provider",
+            "email": "similar-provider@example.com",
+            "password": "ProviderPass123",
+            "role": "INDUSTRY",
+        },
+        admin_headers,
+    )
+
+    async def post(payload):
+        resp = await async_client.post("/api/v1/internships", headers=industry_headers, json=payload)
+        assert resp.status_code == 201
+        return resp.json()["id"]
+
+    backend_id = await post({"title": "Backend Kotlin Intern", "skills": ["Kotlin", "Ktor", "PostgreSQL"]})
+    twin_id = await post({"title": "Backend Kotlin Developer", "skills": ["Kotlin", "Ktor", "PostgreSQL"]})
+    design_id = await post({"title": "Brand Design Intern", "skills": ["Figma", "Illustrator"]})
+
+    similar_resp = await async_client.get(f"/api/v1/internships/{backend_id}/similar")
+    assert similar_resp.status_code == 200
+    similar = similar_resp.json()
+    assert similar[0]["id"] == twin_id
+    assert 0 < similar[0]["similarity"] <= 1
+    assert design_id not in {item["id"] for item in similar}
+
+    close_resp = await async_client.patch(
+        f"/api/v1/internships/{twin_id}", headers=industry_headers, json={"status": "CLOSED"}
+    )
+    assert close_resp.status_code == 200
+    similar = (await async_client.get(f"/api/v1/internships/{backend_id}/similar")).json()
+    assert twin_id not in {item["id"] for item in similar}
+
+    retitle_resp = await async_client.patch(
+        f"/api/v1/internships/{design_id}",
+        headers=industry_headers,
+        json={"title": "Backend Kotlin Intern", "skills": ["Kotlin", "Ktor", "PostgreSQL"]},
+    )
+    assert retitle_resp.status_code == 200
+    similar = (await async_client.get(f"/api/v1/internships/{backend_id}/similar")).json()
+    assert similar[0]["id"] == design_id
+    assert similar[0]["similarity"] == 1.0
+
+    delete_resp = await async_client.delete(f"/api/v1/internships/{design_id}", headers=industry_headers)
+    assert delete_resp.status_code == 204
+    similar = (await async_client.get(f"/api/v1/internships/{backend_id}/similar")).json()
+    assert design_id not in {item["id"] for item in similar}
+
+    missing = await async_client.get(f"/api/v1/internships/{design_id}/similar")
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_internship_list_facets(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Facet Admin", "email": "facet-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    _, industry_headers = await register_active(
+        async_client,
+        {"name": "Facet Provider", "email": "facet-provider@example.com", "password": "ProviderPass123", "role": "INDUSTRY"},
+        admin_headers,
+    )
+    postings = [
+        {"title": "Elixir A", "skills": ["Elixir", "Phoenix"], "remote": True, "credits": 2, "location": "Pune"},
+        {"title": "Elixir B", "skills": ["elixir"], "remote": False, "credits": 4, "location": "pune "},
+        {"title": "Elixir C", "skills": ["Elixir", "Phoenix"], "remote": False, "location": "Delhi"},
+    ]
+    for payload in postings:
+        resp = await async_client.post("/api/v1/internships", headers=industry_headers, json=payload)
+        assert resp.status_code == 201
+
+    plain = await async_client.get("/api/v1/internships", headers=admin_headers, params={"skills": "Elixir"})
+    assert isinstance(plain.json(), list)
+
+    resp = await async_client.get(
+        "/api/v1/internships", headers=admin_headers, params={"skills": "Elixir", "facets": True}
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert len(body["items"]) == 3
+    facets = body["facets"]
+    assert facets["remote"] == [{"value": "remote", "count": 1}, {"value": "on_site", "count": 2}]
+    assert facets["credits"] == [
+        {"value": "0-2", "count": 1},
+        {"value": "3-4", "count": 1},
+        {"value": "unspecified", "count": 1},
+    ]
+    assert facets["locations"][0]["value"].lower() == "pune"
+    assert facets["locations"][0]["count"] == 2
+    assert [(item["value"].lower(), item["count"]) for item in facets["skills"][:2]] == [
+        ("elixir", 3),
+        ("phoenix", 2),
+    ]
+
+    resp = await async_client.post(
+        "/api/v1/internships",
+        headers=industry_headers,
+        json={"title": "Elixir D", "skills": ["Elixir"], "remote": True, "credits": 8},
+    )
+    assert resp.status_code == 201
+    refreshed = await async_client.get(
+        "/api/v1/internships", headers=admin_headers, params={"skills": "Elixir", "facets": True}
+    )
+    facets = refreshed.json()["facets"]
+    assert facets["remote"][0] == {"value": "remote", "count": 2}
+    assert {"value": "7+", "count": 1} in facets["credits"]
+
+
+@pytest.mark.asyncio
+async def test_provider_summary_counts_per_posting(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Summary Admin", "email": "summary-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    _, industry_headers = await register_active(
+        async_client,
+        {"name": "Summary Provider", "email": "summary-provider@example.com", "password": "ProviderPass123", "role": "INDUSTRY"},
+        admin_headers,
+    )
+    busy_id = (
+        await async_client.post("/api/v1/internships", headers=industry_headers, json={"title": "Busy Posting"})
+    ).json()["id"]
+    quiet_resp = await async_client.post(
+        "/api/v1/internships", headers=industry_headers, json={"title": "Quiet Posting"}
+    )
+    assert quiet_resp.status_code == 201
+
+    application_ids = []
+    student_headers = []
+    for index in range(3):
+        _, headers = await register_active(
+            async_client,
+            {
+                "name": f"Summary Student {index}",
+                "email": f"summary-student-{index}@example.com",
+                "password": "StudentPass123",
+                "role": "STUDENT",
+            },
+        )
+        apply_resp = await async_client.post("/api/v1/applications", headers=headers, json={"internship_id": busy_id})
+        application_ids.append(apply_resp.json()["id"])
+        student_headers.append(headers)
+
+    await async_client.patch(
+        f"/api/v1/applications/{application_ids[0]}",
+        headers=admin_headers,
+        json={"industry_status": "APPROVED", "faculty_status": "APPROVED"},
+    )
+    await async_client.patch(
+        f"/api/v1/applications/{application_ids[1]}", headers=industry_headers, json={"industry_status": "REJECTED"}
+    )
+    for hours in (4, 3.5):
+        log_resp = await async_client.post(
+            "/api/v1/logbook-entries",
+            headers=student_headers[0],
+            json={"application_id": application_ids[0], "entry_date": "2026-01-05", "hours": hours, "description": "Work"},
+        )
+        assert log_resp.status_code == 201
+
+    summary_resp = await async_client.get("/api/v1/internships/mine/summary", headers=industry_headers)
+    assert summary_resp.status_code == 200
+    summary = summary_resp.json()
+    assert [item["title"] for item in summary] == ["Quiet Posting", "Busy Posting"]
+    assert summary[0]["applications"] == 0
+    assert summary[0]["total_hours"] == 0
+    busy = summary[1]
+    assert busy["applications"] == 3
+    assert busy["industry_status"] == {"pending": 1, "approved": 1, "rejected": 1}
+    assert busy["faculty_status"] == {"pending": 2, "approved": 1, "rejected": 0}
+    assert busy["enrolled"] == 1
+    assert busy["total_hours"] == 7.5
+    assert busy["pending_reviews"] == 2
+
+    forbidden = await async_client.get("/api/v1/internships/mine/summary", headers=student_headers[2])
+    assert forbidden.status_code == 403
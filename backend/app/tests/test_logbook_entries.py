@@ -1,5 +1,10 @@
+import uuid
+
 import pytest
 
+from app.db import crud
+from app.tests.conftest import TestSessionLocal, register_active
+
 
 async def _register_and_login(async_client, payload):
     register_resp = await async_client.post("/api/v1/auth/register", json=payload)
@@ -222,3 +227,500 @@ async def test_faculty_can_approve_logbook(async_client):
 
     other_industry_list = await async_client.get("/api/v1/logbook-entries", headers=other_industry_headers)
     assert all(item["id"] != entry_id for item in other_industry_list.json())
+
+
+@pytest.mark.asyncio
+async def test_application_progress_counters_follow_logbook_writes(async_client):
+    admin_headers = await _register_and_login(
+        async_client,
+        {"name": "Progress Admin", "email": "progress-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    internship_resp = await async_client.post(
+        "/api/v1/internships",
+        headers=admin_headers,
+        json={"title": "Progress Intern", "duration_weeks": 1},
+    )
+    internship_id = internship_resp.json()["id"]
+    student_headers = await _register_and_login(
+        async_client,
+        {
+            "name": "Progress Student",
+            "email": "progress-student@example.com",
+            "password": "StudentPass123",
+            "role": "STUDENT",
+        },
+    )
+    apply_resp = await async_client.post(
+        "/api/v1/applications", headers=student_headers, json={"internship_id": internship_id}
+    )
+    application_id = apply_resp.json()["id"]
+
+    entry_ids = []
+    for day, hours in (("2025-11-03", 8), ("2025-11-04", 6)):
+        resp = await async_client.post(
+            "/api/v1/logbook-entries",
+            headers=student_headers,
+            json={"application_id": application_id, "entry_date": day, "hours": hours, "description": "Work"},
+        )
+        assert resp.status_code == 201
+        entry_ids.append(resp.json()["id"])
+
+    await async_client.patch(
+        f"/api/v1/logbook-entries/{entry_ids[1]}", headers=student_headers, json={"hours": 10}
+    )
+    await async_client.patch(
+        f"/api/v1/logbook-entries/{entry_ids[0]}", headers=admin_headers, json={"approved": True}
+    )
+
+    progress_resp = await async_client.get(
+        f"/api/v1/applications/{application_id}/progress", headers=student_headers
+    )
+    assert progress_resp.status_code == 200
+    progress = progress_resp.json()
+    assert progress["total_hours"] == 18
+    assert progress["approved_hours"] == 8
+    assert progress["entry_count"] == 2
+    assert progress["pending_count"] == 1
+    assert progress["required_hours"] == 40
+    assert progress["tracking_status"] is None
+
+    await async_client.patch(
+        f"/api/v1/applications/{application_id}",
+        headers=admin_headers,
+        json={"industry_status": "APPROVED", "faculty_status": "APPROVED"},
+    )
+    await async_client.patch(
+        f"/api/v1/logbook-entries/{entry_ids[1]}", headers=admin_headers, json={"approved": True, "hours": 32}
+    )
+    progress = (
+        await async_client.get(f"/api/v1/applications/{application_id}/progress", headers=student_headers)
+    ).json()
+    assert progress["total_hours"] == 40
+    assert progress["approved_hours"] == 40
+    assert progress["pending_count"] == 0
+    assert progress["tracking_status"] == "COMPLETED"
+
+    async with TestSessionLocal() as session:
+        await crud.rebuild_application_progress(session)
+    rebuilt = (
+        await async_client.get(f"/api/v1/applications/{application_id}/progress", headers=student_headers)
+    ).json()
+    assert rebuilt == progress
+
+    # A row lost (or never written, for older applications) is rebuilt from the entries on the next write
+    async with TestSessionLocal() as session:
+        await session.delete(await crud.get_application_progress(session, application_id))
+        await session.commit()
+    resp = await async_client.post(
+        "/api/v1/logbook-entries",
+        headers=student_headers,
+        json={"application_id": application_id, "entry_date": "2025-11-05", "hours": 4, "description": "Work"},
+    )
+    assert resp.status_code == 201
+    progress = (
+        await async_client.get(f"/api/v1/applications/{application_id}/progress", headers=student_headers)
+    ).json()
+    assert progress["total_hours"] == 44
+    assert progress["approved_hours"] == 40
+    assert progress["entry_count"] == 3
+    assert progress["pending_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hours_rollup_by_week_and_month(async_client):
+    admin_headers = await _register_and_login(
+        async_client,
+        {"name": "Rollup Admin", "email": "rollup-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    internship_id = (
+        await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": "Rollup Intern"})
+    ).json()["id"]
+    student_headers = await _register_and_login(
+        async_client,
+        {"name": "Rollup Student", "email": "rollup-student@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+    application_id = (
+        await async_client.post("/api/v1/applications", headers=student_headers, json={"internship_id": internship_id})
+    ).json()["id"]
+
+    entry_ids = []
+    for day, hours in (("2025-12-29", 8), ("2026-01-01", 4), ("2026-01-04", 3), ("2026-01-05", 5)):
+        resp = await async_client.post(
+            "/api/v1/logbook-entries",
+            headers=student_headers,
+            json={"application_id": application_id, "entry_date": day, "hours": hours, "description": "Work"},
+        )
+        entry_ids.append(resp.json()["id"])
+    await async_client.patch(f"/api/v1/logbook-entries/{entry_ids[0]}", headers=admin_headers, json={"approved": True})
+
+    weekly_resp = await async_client.get(f"/api/v1/applications/{application_id}/hours", headers=admin_headers)
+    assert weekly_resp.status_code == 200
+    weekly = weekly_resp.json()
+    assert weekly["period"] == "week"
+    assert weekly["period_start"] == ["2025-12-29", "2026-01-05"]
+    assert weekly["label"] == ["2026-W01", "2026-W02"]
+    assert weekly["hours"] == [15, 5]
+    assert weekly["approved_hours"] == [8, 0]
+    assert weekly["pending_hours"] == [7, 5]
+    assert weekly["entries"] == [3, 1]
+
+    monthly = (
+        await async_client.get(
+            f"/api/v1/applications/{application_id}/hours", headers=student_headers, params={"period": "month"}
+        )
+    ).json()
+    assert monthly["label"] == ["2025-12", "2026-01"]
+    assert monthly["hours"] == [8, 12]
+    assert monthly["approved_hours"] == [8, 0]
+
+
+@pytest.mark.asyncio
+async def test_faculty_review_queue_is_scoped_and_paginated(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Queue Admin", "email": "queue-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    college_id = (
+        await async_client.post("/api/v1/colleges", headers=admin_headers, json={"name": "Queue College"})
+    ).json()["id"]
+    _, faculty_headers = await register_active(
+        async_client,
+        {
+            "name": "Queue Faculty",
+            "email": "queue-faculty@example.com",
+            "password": "FacultyPass123",
+            "role": "FACULTY",
+            "college_id": college_id,
+        },
+        admin_headers,
+    )
+    internship_id = (
+        await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": "Queue Intern"})
+    ).json()["id"]
+
+    entry_ids = {}
+    for name, student_college in (("local", college_id), ("outside", None)):
+        _, headers = await register_active(
+            async_client,
+            {
+                "name": f"Queue {name}",
+                "email": f"queue-{name}@example.com",
+                "password": "StudentPass123",
+                "role": "STUDENT",
+                "college_id": student_college,
+            },
+        )
+        application_id = (
+            await async_client.post("/api/v1/applications", headers=headers, json={"internship_id": internship_id})
+        ).json()["id"]
+        entry_ids[name] = []
+        for day in ("2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08"):
+            resp = await async_client.post(
+                "/api/v1/logbook-entries",
+                headers=headers,
+                json={"application_id": application_id, "entry_date": day, "hours": 4, "description": "Work"},
+            )
+            entry_ids[name].append(resp.json()["id"])
+
+    await async_client.patch(
+        f"/api/v1/logbook-entries/{entry_ids['local'][1]}", headers=faculty_headers, json={"approved": True}
+    )
+
+    count = await async_client.get("/api/v1/logbook-entries/review-queue/count", headers=faculty_headers)
+    assert count.status_code == 200
+    assert count.json() == {"pending": 3}
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = (
+            await async_client.get("/api/v1/logbook-entries/review-queue", headers=faculty_headers, params=params)
+        ).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    local = entry_ids["local"]
+    assert seen == [local[0], local[2], local[3]]
+
+    admin_count = await async_client.get(
+        "/api/v1/logbook-entries/review-queue/count", headers=admin_headers, params={"college_id": college_id}
+    )
+    assert admin_count.json() == {"pending": 3}
+
+    student_resp = await async_client.get("/api/v1/logbook-entries/review-queue", headers=headers)
+    assert student_resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_updates_progress_and_notifies_once(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Bulk Admin", "email": "bulk-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    college_id = (
+        await async_client.post("/api/v1/colleges", headers=admin_headers, json={"name": "Bulk College"})
+    ).json()["id"]
+    _, faculty_headers = await register_active(
+        async_client,
+        {
+            "name": "Bulk Faculty",
+            "email": "bulk-faculty@example.com",
+            "password": "FacultyPass123",
+            "role": "FACULTY",
+            "college_id": college_id,
+        },
+        admin_headers,
+    )
+    internship_id = (
+        await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": "Bulk Intern"})
+    ).json()["id"]
+
+    students = {}
+    for name, student_college in (("local", college_id), ("outside", None)):
+        _, headers = await register_active(
+            async_client,
+            {
+                "name": f"Bulk {name}",
+                "email": f"bulk-{name}@example.com",
+                "password": "StudentPass123",
+                "role": "STUDENT",
+                "college_id": student_college,
+            },
+        )
+        application_id = (
+            await async_client.post("/api/v1/applications", headers=headers, json={"internship_id": internship_id})
+        ).json()["id"]
+        entry_ids = []
+        for day in ("2026-01-05", "2026-01-12", "2026-01-19", "2026-02-02"):
+            resp = await async_client.post(
+                "/api/v1/logbook-entries",
+                headers=headers,
+                json={"application_id": application_id, "entry_date": day, "hours": 5, "description": "Work"},
+            )
+            entry_ids.append(resp.json()["id"])
+        students[name] = (headers, application_id, entry_ids)
+
+    local_headers, local_application, local_entries = students["local"]
+    approve_resp = await async_client.post(
+        "/api/v1/logbook-entries/approve",
+        headers=faculty_headers,
+        json={"application_id": local_application, "start": "2026-01-01", "end": "2026-01-31"},
+    )
+    assert approve_resp.status_code == 200
+    result = approve_resp.json()
+    assert result["approved"] == 3
+    assert result["approved_hours"] == 15
+    assert sorted(result["entry_ids"]) == sorted(local_entries[:3])
+
+    progress = (
+        await async_client.get(f"/api/v1/applications/{local_application}/progress", headers=local_headers)
+    ).json()
+    assert progress["approved_hours"] == 15
+    assert progress["pending_count"] == 1
+
+    notifications = (await async_client.get("/api/v1/notifications", headers=local_headers)).json()
+    assert len(notifications) == 1
+    assert notifications[0]["payload"]["application_ids"] == [local_application]
+
+    retry = await async_client.post(
+        "/api/v1/logbook-entries/approve",
+        headers=faculty_headers,
+        json={"application_id": local_application, "start": "2026-01-01", "end": "2026-01-31"},
+    )
+    assert retry.json()["approved"] == 0
+
+    outside_headers, _, outside_entries = students["outside"]
+    out_of_scope = await async_client.post(
+        "/api/v1/logbook-entries/approve", headers=faculty_headers, json={"ids": outside_entries[:2]}
+    )
+    assert out_of_scope.json()["approved"] == 0
+    by_admin = await async_client.post(
+        "/api/v1/logbook-entries/approve", headers=admin_headers, json={"ids": outside_entries[:2]}
+    )
+    assert by_admin.json()["approved"] == 2
+
+    invalid = await async_client.post(
+        "/api/v1/logbook-entries/approve",
+        headers=admin_headers,
+        json={"ids": outside_entries, "application_id": local_application},
+    )
+    assert invalid.status_code == 422
+    forbidden = await async_client.post(
+        "/api/v1/logbook-entries/approve", headers=outside_headers, json={"ids": outside_entries}
+    )
+    assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_batch_create_reports_per_item_results(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Batch Log Admin", "email": "batchlog-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    internship_id = (
+        await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": "Batch Log Intern"})
+    ).json()["id"]
+    applications = {}
+    for name in ("owner", "other"):
+        _, headers = await register_active(
+            async_client,
+            {
+                "name": f"Batch Log {name}",
+                "email": f"batchlog-{name}@example.com",
+                "password": "StudentPass123",
+                "role": "STUDENT",
+            },
+        )
+        application_id = (
+            await async_client.post("/api/v1/applications", headers=headers, json={"internship_id": internship_id})
+        ).json()["id"]
+        applications[name] = (headers, application_id)
+
+    owner_headers, owner_application = applications["owner"]
+    week = [
+        {"application_id": owner_application, "entry_date": f"2026-02-0{day}", "hours": 6, "description": f"Day {day}"}
+        for day in range(2, 7)
+    ]
+    week[1]["attachments"] = [{"name": "notes.pdf", "url": "https://example.com/notes.pdf"}]
+    batch = week + [
+        {"application_id": applications["other"][1], "entry_date": "2026-02-02", "hours": 2, "description": "Nope"},
+        {"application_id": "missing", "entry_date": "2026-02-02", "hours": 2, "description": "Nope"},
+    ]
+    resp = await async_client.post("/api/v1/logbook-entries/batch", headers=owner_headers, json={"entries": batch})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["created"] == 5
+    assert [item["error"] for item in body["results"][5:]] == [
+        "Cannot add entries to this application",
+        "Application not found",
+    ]
+    created_ids = [item["id"] for item in body["results"][:5]]
+    assert all(created_ids)
+
+    entries = (
+        await async_client.get(
+            "/api/v1/logbook-entries", headers=owner_headers, params={"application_id": owner_application}
+        )
+    ).json()
+    assert sorted(entry["id"] for entry in entries) == sorted(created_ids)
+    with_attachment = next(entry for entry in entries if entry["description"] == "Day 3")
+    assert with_attachment["attachments"] == [
+        {"name": "notes.pdf", "url": "https://example.com/notes.pdf", "sha256": None, "size": None}
+    ]
+
+    progress = (
+        await async_client.get(f"/api/v1/applications/{owner_application}/progress", headers=owner_headers)
+    ).json()
+    assert progress["total_hours"] == 30
+    assert progress["entry_count"] == 5
+    assert progress["pending_count"] == 5
+
+    too_many = await async_client.post(
+        "/api/v1/logbook-entries/batch", headers=owner_headers, json={"entries": [week[0]] * 501}
+    )
+    assert too_many.status_code == 422
+
+    repeated = {**week[0], "id": str(uuid.uuid4())}
+    duplicated = await async_client.post(
+        "/api/v1/logbook-entries/batch", headers=owner_headers, json={"entries": [repeated, repeated]}
+    )
+    assert duplicated.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_offline_sync_is_idempotent_and_reports_conflicts(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Sync Admin", "email": "sync-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    internship_id = (
+        await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": "Sync Intern"})
+    ).json()["id"]
+    _, student_headers = await register_active(
+        async_client,
+        {"name": "Sync Student", "email": "sync-student@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+    application_id = (
+        await async_client.post("/api/v1/applications", headers=student_headers, json={"internship_id": internship_id})
+    ).json()["id"]
+
+    async def progress():
+        resp = await async_client.get(f"/api/v1/applications/{application_id}/progress", headers=student_headers)
+        body = resp.json()
+        return body["total_hours"], body["entry_count"], body["pending_count"]
+
+    async def sync(entries):
+        resp = await async_client.post("/api/v1/logbook-entries/sync", headers=student_headers, json={"entries": entries})
+        assert resp.status_code == 200
+        return resp.json()["results"]
+
+    drafts = [
+        {
+            "id": str(uuid.uuid4()),
+            "application_id": application_id,
+            "entry_date": f"2026-03-0{day}",
+            "hours": 4,
+            "description": f"Draft {day}",
+        }
+        for day in (2, 3, 4)
+    ]
+    first = await sync(drafts)
+    assert [item["status"] for item in first] == ["CREATED"] * 3
+    assert [item["entry"]["version"] for item in first] == [1, 1, 1]
+    assert await progress() == (12, 3, 3)
+
+    replay = await sync(drafts)
+    assert [item["status"] for item in replay] == ["UNCHANGED"] * 3
+    assert await progress() == (12, 3, 3)
+
+    edited = dict(drafts[0], hours=6, base_version=1)
+    stale = dict(drafts[0], hours=9, base_version=1)
+    unknown = dict(drafts[1], id=str(uuid.uuid4()), base_version=3)
+    results = await sync([edited])
+    assert results[0]["status"] == "UPDATED"
+    assert results[0]["entry"]["version"] == 2
+    results = await sync([stale, unknown])
+    assert results[0]["status"] == "CONFLICT"
+    assert (results[0]["entry"]["hours"], results[0]["entry"]["version"]) == (6, 2)
+    assert results[1]["status"] == "REJECTED"
+    assert await progress() == (14, 3, 3)
+
+    await async_client.patch(
+        f"/api/v1/logbook-entries/{drafts[1]['id']}", headers=admin_headers, json={"approved": True}
+    )
+    results = await sync([dict(drafts[1], hours=8, base_version=2)])
+    assert results[0]["status"] == "CONFLICT"
+    assert results[0]["entry"]["approved"] is True
+
+    duplicate = await async_client.post(
+        "/api/v1/logbook-entries/sync", headers=student_headers, json={"entries": [drafts[0], drafts[0]]}
+    )
+    assert duplicate.status_code == 422
+
+    single = {
+        "id": str(uuid.uuid4()),
+        "application_id": application_id,
+        "entry_date": "2026-03-05",
+        "hours": 2,
+        "description": "Posted twice",
+    }
+    created = await async_client.post("/api/v1/logbook-entries", headers=student_headers, json=single)
+    retried = await async_client.post("/api/v1/logbook-entries", headers=student_headers, json=single)
+    assert (created.status_code, retried.status_code) == (201, 200)
+    assert created.json()["id"] == retried.json()["id"] == single["id"]
+    reused = await async_client.post(
+        "/api/v1/logbook-entries", headers=student_headers, json=dict(single, hours=3)
+    )
+    assert reused.status_code == 409
+    assert await progress() == (16, 4, 3)
+
+    entry_url = f"/api/v1/logbook-entries/{single['id']}"
+    patched = await async_client.patch(entry_url, headers=student_headers, json={"hours": 5, "version": 1})
+    assert patched.status_code == 200
+    assert patched.json()["version"] == 2
+    repeated = await async_client.patch(entry_url, headers=student_headers, json={"hours": 5, "version": 1})
+    assert repeated.status_code == 200
+    conflicting = await async_client.patch(entry_url, headers=student_headers, json={"hours": 7, "version": 1})
+    assert conflicting.status_code == 409
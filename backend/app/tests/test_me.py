@@ -0,0 +1,169 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.tests.conftest import register_active
+
+
+@pytest.mark.asyncio
+async def test_student_dashboard_summarizes_home_screen(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Dash Admin", "email": "dash-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    _, faculty_headers = await register_active(
+        async_client,
+        {"name": "Dash Faculty", "email": "dash-faculty@example.com", "password": "FacultyPass123", "role": "FACULTY"},
+        admin_headers,
+    )
+    student_id, student_headers = await register_active(
+        async_client,
+        {"name": "Dash Student", "email": "dash-student@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+
+    internship_ids = []
+    for title in ("Dash One", "Dash Two", "Dash Three"):
+        resp = await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": title, "credits": 3})
+        internship_ids.append(resp.json()["id"])
+    application_ids = []
+    for internship_id in internship_ids:
+        resp = await async_client.post(
+            "/api/v1/applications", headers=student_headers, json={"internship_id": internship_id}
+        )
+        application_ids.append(resp.json()["id"])
+
+    await async_client.patch(
+        f"/api/v1/applications/{application_ids[0]}",
+        headers=admin_headers,
+        json={"industry_status": "APPROVED", "faculty_status": "APPROVED"},
+    )
+    await async_client.patch(
+        f"/api/v1/applications/{application_ids[2]}", headers=admin_headers, json={"industry_status": "REJECTED"}
+    )
+    credit_resp = await async_client.post(
+        "/api/v1/credits",
+        headers=admin_headers,
+        json={"student_id": student_id, "internship_id": internship_ids[0], "credits_awarded": 3},
+    )
+    assert credit_resp.status_code == 201
+
+    today = date.today()
+    for entry_date, hours in ((today, 5), (today - timedelta(days=today.weekday() + 1), 8)):
+        log_resp = await async_client.post(
+            "/api/v1/logbook-entries",
+            headers=student_headers,
+            json={
+                "application_id": application_ids[0],
+                "entry_date": entry_date.isoformat(),
+                "hours": hours,
+                "description": "Work",
+            },
+        )
+        assert log_resp.status_code == 201
+
+    notification_ids = []
+    for index in range(6):
+        resp = await async_client.post(
+            "/api/v1/notifications",
+            headers=faculty_headers,
+            json={"user_id": student_id, "title": f"Update {index}"},
+        )
+        notification_ids.append(resp.json()["id"])
+    await async_client.patch(
+        f"/api/v1/notifications/{notification_ids[-1]}", headers=student_headers, json={"read": True}
+    )
+
+    dashboard_resp = await async_client.get("/api/v1/me/dashboard", headers=student_headers)
+    assert dashboard_resp.status_code == 200
+    dashboard = dashboard_resp.json()
+    assert dashboard["user"] == {"id": student_id, "name": "Dash Student", "role": "STUDENT"}
+    assert dashboard["active_applications"] == 2
+    assert dashboard["enrolled_applications"] == 1
+    assert dashboard["week_start"] == (today - timedelta(days=today.weekday())).isoformat()
+    assert dashboard["hours_this_week"] == 5
+    assert dashboard["total_credits"] == 3
+    assert dashboard["unread_notifications"] == 5
+    assert [item["title"] for item in dashboard["latest_notifications"]] == [
+        "Update 5",
+        "Update 4",
+        "Update 3",
+        "Update 2",
+        "Update 1",
+    ]
+
+    forbidden = await async_client.get("/api/v1/me/dashboard", headers=faculty_headers)
+    assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_student_timeline_pages_newest_first(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {"name": "Feed Admin", "email": "feed-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    student_id, student_headers = await register_active(
+        async_client,
+        {"name": "Feed Student", "email": "feed-student@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+    internship_id = (
+        await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": "Feed Intern"})
+    ).json()["id"]
+    application_id = (
+        await async_client.post("/api/v1/applications", headers=student_headers, json={"internship_id": internship_id})
+    ).json()["id"]
+    for field in ("industry_status", "faculty_status"):
+        resp = await async_client.patch(
+            f"/api/v1/applications/{application_id}", headers=admin_headers, json={field: "APPROVED"}
+        )
+        assert resp.status_code == 200
+
+    entry_id = (
+        await async_client.post(
+            "/api/v1/logbook-entries",
+            headers=student_headers,
+            json={"application_id": application_id, "entry_date": "2026-01-05", "hours": 6, "description": "Work"},
+        )
+    ).json()["id"]
+    review_resp = await async_client.patch(
+        f"/api/v1/logbook-entries/{entry_id}",
+        headers=admin_headers,
+        json={"approved": True, "faculty_comments": "Nice work"},
+    )
+    assert review_resp.status_code == 200
+    credit_resp = await async_client.post(
+        "/api/v1/credits",
+        headers=admin_headers,
+        json={"student_id": student_id, "internship_id": internship_id, "credits_awarded": 2},
+    )
+    assert credit_resp.status_code == 201
+    report_resp = await async_client.post(
+        "/api/v1/reports",
+        headers=admin_headers,
+        json={"application_id": application_id, "pdf_url": "https://example.com/feed.pdf"},
+    )
+    assert report_resp.status_code == 201
+
+    events = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        page = (await async_client.get("/api/v1/me/timeline", headers=student_headers, params=params)).json()
+        events.extend(page["items"])
+        cursor = page["next_cursor"]
+    assert cursor is None
+    assert [event["kind"] for event in events] == [
+        "REPORT_GENERATED",
+        "CREDIT_AWARDED",
+        "LOGBOOK_COMMENTED",
+        "LOGBOOK_APPROVED",
+        "FACULTY_APPROVED",
+        "INDUSTRY_APPROVED",
+        "APPLIED",
+    ]
+    assert events[-1]["internship_title"] == "Feed Intern"
+    assert events[1]["detail"] == "2"
+    assert events[2]["detail"] == "Nice work"
+    assert events[2]["subject_id"] == entry_id
+
+    bad_cursor = await async_client.get("/api/v1/me/timeline", headers=student_headers, params={"cursor": "nope"})
+    assert bad_cursor.status_code == 400
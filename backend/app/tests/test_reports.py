@@ -1,4 +1,17 @@
+import asyncio
+import csv
+import io
+import zipfile
+from datetime import date, datetime, timedelta
+
 import pytest
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.db import crud, models
+from app.services.report_tokens import ReportClaims, sign_report_token, verify_report_token
+from app.services.reports import generate_report
+from app.tests.conftest import TestSessionLocal
 
 
 async def _register_and_login(async_client, payload):
@@ -215,4 +228,290 @@ async def test_only_faculty_or_admin_can_create_or_update_reports(async_client):
         headers=admin_headers,
         params={"student_id": apply_resp.json()["student_id"], "internship_id": internship_id},
     )
-    assert any(item["id"] == report_id for item in admin_list_filtered.json())
\ No newline at end of file
+    assert any(item["id"] == report_id for item in admin_list_filtered.json())
+
+
+@pytest.mark.asyncio
+async def test_reports_without_pdf_url_are_rendered_in_the_background(async_client):
+    admin_headers = await _register_and_login(
+        async_client,
+        {"name": "Render Admin", "email": "render-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    student_headers = await _register_and_login(
+        async_client,
+        {"name": "Render <Student>", "email": "render-student@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+    internship_id = (
+        await async_client.post(
+            "/api/v1/internships",
+            headers=admin_headers,
+            json={"title": "Rendering Intern", "duration_weeks": 4},
+        )
+    ).json()["id"]
+    application_id = (
+        await async_client.post("/api/v1/applications", headers=student_headers, json={"internship_id": internship_id})
+    ).json()["id"]
+    await async_client.patch(
+        f"/api/v1/applications/{application_id}",
+        headers=admin_headers,
+        json={"industry_status": "APPROVED", "faculty_status": "APPROVED"},
+    )
+    entry_id = (
+        await async_client.post(
+            "/api/v1/logbook-entries",
+            headers=student_headers,
+            json={
+                "application_id": application_id,
+                "entry_date": "2025-10-06",
+                "hours": 8,
+                "description": "Wrote the (first) rendering pipeline",
+            },
+        )
+    ).json()["id"]
+    await async_client.patch(f"/api/v1/logbook-entries/{entry_id}", headers=admin_headers, json={"approved": True})
+
+    create_resp = await async_client.post(
+        "/api/v1/reports", headers=admin_headers, json={"application_id": application_id}
+    )
+    assert create_resp.status_code == 201
+    report = create_resp.json()
+    assert report["status"] == "PENDING"
+    assert report["pdf_url"] is None
+
+    status_resp = await async_client.get(f"/api/v1/reports/{report['id']}/status", headers=student_headers)
+    assert status_resp.status_code == 200
+    assert status_resp.json()["status"] == "READY"
+    assert status_resp.json()["pdf_url"] == f"/api/v1/reports/{report['id']}/pdf"
+
+    pdf_resp = await async_client.get(status_resp.json()["pdf_url"], headers=student_headers)
+    assert pdf_resp.status_code == 200
+    assert pdf_resp.headers["content-type"] == "application/pdf"
+    assert pdf_resp.content.startswith(b"%PDF-")
+    assert b"Render <Student>" in pdf_resp.content
+    assert b"Wrote the \\(first\\) rendering pipeline" in pdf_resp.content
+
+    # A finished report is not claimed again; a claim left by a dead worker is taken over after the timeout
+    assert await generate_report(TestSessionLocal, report["id"]) == "READY"
+    async with TestSessionLocal() as session:
+        stuck = await crud.get_report(session, report["id"])
+        stuck.status, stuck.claimed_at = "RENDERING", datetime.utcnow()
+        await session.commit()
+    assert await generate_report(TestSessionLocal, report["id"]) == "RENDERING"
+    async with TestSessionLocal() as session:
+        stuck = await crud.get_report(session, report["id"])
+        stuck.claimed_at = datetime.utcnow() - timedelta(seconds=settings.REPORT_RENDER_TIMEOUT_SECONDS + 1)
+        await session.commit()
+    assert await generate_report(TestSessionLocal, report["id"]) == "READY"
+
+
+@pytest.mark.asyncio
+async def test_renderer_pool_reuses_started_renderers():
+    from app.services.report_renderer import BasicRenderer, RendererPool
+
+    async def start():
+        return BasicRenderer()
+
+    pool = RendererPool(start, size=2)
+    documents = await asyncio.gather(*(pool.render(f"<p>Report {n}</p>") for n in range(6)))
+    assert pool.started <= 2
+    assert all(document.startswith(b"%PDF-1.4") for document in documents)
+    assert b"(Report 5) Tj" in documents[5]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_cohort_batch_renders_missing_reports_and_streams_a_zip(async_client):
+    admin_headers = await _register_and_login(
+        async_client,
+        {"name": "Batch Admin", "email": "cohort-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    internship_id = (
+        await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": "Cohort Intern"})
+    ).json()["id"]
+    application_ids = []
+    for name in ("Asha Rao", "Bilal Khan", "Chitra Iyer"):
+        student_headers = await _register_and_login(
+            async_client,
+            {
+                "name": name,
+                "email": f"{name.split()[0].lower()}-cohort@example.com",
+                "password": "StudentPass123",
+                "role": "STUDENT",
+            },
+        )
+        application_ids.append(
+            (
+                await async_client.post(
+                    "/api/v1/applications", headers=student_headers, json={"internship_id": internship_id}
+                )
+            ).json()["id"]
+        )
+    for application_id in application_ids[:2]:
+        await async_client.patch(
+            f"/api/v1/applications/{application_id}",
+            headers=admin_headers,
+            json={"industry_status": "APPROVED", "faculty_status": "APPROVED"},
+        )
+    external = await async_client.post(
+        "/api/v1/reports",
+        headers=admin_headers,
+        json={"application_id": application_ids[1], "pdf_url": "https://cdn.example.com/bilal.pdf"},
+    )
+
+    create_resp = await async_client.post(
+        "/api/v1/reports/batches", headers=admin_headers, json={"internship_id": internship_id}
+    )
+    assert create_resp.status_code == 202
+    batch_id = create_resp.json()["id"]
+    assert create_resp.json()["total"] == 2
+
+    progress = (await async_client.get(f"/api/v1/reports/batches/{batch_id}", headers=admin_headers)).json()
+    assert progress["status"] == "READY"
+    assert (progress["ready"], progress["failed"], progress["progress"]) == (2, 0, 1.0)
+    assert progress["download_url"] == f"/api/v1/reports/batches/{batch_id}/download"
+
+    download = await async_client.get(progress["download_url"], headers=admin_headers)
+    assert download.status_code == 200
+    assert download.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(download.content))
+    assert archive.testzip() is None
+    pdf_name = f"Asha-Rao-{application_ids[0][:8]}.pdf"
+    assert archive.namelist() == [pdf_name, "manifest.csv"]
+    assert archive.getinfo(pdf_name).compress_type == zipfile.ZIP_DEFLATED
+    assert archive.read(pdf_name).startswith(b"%PDF-")
+    manifest = list(csv.DictReader(io.StringIO(archive.read("manifest.csv").decode())))
+    assert [row["student"] for row in manifest] == ["Asha Rao", "Bilal Khan"]
+    assert manifest[1]["report_id"] == external.json()["id"]
+    assert manifest[1]["external_url"] == "https://cdn.example.com/bilal.pdf"
+
+    # A report whose renderer died mid-batch is re-rendered when the batch is polled
+    async with TestSessionLocal() as session:
+        stuck = await crud.get_report(session, manifest[0]["report_id"])
+        stuck.status = "RENDERING"
+        stuck.claimed_at = datetime.utcnow() - timedelta(seconds=settings.REPORT_RENDER_TIMEOUT_SECONDS + 1)
+        await session.commit()
+    polled = await async_client.get(f"/api/v1/reports/batches/{batch_id}", headers=admin_headers)
+    assert polled.json()["status"] == "RENDERING"
+    progress = (await async_client.get(f"/api/v1/reports/batches/{batch_id}", headers=admin_headers)).json()
+    assert (progress["status"], progress["ready"]) == ("READY", 2)
+
+    other_student = await _register_and_login(
+        async_client,
+        {"name": "Student Batch", "email": "cohort-student@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+    forbidden = await async_client.get(f"/api/v1/reports/batches/{batch_id}", headers=other_student)
+    assert forbidden.status_code == 403
+
+
+def test_report_tokens_are_compact_and_tamper_evident():
+    claims = ReportClaims(
+        report_id="6f1c1d4e-8f43-4b7a-9d55-3f1e2a7b9c10",
+        student_id="0b5e8a51-2c7d-4e7f-a4d2-9a51f8c3e6b2",
+        student_name="Ánanya Sharma",
+        credits=4,
+        approved_hours=160,
+        issued_on=date(2026, 10, 19),
+    )
+    token = sign_report_token(claims)
+    assert len(token) <= 128
+    assert verify_report_token(token) == claims
+
+    tampered = token[:20] + ("A" if token[20] != "A" else "B") + token[21:]
+    with pytest.raises(ValueError):
+        verify_report_token(tampered)
+    with pytest.raises(ValueError):
+        verify_report_token("c0ffee" * 5)
+
+
+@pytest.mark.asyncio
+async def test_qr_tokens_verify_without_a_lookup_and_can_be_revoked(async_client):
+    admin_headers = await _register_and_login(
+        async_client,
+        {"name": "QR Admin", "email": "qr-admin@example.com", "password": "AdminPass123", "role": "ADMIN"},
+    )
+    student_headers = await _register_and_login(
+        async_client,
+        {"name": "Qamar Ali", "email": "qr-student@example.com", "password": "StudentPass123", "role": "STUDENT"},
+    )
+    internship_id = (
+        await async_client.post("/api/v1/internships", headers=admin_headers, json={"title": "QR Intern"})
+    ).json()["id"]
+    application_id = (
+        await async_client.post("/api/v1/applications", headers=student_headers, json={"internship_id": internship_id})
+    ).json()["id"]
+    await async_client.patch(
+        f"/api/v1/applications/{application_id}",
+        headers=admin_headers,
+        json={"industry_status": "APPROVED", "faculty_status": "APPROVED"},
+    )
+    report = (
+        await async_client.post(
+            "/api/v1/reports",
+            headers=admin_headers,
+            json={"application_id": application_id, "pdf_url": "https://cdn.example.com/qamar.pdf"},
+        )
+    ).json()
+    token = report["qr_code_token"]
+    assert verify_report_token(token).report_id == report["id"]
+
+    verification = (await async_client.get(f"/api/v1/reports/qr/{token}")).json()
+    assert verification["id"] == report["id"]
+    assert verification["student_name"] == "Qamar Ali"
+    assert verification["revoked"] is False
+    assert verification["verify_url"] == f"/api/v1/reports/verify/{token}"
+
+    page = await async_client.get(verification["verify_url"])
+    assert page.status_code == 200
+    assert "Qamar Ali" in page.text and "is valid" in page.text
+    assert page.headers["cache-control"].startswith("public")
+
+    png = await async_client.get(f"/api/v1/reports/verify/{token}/qr.png")
+    assert png.headers["content-type"] == "image/png"
+    assert png.content.startswith(b"\x89PNG")
+    svg = await async_client.get(f"/api/v1/reports/verify/{token}/qr.svg")
+    assert svg.headers["content-type"] == "image/svg+xml"
+    assert b"<svg" in svg.content
+    assert (await async_client.get(f"/api/v1/reports/verify/{token}/qr.gif")).status_code == 422
+
+    revoke = await async_client.post(
+        f"/api/v1/reports/{report['id']}/revoke", headers=student_headers, json={"reason": "Issued in error"}
+    )
+    assert revoke.status_code == 403
+    revoke = await async_client.post(
+        f"/api/v1/reports/{report['id']}/revoke", headers=admin_headers, json={"reason": "Issued in error"}
+    )
+    assert revoke.status_code == 204
+    assert (await async_client.get(f"/api/v1/reports/qr/{token}")).json()["revoked"] is True
+    assert "has been revoked" in (await async_client.get(verification["verify_url"])).text
+
+    # Tokens minted before signing still resolve through the database
+    async with TestSessionLocal() as session:
+        await session.execute(
+            sa.update(models.Report).where(models.Report.id == report["id"]).values(qr_code_token="legacy-qr-token")
+        )
+        await session.commit()
+    legacy = await async_client.get("/api/v1/reports/qr/legacy-qr-token")
+    assert legacy.status_code == 200
+    assert legacy.json()["id"] == report["id"]
+    assert (await async_client.get("/api/v1/reports/qr/not-a-token")).status_code == 404
+
+
+def test_report_templates_compile_once_and_cache_fragments(tmp_path):
+    from app.services.report_templates import ReportTemplates
+
+    templates = ReportTemplates(bytecode_dir=str(tmp_path))
+    assert templates.preload() >= 3
+    assert any(tmp_path.iterdir())
+    assert templates.get("reports/completion.html") is templates.get("reports/completion.html")
+
+    header = templates.fragment("reports/_header.html", college="Govt. College <Pune>")
+    assert templates.fragment("reports/_header.html", college="Govt. College <Pune>") is header
+    assert "Govt. College &lt;Pune&gt;" in header
+    assert 'src="data:image/svg+xml;base64,' in header
+    assert templates.fragment("reports/_header.html", college="Other College") is not header
+
+    with pytest.raises(ValueError):
+        templates.assets.read("../completion.html")
+
+    # A second worker loads the compiled code from the bytecode cache
+    assert ReportTemplates(bytecode_dir=str(tmp_path)).preload() >= 3
@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+import os
+
+import pytest
+
+from app.core.config import settings
+from app.services import uploads
+
+
+async def _student_headers(async_client, email):
+    payload = {"name": "Uploader", "email": email, "password": "StudentPass123", "role": "STUDENT"}
+    register_resp = await async_client.post("/api/v1/auth/register", json=payload)
+    assert register_resp.status_code == 201
+    login_resp = await async_client.post(
+        "/api/v1/auth/login", json={"email": payload["email"], "password": payload["password"]}
+    )
+    assert login_resp.status_code == 200
+    return {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_is_content_addressed(async_client):
+    headers = await _student_headers(async_client, "uploader@example.com")
+    content = os.urandom(300_000)
+    sha256 = hashlib.sha256(content).hexdigest()
+
+    async def start():
+        resp = await async_client.post(
+            "/api/v1/uploads",
+            headers=headers,
+            json={"filename": "report.pdf", "content_type": "application/pdf", "size": len(content)},
+        )
+        assert resp.status_code == 201
+        assert resp.json()["offset"] == 0
+        return resp.json()["id"]
+
+    upload_id = await start()
+    first = await async_client.put(
+        f"/api/v1/uploads/{upload_id}", headers=headers, params={"offset": 0}, content=content[:100_000]
+    )
+    assert first.json()["offset"] == 100_000
+
+    replayed = await async_client.put(
+        f"/api/v1/uploads/{upload_id}", headers=headers, params={"offset": 0}, content=content[:100_000]
+    )
+    assert replayed.status_code == 409
+    resumed_at = (await async_client.get(f"/api/v1/uploads/{upload_id}", headers=headers)).json()["offset"]
+    assert resumed_at == 100_000
+
+    early = await async_client.post(f"/api/v1/uploads/{upload_id}/complete", headers=headers, json={})
+    assert early.status_code == 409
+    overflow = await async_client.put(
+        f"/api/v1/uploads/{upload_id}", headers=headers, params={"offset": resumed_at}, content=content[100_000:] + b"x"
+    )
+    assert overflow.status_code == 413
+    assert uploads.received(upload_id) == 100_000
+
+    await async_client.put(
+        f"/api/v1/uploads/{upload_id}", headers=headers, params={"offset": resumed_at}, content=content[100_000:]
+    )
+    done = await async_client.post(f"/api/v1/uploads/{upload_id}/complete", headers=headers, json={"sha256": sha256})
+    assert done.status_code == 200
+    assert done.json()["sha256"] == sha256
+    assert done.json()["url"] == f"/api/v1/uploads/blobs/{sha256}"
+
+    again = await start()
+    await async_client.put(f"/api/v1/uploads/{again}", headers=headers, params={"offset": 0}, content=content)
+    assert (
+        await async_client.post(f"/api/v1/uploads/{again}/complete", headers=headers, json={})
+    ).json()["sha256"] == sha256
+    assert os.listdir(os.path.join(settings.UPLOAD_DIR, "blobs", sha256[:2])) == [sha256]
+
+    corrupt = await start()
+    await async_client.put(f"/api/v1/uploads/{corrupt}", headers=headers, params={"offset": 0}, content=content[::-1])
+    mismatch = await async_client.post(
+        f"/api/v1/uploads/{corrupt}/complete", headers=headers, json={"sha256": sha256}
+    )
+    assert mismatch.status_code == 422
+    assert uploads.received(corrupt) == 0
+
+    downloaded = await async_client.get(done.json()["url"], headers=headers)
+    assert downloaded.status_code == 200
+    assert downloaded.content == content
+    assert downloaded.headers["etag"] == f'"{sha256}"'
+    partial = await async_client.get(done.json()["url"], headers={**headers, "Range": "bytes=1000-1999"})
+    assert partial.status_code == 206
+    assert partial.content == content[1000:2000]
+    cached = await async_client.get(done.json()["url"], headers={**headers, "If-None-Match": f'"{sha256}"'})
+    assert cached.status_code == 304
+
+    other = await _student_headers(async_client, "other-uploader@example.com")
+    assert (await async_client.get(f"/api/v1/uploads/{upload_id}", headers=other)).status_code == 404
+    assert (await async_client.get(done.json()["url"], headers=other)).status_code == 404
+
+    # A chunk that arrives while another is being written waits, then sees the new offset
+    racing = await start()
+
+    async def one_chunk():
+        yield content[:100_000]
+
+    async with uploads.upload_lock(racing):
+        waiting = asyncio.create_task(
+            async_client.put(f"/api/v1/uploads/{racing}", headers=headers, params={"offset": 0}, content=content[:100_000])
+        )
+        await asyncio.sleep(0.1)
+        assert not waiting.done()
+        await uploads.append_chunk(racing, one_chunk(), limit=len(content))
+    assert (await waiting).status_code == 409
+    assert uploads.received(racing) == 100_000
+
+    too_big = await async_client.post(
+        "/api/v1/uploads",
+        headers=headers,
+        json={"filename": "huge.bin", "size": settings.UPLOAD_MAX_BYTES + 1},
+    )
+    assert too_big.status_code == 413
@@ -0,0 +1,106 @@
+import pytest
+
+from app.tests.conftest import register_active
+
+
+async def _login(async_client, payload):
+    login_resp = await async_client.post(
+        "/api/v1/auth/login",
+        json={"email": payload["email"], "password": payload["password"]},
+    )
+    assert login_resp.status_code == 200
+    tokens = login_resp.json()
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_industry_can_search_students_by_skills_with_facets(async_client):
+    _, admin_headers = await register_active(
+        async_client,
+        {
+            "name": "Search Admin",
+            "email": "search-admin@example.com",
+            "password": "AdminPass123",
+            "role": "ADMIN",
+        },
+    )
+    _, industry_headers = await register_active(
+        async_client,
+        {
+            "name": "Talent Scout",
+            "email": "search-industry@example.com",
+            "password": "ScoutPass123",
+            "role": "INDUSTRY",
+        },
+        admin_headers,
+    )
+
+    students = [
+        ("Zed Search", "search-zed@example.com", "B.Tech", ["Python", "SQL"]),
+        ("Amy Search", "search-amy@example.com", "B.Tech", ["python", "React"]),
+        ("Bob Search", "search-bob@example.com", "MCA", ["Python", "sql", "Docker"]),
+    ]
+    for name, email, course, skills in students:
+        resp = await async_client.post(
+            "/api/v1/auth/register",
+            json={
+                "name": name,
+                "email": email,
+                "password": "StudentPass123",
+                "role": "STUDENT",
+                "student_profile": {"college": "Search College", "course": course, "skills": skills},
+            },
+        )
+        assert resp.status_code == 201
+
+    first_page = await async_client.get(
+        "/api/v1/users/search",
+        headers=industry_headers,
+        params={"skills": ["PYTHON", "sql"], "college": "Search College", "limit": 1},
+    )
+    assert first_page.status_code == 200
+    page = first_page.json()
+    assert [item["name"] for item in page["items"]] == ["Bob Search"]
+    assert page["next_cursor"]
+    assert {"value": "B.Tech", "count": 1} in page["facets"]["course"]
+    assert {"value": "MCA", "count": 1} in page["facets"]["course"]
+    assert {"value": "python", "count": 2} in page["facets"]["skills"]
+
+    second_page = await async_client.get(
+        "/api/v1/users/search",
+        headers=industry_headers,
+        params={
+            "skills": ["PYTHON", "sql"],
+            "college": "Search College",
+            "limit": 1,
+            "cursor": page["next_cursor"],
+        },
+    )
+    assert second_page.status_code == 200
+    page = second_page.json()
+    assert [item["name"] for item in page["items"]] == ["Zed Search"]
+    assert page["next_cursor"] is None
+    assert page["facets"] is None
+
+    bad_cursor = await async_client.get(
+        "/api/v1/users/search", headers=industry_headers, params={"cursor": "not-a-cursor"}
+    )
+    assert bad_cursor.status_code == 400
+
+    student_headers = await _login(
+        async_client, {"email": "search-amy@example.com", "password": "StudentPass123"}
+    )
+    update_resp = await async_client.patch(
+        "/api/v1/users/me", headers=student_headers, json={"profile": {"skills": ["Python", "SQL"]}}
+    )
+    assert update_resp.status_code == 200
+
+    refreshed = await async_client.get(
+        "/api/v1/users/search",
+        headers=industry_headers,
+        params={"skills": ["python", "sql"], "college": "Search College"},
+    )
+    assert [item["name"] for item in refreshed.json()["items"]] == ["Amy Search", "Bob Search", "Zed Search"]
+
+    forbidden = await async_client.get("/api/v1/users/search", headers=student_headers)
+    assert forbidden.status_code == 403
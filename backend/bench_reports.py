@@ -0,0 +1,115 @@
+"""Benchmark report rendering throughput on a single core.
+
+Renders synthetic completion reports (no database) and prints reports per
+second for:
+
+* ``uncached``  - a fresh jinja2 environment per report: templates re-parsed,
+  assets re-read and the college header re-rendered every time;
+* ``registry``  - the shared ReportTemplates registry (compiled templates,
+  inlined assets, cached header fragments);
+* ``registry+pdf`` - the registry plus conversion with the basic PDF renderer,
+  i.e. the whole pipeline a worker runs apart from the database and storage.
+
+It also times a cold worker start (compile everything) with an empty and with
+a warm bytecode cache. Everything runs in this one process, so the numbers are
+per core::
+
+    python bench_reports.py --reports 500 --colleges 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from app.services.report_renderer import html_to_lines, text_pdf
+from app.services.report_templates import ReportTemplates
+from app.services.reports import COMPLETION_TEMPLATE, HEADER_TEMPLATE
+
+
+def build_contexts(count: int, colleges: int, entries: int) -> List[Dict[str, Any]]:
+    contexts = []
+    for n in range(count):
+        start = date(2026, 6, 1)
+        contexts.append(
+            {
+                "student": {
+                    "name": f"Student {n}",
+                    "email": f"student{n}@example.com",
+                    "college": f"College of Engineering {n % colleges}",
+                    "college_id": str(n % colleges),
+                    "enrollment_no": f"EN{n:06d}",
+                },
+                "internship": {
+                    "title": "Backend Engineering Intern",
+                    "organisation": "Example Systems Pvt Ltd",
+                    "start_date": start,
+                    "duration_weeks": 8,
+                },
+                "hours": {"total": entries * 6.0, "approved": entries * 6.0, "required": 320.0},
+                "credits": 4,
+                "entries": [
+                    {
+                        "entry_date": start + timedelta(days=day),
+                        "hours": 6.0,
+                        "description": f"Day {day}: implemented and reviewed API changes for the tracking module",
+                    }
+                    for day in range(entries)
+                ],
+                "report_id": str(uuid.uuid4()),
+                "generated_at": datetime.utcnow(),
+                "verify_path": "/api/v1/reports/verify/token",
+            }
+        )
+    return contexts
+
+
+def render_with(templates: ReportTemplates, context: Dict[str, Any]) -> str:
+    header = templates.fragment(HEADER_TEMPLATE, college=context["student"]["college"])
+    return templates.render(COMPLETION_TEMPLATE, header=header, **context)
+
+
+def render_uncached(context: Dict[str, Any]) -> str:
+    with tempfile.TemporaryDirectory() as empty_cache:
+        return render_with(ReportTemplates(bytecode_dir=empty_cache), context)
+
+
+def measure(label: str, contexts: List[Dict[str, Any]], render: Callable[[Dict[str, Any]], Any]) -> None:
+    started = time.perf_counter()
+    for context in contexts:
+        render(context)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<14} {len(contexts) / elapsed:10.1f} reports/s/core  ({elapsed * 1000 / len(contexts):.2f} ms each)")
+
+
+def measure_start(label: str, bytecode_dir: str) -> None:
+    started = time.perf_counter()
+    ReportTemplates(bytecode_dir=bytecode_dir).preload()
+    print(f"{label:<14} {(time.perf_counter() - started) * 1000:10.1f} ms to compile templates and load assets")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure report rendering throughput on one core")
+    parser.add_argument("--reports", type=int, default=300, help="Reports to render per scenario")
+    parser.add_argument("--colleges", type=int, default=8, help="Distinct colleges (header fragments)")
+    parser.add_argument("--entries", type=int, default=40, help="Approved logbook entries per report")
+    args = parser.parse_args()
+    contexts = build_contexts(args.reports, args.colleges, args.entries)
+
+    with tempfile.TemporaryDirectory() as bytecode_dir:
+        measure_start("cold start", bytecode_dir)
+        measure_start("warm start", bytecode_dir)
+
+        templates = ReportTemplates(bytecode_dir=bytecode_dir)
+        templates.preload()
+        measure("uncached", contexts[: max(1, len(contexts) // 10)], render_uncached)
+        measure("registry", contexts, lambda context: render_with(templates, context))
+        measure("registry+pdf", contexts, lambda context: text_pdf(html_to_lines(render_with(templates, context))))
+
+
+if __name__ == "__main__":
+    main()
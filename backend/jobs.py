@@ -0,0 +1,107 @@
+"""Maintenance jobs for the Prashikshan backend.
+
+Each job is a subcommand, for example::
+
+    python jobs.py rebuild-similarity
+    python jobs.py refresh-snapshots --full
+
+Jobs that keep derived tables fresh (``refresh-snapshots``) are meant to be run
+periodically from cron or a scheduler.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+
+from app.db import crud
+from app.db.session import AsyncSessionLocal
+from app.services import uploads
+from app.services.reports import generate_reports, stale_claim_cutoff
+from app.services.report_renderer import get_renderer_pool
+
+
+async def batch_analytics() -> None:
+    async with AsyncSessionLocal() as session:
+        count = await crud.run_college_analytics(session)
+    print(f"Summarized {count} enrolled application(s) into analytics_college_summaries.")
+
+
+async def purge_uploads() -> None:
+    async with AsyncSessionLocal() as session:
+        upload_ids = await crud.delete_stale_upload_sessions(session, datetime.utcnow() - timedelta(days=1))
+    for upload_id in upload_ids:
+        await uploads.discard(upload_id)
+    print(f"Discarded {len(upload_ids)} unfinished upload(s) older than a day.")
+
+
+async def render_reports() -> None:
+    async with AsyncSessionLocal() as session:
+        requeued = await crud.requeue_stale_reports(session, stale_claim_cutoff())
+        report_ids = await crud.list_pending_report_ids(session)
+    if requeued:
+        print(f"Re-queued {len(requeued)} report(s) left RENDERING by a stopped worker.")
+    try:
+        counts = await generate_reports(AsyncSessionLocal, report_ids)
+    finally:
+        await get_renderer_pool().close()
+    summary = ", ".join(f"{count} {status.lower()}" for status, count in sorted(counts.items())) or "nothing queued"
+    print(f"Rendered {len(report_ids)} pending report(s): {summary}.")
+
+
+async def rebuild_similarity() -> None:
+    async with AsyncSessionLocal() as session:
+        count = await crud.rebuild_internship_similarity(session)
+    print(f"Indexed {count} internship(s) for similarity lookups.")
+
+
+async def reconcile_progress() -> None:
+    async with AsyncSessionLocal() as session:
+        count = await crud.rebuild_application_progress(session)
+    print(f"Rebuilt progress counters for {count} application(s).")
+
+
+async def reconcile_credits() -> None:
+    async with AsyncSessionLocal() as session:
+        count = await crud.reconcile_credit_ledger(session)
+    print(f"Rebuilt credit totals; adjusted the ledger of {count} student(s).")
+
+
+async def refresh_snapshots(full: bool = False) -> None:
+    async with AsyncSessionLocal() as session:
+        count = await crud.refresh_funnel_snapshots(session, full=full)
+    print(f"Refreshed funnel snapshots for {count} internship(s).")
+
+
+JOBS = {
+    "batch-analytics": (batch_analytics, "Recompute per-college tracking and hours summaries with NumPy"),
+    "purge-uploads": (purge_uploads, "Delete unfinished uploads older than a day and their part files"),
+    "render-reports": (render_reports, "Render queued completion reports to PDF"),
+    "rebuild-similarity": (rebuild_similarity, "Recompute MinHash signatures and the internship neighbour table"),
+    "reconcile-progress": (reconcile_progress, "Rebuild application_progress counters from logbook entries"),
+    "reconcile-credits": (reconcile_credits, "Backfill credit terms and rebuild per-term credit totals"),
+    "refresh-snapshots": (refresh_snapshots, "Refresh analytics funnel snapshots changed since the last run"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run a Prashikshan maintenance job")
+    subparsers = parser.add_subparsers(dest="job", required=True)
+    for name, (_, help_text) in JOBS.items():
+        subparsers.add_parser(name, help=help_text)
+    subparsers.choices["refresh-snapshots"].add_argument(
+        "--full", action="store_true", help="Rebuild every snapshot instead of only changed internships"
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    job, _ = JOBS[args.job]
+    options = {key: value for key, value in vars(args).items() if key != "job"}
+    asyncio.run(job(**options))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from app.core.security import get_password_hash
-from app.db import models
+from app.db import crud, models
 from app.db.session import AsyncSessionLocal
 
 
@@ -108,9 +108,11 @@ async def upsert_internship(session, *, title: str, posted_by: str, **fields):
     if internship is None:
         internship = models.Internship(title=title, posted_by=posted_by, **fields)
         session.add(internship)
+        await session.flush()
     else:
         for field, value in fields.items():
             setattr(internship, field, value)
+    await crud.set_internship_skills(session, internship)
     await session.commit()
     await session.refresh(internship)
     return internship